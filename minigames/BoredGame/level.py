@@ -4,18 +4,24 @@ from pygame.sprite import AbstractGroup
 from settings import *
 from player import Player
 from overlay import Overlay
-from sprites import Ordinary,waterSprite,natFlower,Tree,Interactions
-from pytmx.util_pygame import load_pygame
+from sprites import Interactions,Animation
+from mapcache import loadMap
 from helpful import *
 from transition import Transition
 from soil import SoilLayer
+from world import World
+from scheduler import Scheduler
+from particles import ParticlePool, Rain
+from savegame import Autosaver, snapshot, readSave, applySteps
+from random import random
 
 class Level:
-    def __init__(self):
+    def __init__(self, num_players=1):
 
 
         # Gets the display
         self.displaySurface = pygame.display.get_surface()
+        self.num_players = max(1, min(num_players, len(PLAYER_SPAWN_OFFSETS)))
 
         # Sprite Groups
         self.allSprites = Camera()
@@ -27,31 +33,129 @@ class Level:
         # Iteraction sprites
         self.interactionSprites = pygame.sprite.Group()
 
-        
-        self.soilLayer = SoilLayer(self.allSprites)
+        # Only these get update(dt), every other sprite in allSprites is static
+        # Animations shared by many tiles (water), each advanced once per frame
+        self.animations = []
+        # Awake Sprites: woken by an event (a tree being hit) and updated once
+        self.awakeSprites = pygame.sprite.Group()
+
+        # Game time events (plant growth, tool timers)
+        self.scheduler = Scheduler()
+
+        # Tree flashes and rain, drawn by the camera between the sprite layers
+        self.particles = ParticlePool()
+        self.rain = Rain(self.particles)
+        self.raining = False
+        # Set once someone wins, so the save isn't resumed as a game that is already over
+        self.finished = False
+
+        # Loads the map data created using tiled (from the compiled cache, shared with the soil layer)
+        self.mapData = loadMap('./map/map.tmx')
+
+        self.soilLayer = SoilLayer(self.allSprites, self.scheduler, self.mapData)
 
         self.setup()
-        self.overlay = Overlay(self.player)
-        self.transition = Transition(self.resetDay,self.player)
+        # Player 1 is the keyboard/mouse player, the rest play through mobile controls
+        self.player = self.players[0]
+        self.overlays = [Overlay(player) for player in self.players]
+        self.overlay = self.overlays[0]
+        for overlay in self.overlays:
+            overlay.onSave = self.saveGame
+        self.layoutViewports()
+        self.transition = Transition(self.resetDay,self.players)
         self.near_merchant = False
         self.merchant_sprite = None
+
+        # Saves are written on a worker thread, loads are applied a step per frame
+        self.autosaver = Autosaver()
+        self.loadSteps = None
+        self.scheduler.schedule(AUTOSAVE_INTERVAL, self.autosave)
         
 
+    def layoutViewports(self):
+        # One viewport per player, all drawing the same world
+        self.screenSize = self.displaySurface.get_size()
+        self.viewports = []
+        for player, overlay, rect in zip(self.players, self.overlays, viewportRects(self.num_players, self.screenSize)):
+            viewport = Viewport(player, overlay, self.displaySurface.subsurface(rect), rect)
+            # Each overlay draws its HUD inside its own viewport
+            overlay.displaySurface = viewport.surface
+            self.viewports.append(viewport)
+        # The camera offset used for mouse input belongs to player 1
+        self.allSprites.offset = self.viewports[0].offset
+
+    def saveGame(self):
+        # A half applied load would overwrite the save with a half restored level
+        self.finishLoad()
+        # Only the snapshot happens here, packing and writing are done by the autosaver thread
+        return self.autosaver.save(snapshot(self))
+
+    def autosave(self):
+        self.saveGame()
+        self.scheduler.schedule(AUTOSAVE_INTERVAL, self.autosave)
+
+    def loadGame(self, path = SAVE_PATH):
+        """Starts resuming the save at path, returns False if there is nothing to resume."""
+        state = readSave(path)
+        if state is None or state.finished:
+            return False
+        if len(state.players) != len(self.players):
+            print(f"Warning: Save is for {len(state.players)} players, not resuming")
+            return False
+        self.loadSteps = applySteps(self, state)
+        return True
+
+    def finishLoad(self):
+        """Applies whatever is left of a save being loaded in one go."""
+        if self.loadSteps is not None:
+            for _ in self.loadSteps:
+                pass
+            self.loadSteps = None
+
     def run(self,dt):
+        # Apply the next part of a save being loaded
+        if self.loadSteps is not None:
+            try:
+                next(self.loadSteps)
+            except StopIteration:
+                self.loadSteps = None
+
+        # Rebuild the viewports if the window changed size (fullscreen toggle)
+        if self.displaySurface.get_size() != self.screenSize:
+            self.layoutViewports()
+
         self.displaySurface.fill('black')
-        self.allSprites.newDraw(self.player)
+        for viewport in self.viewports:
+            viewport.follow()
+        # Stream in the chunks around every view before anything is drawn
+        views = [viewport.view() for viewport in self.viewports]
+        self.world.update(views)
+
+        # Sort once, then every viewport draws only what it can see
+        self.allSprites.sortSprites()
+        for viewport in self.viewports:
+            self.allSprites.drawView(viewport.surface, viewport.offset, self.particles)
         
         # Check for victory and freeze gameplay
         if not self.overlay.victory_active:
-            # Update sprites with camera offset only for player
-            for sprite in self.allSprites:
-                if isinstance(sprite, Player):
-                    sprite.update(dt, self.allSprites.offset)
-                else:
-                    sprite.update(dt)
+            # Update players, camera offset only for player 1 (mouse aiming)
+            self.player.update(dt, self.allSprites.offset)
+            for player in self.players[1:]:
+                player.update(dt)
+            for animation in self.animations:
+                animation.update(dt)
+            # Woken sprites go back to sleep after this update unless something wakes them again
+            awake = self.awakeSprites.sprites()
+            self.awakeSprites.empty()
+            for sprite in awake:
+                sprite.update(dt)
             
-            # Update plant growth
-            self.soilLayer.updatePlants(dt)
+            # Fire any scheduled events that are due (plant growth, tool timers)
+            self.scheduler.update(dt)
+
+            self.particles.update(dt)
+            if self.raining:
+                self.rain.update(dt, views)
 
         # Check bed interaction (disabled)
         if False:
@@ -64,134 +168,84 @@ class Level:
         
         # Check merchant interaction
         if not self.overlay.victory_active:
-            merchant_sprite = None
-            for interaction in self.interactionSprites:
-                if interaction.name == 'Trader' and interaction.rect.colliderect(self.player.rect.inflate(128, 128)):
-                    # Player is near merchant, can open menu with E
-                    self.near_merchant = True
-                    self.merchant_sprite = interaction
-                    break
-            else:
-                self.near_merchant = False
-                self.merchant_sprite = None
-                if self.overlay.merchant_open:
-                    self.overlay.merchant_open = False
+            for viewport in self.viewports:
+                for interaction in self.interactionSprites:
+                    if interaction.name == 'Trader' and interaction.rect.colliderect(viewport.player.rect.inflate(128, 128)):
+                        # Player is near merchant, can open menu with E
+                        viewport.near_merchant = True
+                        viewport.merchant_sprite = interaction
+                        break
+                else:
+                    viewport.near_merchant = False
+                    viewport.merchant_sprite = None
+                    if viewport.overlay.merchant_open:
+                        viewport.overlay.merchant_open = False
+            self.near_merchant = self.viewports[0].near_merchant
+            self.merchant_sprite = self.viewports[0].merchant_sprite
 
         # Draw hover indicator only for farming tools (shows where action will occur)
         # Still show hover for visual feedback, but action happens on button press
-        if self.player.selectedTool in ['hoe', 'axe', 'water'] or hasattr(self.player, 'selectedSeed'):
-            mouse_pos = pygame.mouse.get_pos()
+        mouse_pos = pygame.mouse.get_pos()
+        if (self.player.selectedTool in ['hoe', 'axe', 'water'] or hasattr(self.player, 'selectedSeed')) and self.viewports[0].rect.collidepoint(mouse_pos):
             world_mouse_pos = (mouse_pos[0] + self.allSprites.offset.x, 
                               mouse_pos[1] + self.allSprites.offset.y)
             # Update hitLocation based on hover (for button press targeting)
             if self.player.isWithinReach(world_mouse_pos):
                 self.player.hitLocation = world_mouse_pos
-            self.soilLayer.drawHover(self.displaySurface, world_mouse_pos, self.allSprites.offset, self.player.rect.center)
-        
-        # Draw coin indicator above merchant when near
-        if self.near_merchant and self.merchant_sprite:
-            merchant_screen_x = self.merchant_sprite.rect.centerx - self.allSprites.offset.x
-            merchant_screen_y = self.merchant_sprite.rect.top - self.allSprites.offset.y - 40
-            coin_icon = self.overlay.coin_icon
-            coin_rect = coin_icon.get_rect(center=(merchant_screen_x, merchant_screen_y))
-            self.displaySurface.blit(coin_icon, coin_rect)
+            self.soilLayer.drawHover(self.viewports[0].surface, world_mouse_pos, self.allSprites.offset, self.player.rect.center)
         
-        # Draw emote above player
-        if self.overlay.current_emote:
-            player_screen_x = self.player.rect.centerx - self.allSprites.offset.x
-            player_screen_y = self.player.rect.top - self.allSprites.offset.y - 10
-            
-            # Draw emote_back first
-            back_rect = self.overlay.emote_back.get_rect(center=(player_screen_x, player_screen_y))
-            self.displaySurface.blit(self.overlay.emote_back, back_rect)
+        for viewport in self.viewports:
+            surface = viewport.surface
+            offset = viewport.offset
+
+            # Draw coin indicator above merchant when near
+            if viewport.near_merchant and viewport.merchant_sprite:
+                merchant_screen_x = viewport.merchant_sprite.rect.centerx - offset.x
+                merchant_screen_y = viewport.merchant_sprite.rect.top - offset.y - 40
+                coin_icon = viewport.overlay.coin_icon
+                coin_rect = coin_icon.get_rect(center=(merchant_screen_x, merchant_screen_y))
+                surface.blit(coin_icon, coin_rect)
             
-            # Extract 50x50 emote from scaled sheet, then scale up 25% (multiply by 1.25)
-            emote_surf = pygame.Surface((50, 50), pygame.SRCALPHA)
-            scaled_x = self.overlay.current_emote[0] // 2
-            scaled_y = self.overlay.current_emote[1] // 2
-            emote_surf.blit(self.overlay.emote_sheet, (0, 0), (scaled_x, scaled_y, 50, 50))
-            # Scale up 25%
-            emote_scaled = pygame.transform.scale(emote_surf, (int(50 * 1.25), int(50 * 1.25)))
-            emote_rect = emote_scaled.get_rect(center=(player_screen_x, player_screen_y))
-            self.displaySurface.blit(emote_scaled, emote_rect)
-
-        self.overlay.updateDisplay(self.allSprites.offset)
-        if self.player.sleep:
+            # Draw every player's emote so the others can see it too
+            for other in self.viewports:
+                if other.overlay.current_emote is not None:
+                    self.drawEmote(surface, offset, other.player, other.overlay)
+
+            viewport.overlay.updateDisplay(offset)
+
+        if any(player.sleep for player in self.players):
             self.transition.play()
+
+    def drawEmote(self, surface, offset, player, overlay):
+        # Draw emote above player, background and emote are pre-composed into one frame
+        frame = overlay.emote_frames[overlay.current_emote]
+        player_screen_x = int(player.rect.centerx - offset.x)
+        player_screen_y = int(player.rect.top - offset.y - 10)
+        surface.blit(frame, (player_screen_x - frame.get_width() // 2, player_screen_y - frame.get_height() // 2))
             
 
     def setup(self):
 
         
-        # Loads the map data created using tiled
-        mapData = load_pygame('./map/map.tmx')
+        mapData = self.mapData
         
 
 
-        #taking the data from the map from the house furniture bottom
-        for mapLayer in ['HouseFloor','HouseFurnitureBottom']:
-            for x, y, surface in mapData.get_layer_by_name(mapLayer).tiles():
-                # Creating a genric sprite
-                # multiply by tile size so that you convert correctly from tiled
-                Ordinary((x * TILE_SIZE,y * TILE_SIZE), surface, self.allSprites,LAYERS['house bottom'])
-        # data for the house
-        for mapLayer in ['HouseWalls','HouseFurnitureTop']:
-            for x, y, surface in mapData.get_layer_by_name(mapLayer).tiles():
-                # Creating a genric sprite
-                # multiply by tile size so that you convert correctly from tiled
-                Ordinary((x * TILE_SIZE,y * TILE_SIZE), surface, self.allSprites,LAYERS['main'])
-        # Fence Sprite : Main Layer
-        for x,y, surface in mapData.get_layer_by_name("Fence").tiles():
-            Ordinary((x * TILE_SIZE,y * TILE_SIZE), surface, [self.allSprites, self.collisionSprites],LAYERS['main'])
-
-        # Water Sprite : Water Layer
-        waterFrames = importFolder('./graphics/water')
-        for x,y, surface in mapData.get_layer_by_name("Water").tiles():
-            waterSprite((x * TILE_SIZE, y * TILE_SIZE), waterFrames,self.allSprites)
-
-
-        # Natrual Flowers : Main Layer
-        for flower in mapData.get_layer_by_name("Decoration"):
-            # Dont need to multiply as these are not tiles and therefore have pixel measurements
-            natFlower((flower.x, flower.y),flower.image,[self.allSprites,self.collisionSprites])
-
-
-        # Trees : Main Layer (filter out trees too close to edges and walkway area)
-        for tree in mapData.get_layer_by_name("Trees"):
-            # Skip trees too close to edges (within 200px of any edge)
-            # Skip trees in the walkway-enclosed area (approximate bounds)
-            map_width = mapData.width * TILE_SIZE
-            map_height = mapData.height * TILE_SIZE
-            
-            # Edge filtering: 200px margin from all edges
-            if (tree.x < 200 or tree.x > map_width - 200 or 
-                tree.y < 200 or tree.y > map_height - 200):
-                continue
-            
-            # Walkway area filtering (approximate center area enclosed by walkway)
-            # Adjust these bounds based on your map's walkway layout
-            # This is a rough approximation - adjust as needed
-            walkway_left = 400
-            walkway_right = 1200
-            walkway_top = 300
-            walkway_bottom = 900
-            
-            if (tree.x > walkway_left and tree.x < walkway_right and
-                tree.y > walkway_top and tree.y < walkway_bottom):
-                continue
-            
-            # Create tree if it passes all filters
-            Tree((tree.x, tree.y),tree.image,[self.allSprites,self.collisionSprites,self.treeSprites], tree.name,self.addToInventory)
+        # Water animation shared by every water tile
+        waterAnimation = Animation(importFolder('./graphics/water'))
+        self.animations.append(waterAnimation)
 
-        # Collision Tiles from Tiled / Base Level Collision
-        for x,y, surface in mapData.get_layer_by_name("Collision").tiles():
-            Ordinary((x * TILE_SIZE,y * TILE_SIZE), pygame.Surface((TILE_SIZE,TILE_SIZE)), self.collisionSprites)
+        # Tiles, flowers, trees and collision are built chunk by chunk around the viewports
+        self.world = World(mapData, self.allSprites, self.collisionSprites, self.treeSprites, self.awakeSprites, waterAnimation, self.particles, self.addToInventory)
 
         # Player starts
+        self.players = []
         for playerItems in mapData.get_layer_by_name("Player"):
-            # Sets spawn point
+            # Sets spawn point, players are spread around it so they dont start on top of each other
             if playerItems.name == "Start":
-                self.player = Player((playerItems.x,playerItems.y), self.allSprites, self.collisionSprites, self.treeSprites, self.interactionSprites, self.soilLayer, 1)
+                for i in range(self.num_players):
+                    spawn = (playerItems.x + PLAYER_SPAWN_OFFSETS[i][0], playerItems.y + PLAYER_SPAWN_OFFSETS[i][1])
+                    self.players.append(Player(spawn, self.allSprites, self.collisionSprites, self.treeSprites, self.interactionSprites, self.soilLayer, i + 1, self.scheduler))
             # Creates the interaction location for the bed
             if playerItems.name == 'Bed':
                 Interactions((playerItems.x,playerItems.y), (playerItems.width, playerItems.height), self.interactionSprites, 'Bed')
@@ -201,27 +255,59 @@ class Level:
                 
 
 
-        # Creating the ground sprite
-        Ordinary(
-            pos = (0,0),
-            surface = pygame.image.load('./graphics/ground/ground.png').convert_alpha(),
-            groups= self.allSprites,
-            z = LAYERS['ground']
-        )
-
-    def addToInventory(self,item):
-        self.player.itemInventory[item] += 1
+    def addToInventory(self,item,player=None):
+        # Credit whoever hit the tree, player 1 if nobody did
+        (player or self.player).itemInventory[item] += 1
 
     def resetDay(self):
-
+        # New weather every day
+        self.raining = random() < RAIN_CHANCE
+        if not self.raining:
+            self.particles.clear()
 
         # Reset apples
-        for tree in self.treeSprites:
+        for tree in self.world.trees():
             for apple in tree.appleSprites.sprites():
                 apple.kill()
             tree.createApples()
 
+        self.saveGame()
+
     
+def viewportRects(count, size):
+    """Split the screen into one rect per player: full screen, side by side, or 2x2."""
+    width, height = size
+    if count == 1:
+        return [pygame.Rect(0, 0, width, height)]
+    if count == 2:
+        return [pygame.Rect(0, 0, width // 2, height), pygame.Rect(width // 2, 0, width - width // 2, height)]
+    halfWidth, halfHeight = width // 2, height // 2
+    quads = [pygame.Rect(0, 0, halfWidth, halfHeight), pygame.Rect(halfWidth, 0, width - halfWidth, halfHeight),
+             pygame.Rect(0, halfHeight, halfWidth, height - halfHeight), pygame.Rect(halfWidth, halfHeight, width - halfWidth, height - halfHeight)]
+    return quads[:count]
+
+
+class Viewport:
+    def __init__(self, player, overlay, surface, rect):
+        self.player = player
+        self.overlay = overlay
+        # Subsurface of the display, anything drawn to it is clipped to this players part of the screen
+        self.surface = surface
+        self.rect = rect
+        self.offset = pygame.math.Vector2()
+        self.near_merchant = False
+        self.merchant_sprite = None
+
+    def follow(self):
+        # Keep the player centered in their own viewport
+        self.offset.x = self.player.rect.centerx - self.rect.width // 2
+        self.offset.y = self.player.rect.centery - self.rect.height // 2
+
+    def view(self):
+        # The part of the world this viewport shows
+        return pygame.Rect(int(self.offset.x), int(self.offset.y), self.rect.width, self.rect.height)
+
+
 # A new class that will handle some of the things that pygame.sprite controls
 class Camera(pygame.sprite.Group):
     def __init__(self):
@@ -229,19 +315,35 @@ class Camera(pygame.sprite.Group):
         self.displaySurface = pygame.display.get_surface()
         # Used for making the 3d camera effect, moving around the screen 
         self.offset = pygame.math.Vector2()
+        self.drawOrder = []
+        self.drawRects = []
+
+    def sortSprites(self):
+        # Sort by layer, then by the center of a sprite so that the player will appear behind flowers/trees aka faking more 3-d
+        # Done once per frame and shared by every viewport
+        self.drawOrder = sorted(self.sprites(), key = lambda sprite: (sprite.z, sprite.rect.centery))
+        self.drawRects = [sprite.rect for sprite in self.drawOrder]
+
+    def drawView(self, surface, offset, particles = None):
+        # Only draw the sprites that overlap this view of the world
+        offsetX, offsetY = int(offset.x), int(offset.y)
+        view = pygame.Rect(offsetX, offsetY, surface.get_width(), surface.get_height())
+        drawOrder = self.drawOrder
+        visible = view.collidelistall(self.drawRects)
+        layers = particles.activeLayers() if particles else []
+        if not layers:
+            surface.blits([(drawOrder[i].image, drawOrder[i].rect.move(-offsetX, -offsetY)) for i in visible], False)
+            return
 
-    def newDraw(self,player):
-        # This is for setting the offset for the camera
-        # What this does is ensure all the sprites in the game such as the ground are drawn relative to the player
-        self.offset.x = player.rect.centerx - SCREEN_WIDTH / 2
-        self.offset.y = player.rect.centery - SCREEN_HEIGHT / 2
-        # Creates a for loop to itterate through all of the layer values
-        for layers in LAYERS.values():
-            # For loop to itterate through all of the sprites, sorts the sprite using the center of a sprite as the sorting key, this is so that the player will appear behind flowers/trees aka faking more 3-d
-            for sprite in sorted(self.sprites(), key = lambda sprite: sprite.rect.centery):
-                    # if the spirtes z value is equivalent to the current layer then get that sprites location and subtract the offset from it to move it relative to the player and then draw it
-                    if sprite.z == layers:
-                        offsetRect = sprite.rect.copy()
-                        offsetRect.center -= self.offset
-                        # Actually draw the sprite
-                        self.displaySurface.blit(sprite.image, offsetRect)
\ No newline at end of file
+        # Particles of a layer go on top of the sprites in that layer
+        blits = []
+        for i in visible:
+            sprite = drawOrder[i]
+            while layers and sprite.z > layers[0]:
+                surface.blits(blits, False)
+                blits = []
+                particles.draw(surface, offset, layers.pop(0))
+            blits.append((sprite.image, sprite.rect.move(-offsetX, -offsetY)))
+        surface.blits(blits, False)
+        for z in layers:
+            particles.draw(surface, offset, z)
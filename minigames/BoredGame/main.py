@@ -6,6 +6,7 @@ import pygame
 import sys
 import os
 from settings import *
+from textcache import textCache
 from level import Level
 from start_menu import StartMenu
 
@@ -50,8 +51,8 @@ class Game:
         self.clock = pygame.time.Clock()
         # Sets the caption for the game
         pygame.display.set_caption("Bored Game - Stardew Valley Style")
-        # Creates a level class inside our game
-        self.level = Level()
+        # Level is created once the start menu has picked the number of players
+        self.level = None
         
         # GameJam integration
         self.args = args
@@ -60,11 +61,44 @@ class Game:
         self.menu_section = None  # Track which menu section is open
         
         # Track previous mobile control states for edge detection
-        self.prev_mobile_inventory_prev = False
-        self.prev_mobile_inventory_next = False
+        self.prev_mobile_inventory_prev = {}
+        self.prev_mobile_inventory_next = {}
         
         random.seed(args.seed)
 
+    def scrollInventory(self, player, overlay, step):
+        """Move the selected inventory slot by step, skipping empty/locked slots."""
+        # Clear eat prompt when scrolling
+        overlay.eat_prompt_item = None
+        # Skip empty slots
+        for _ in range(len(overlay.inventory_order)):
+            overlay.selected_index = (overlay.selected_index + step) % len(overlay.inventory_order)
+            item_key = overlay.inventory_order[overlay.selected_index]
+            # Check if slot should be shown
+            if item_key == 'axe' and not player.axe_unlocked:
+                continue
+            if item_key == 'tomato_seeds' and not player.tomato_unlocked:
+                continue
+            if item_key in ['hoe', 'axe', 'water', 'hand', 'corn_seeds', 'tomato_seeds']:
+                break
+            if player.itemInventory.get(item_key, 0) > 0:
+                break
+        # Update player selection based on item type
+        if item_key in ['hoe', 'axe', 'water', 'hand']:
+            if item_key in player.tools:
+                player.selectedTool = item_key
+                player.toolNum = player.tools.index(item_key)
+        elif item_key in ['corn_seeds', 'tomato_seeds']:
+            seed_name = item_key.replace('_seeds', '')
+            player.selectedSeed = seed_name
+            player.seedNum = player.seeds.index(seed_name)
+
+    def triggerVictory(self, winner):
+        self.level.finished = True
+        # Every viewport shows the same winner
+        for overlay in self.level.overlays:
+            overlay.triggerVictory(winner, self.scores[winner.player_id - 1])
+
     def run(self):
         # Show start menu first
         menu = StartMenu(self.screen)
@@ -80,6 +114,11 @@ class Game:
         
         # Update args with selected number of players
         self.args.players = menu.num_players
+        # Creates a level class inside our game, one viewport per player
+        self.level = Level(self.args.players)
+        # Pick up where the last session left off (runner time cap, crash)
+        if not self.args.fresh:
+            self.level.loadGame()
         
         # Game Loop
         running = True
@@ -96,7 +135,7 @@ class Game:
                     elif event.key == pygame.K_EQUALS:
                         # Trigger victory for demo
                         if hasattr(self.level, 'overlay'):
-                            self.level.overlay.triggerVictory()
+                            self.triggerVictory(self.level.player)
                     elif event.key == pygame.K_F11:
                         # Toggle fullscreen with F11
                         self.fullscreen = not self.fullscreen
@@ -162,60 +201,10 @@ class Game:
                             self.level.overlay.handleMouseDown(pygame.mouse.get_pos())
                     elif event.button == 4:  # Scroll up
                         if hasattr(self.level, 'overlay'):
-                            overlay = self.level.overlay
-                            # Clear eat prompt when scrolling
-                            overlay.eat_prompt_item = None
-                            # Skip empty slots
-                            start_index = overlay.selected_index
-                            for _ in range(len(overlay.inventory_order)):
-                                overlay.selected_index = (overlay.selected_index - 1) % len(overlay.inventory_order)
-                                item_key = overlay.inventory_order[overlay.selected_index]
-                                # Check if slot should be shown
-                                if item_key == 'axe' and not self.level.player.axe_unlocked:
-                                    continue
-                                if item_key == 'tomato_seeds' and not self.level.player.tomato_unlocked:
-                                    continue
-                                if item_key in ['hoe', 'axe', 'water', 'hand', 'corn_seeds', 'tomato_seeds']:
-                                    break
-                                if self.level.player.itemInventory.get(item_key, 0) > 0:
-                                    break
-                            # Update player selection based on item type
-                            if item_key in ['hoe', 'axe', 'water', 'hand']:
-                                if item_key in self.level.player.tools:
-                                    self.level.player.selectedTool = item_key
-                                    self.level.player.toolNum = self.level.player.tools.index(item_key)
-                            elif item_key in ['corn_seeds', 'tomato_seeds']:
-                                seed_name = item_key.replace('_seeds', '')
-                                self.level.player.selectedSeed = seed_name
-                                self.level.player.seedNum = self.level.player.seeds.index(seed_name)
+                            self.scrollInventory(self.level.player, self.level.overlay, -1)
                     elif event.button == 5:  # Scroll down
                         if hasattr(self.level, 'overlay'):
-                            overlay = self.level.overlay
-                            # Clear eat prompt when scrolling
-                            overlay.eat_prompt_item = None
-                            # Skip empty slots
-                            start_index = overlay.selected_index
-                            for _ in range(len(overlay.inventory_order)):
-                                overlay.selected_index = (overlay.selected_index + 1) % len(overlay.inventory_order)
-                                item_key = overlay.inventory_order[overlay.selected_index]
-                                # Check if slot should be shown
-                                if item_key == 'axe' and not self.level.player.axe_unlocked:
-                                    continue
-                                if item_key == 'tomato_seeds' and not self.level.player.tomato_unlocked:
-                                    continue
-                                if item_key in ['hoe', 'axe', 'water', 'hand', 'corn_seeds', 'tomato_seeds']:
-                                    break
-                                if self.level.player.itemInventory.get(item_key, 0) > 0:
-                                    break
-                            # Update player selection based on item type
-                            if item_key in ['hoe', 'axe', 'water', 'hand']:
-                                if item_key in self.level.player.tools:
-                                    self.level.player.selectedTool = item_key
-                                    self.level.player.toolNum = self.level.player.tools.index(item_key)
-                            elif item_key in ['corn_seeds', 'tomato_seeds']:
-                                seed_name = item_key.replace('_seeds', '')
-                                self.level.player.selectedSeed = seed_name
-                                self.level.player.seedNum = self.level.player.seeds.index(seed_name)
+                            self.scrollInventory(self.level.player, self.level.overlay, +1)
                 elif event.type == pygame.MOUSEBUTTONUP:
                     if event.button == 1 and not self.show_menu:
                         mouse_pos = pygame.mouse.get_pos()
@@ -289,96 +278,49 @@ class Game:
             
             # Check mobile controls for plant/eat/use buttons (outside event loop for continuous checking)
             if not self.show_menu and hasattr(self.level, 'player') and MOBILE_CONTROLS_AVAILABLE:
-                player = self.level.player
-                mobile_input = get_player_mobile_input(getattr(player, 'player_id', 1))
-                
-                # Mobile plant button (E key equivalent)
-                if mobile_input.get('plant', False) and not player.timers['toolUse'].active and not player.timers['seedUse'].active and not player.sleep:
-                    # Check if near merchant first
-                    if hasattr(self.level, 'near_merchant') and self.level.near_merchant:
-                        if hasattr(self.level, 'overlay'):
-                            self.level.overlay.merchant_open = not self.level.overlay.merchant_open
-                    else:
-                        # Plant seed
-                        target_pos = player.rect.center + PLAYER_TOOL_OFFSET[player.status.split('_')[0]]
-                        if hasattr(player, 'hitLocation') and player.hitLocation:
-                            target_pos = player.hitLocation
-                        
-                        if player.isWithinReach(target_pos):
-                            player.timers['seedUse'].activate()
-                            player.direction = pygame.math.Vector2()
-                            player.frameIndex = 0
-                            if not hasattr(player, 'hitLocation') or player.hitLocation is None:
-                                player.hitLocation = target_pos
-                
-                # Mobile use button (replaces mouse click) - handled in player.py via action/use button
-                
-                # Mobile inventory scroll - previous item (mouse wheel up equivalent)
-                # Use edge detection to only trigger on button press, not while held
-                current_inventory_prev = mobile_input.get('inventory_prev', False)
-                if current_inventory_prev and not self.prev_mobile_inventory_prev and hasattr(self.level, 'overlay'):
-                    overlay = self.level.overlay
-                    # Clear eat prompt when scrolling
-                    overlay.eat_prompt_item = None
-                    # Skip empty slots
-                    for _ in range(len(overlay.inventory_order)):
-                        overlay.selected_index = (overlay.selected_index - 1) % len(overlay.inventory_order)
-                        item_key = overlay.inventory_order[overlay.selected_index]
-                        # Check if slot should be shown
-                        if item_key == 'axe' and not self.level.player.axe_unlocked:
-                            continue
-                        if item_key == 'tomato_seeds' and not self.level.player.tomato_unlocked:
-                            continue
-                        if item_key in ['hoe', 'axe', 'water', 'hand', 'corn_seeds', 'tomato_seeds']:
-                            break
-                        if self.level.player.itemInventory.get(item_key, 0) > 0:
-                            break
-                    # Update player selection based on item type
-                    if item_key in ['hoe', 'axe', 'water', 'hand']:
-                        if item_key in self.level.player.tools:
-                            self.level.player.selectedTool = item_key
-                            self.level.player.toolNum = self.level.player.tools.index(item_key)
-                    elif item_key in ['corn_seeds', 'tomato_seeds']:
-                        seed_name = item_key.replace('_seeds', '')
-                        self.level.player.selectedSeed = seed_name
-                        self.level.player.seedNum = self.level.player.seeds.index(seed_name)
-                self.prev_mobile_inventory_prev = current_inventory_prev
-                
-                # Mobile inventory scroll - next item (mouse wheel down equivalent)
-                # Use edge detection to only trigger on button press, not while held
-                current_inventory_next = mobile_input.get('inventory_next', False)
-                if current_inventory_next and not self.prev_mobile_inventory_next and hasattr(self.level, 'overlay'):
-                    overlay = self.level.overlay
-                    # Clear eat prompt when scrolling
-                    overlay.eat_prompt_item = None
-                    # Skip empty slots
-                    for _ in range(len(overlay.inventory_order)):
-                        overlay.selected_index = (overlay.selected_index + 1) % len(overlay.inventory_order)
-                        item_key = overlay.inventory_order[overlay.selected_index]
-                        # Check if slot should be shown
-                        if item_key == 'axe' and not self.level.player.axe_unlocked:
-                            continue
-                        if item_key == 'tomato_seeds' and not self.level.player.tomato_unlocked:
-                            continue
-                        if item_key in ['hoe', 'axe', 'water', 'hand', 'corn_seeds', 'tomato_seeds']:
-                            break
-                        if self.level.player.itemInventory.get(item_key, 0) > 0:
-                            break
-                    # Update player selection based on item type
-                    if item_key in ['hoe', 'axe', 'water', 'hand']:
-                        if item_key in self.level.player.tools:
-                            self.level.player.selectedTool = item_key
-                            self.level.player.toolNum = self.level.player.tools.index(item_key)
-                    elif item_key in ['corn_seeds', 'tomato_seeds']:
-                        seed_name = item_key.replace('_seeds', '')
-                        self.level.player.selectedSeed = seed_name
-                        self.level.player.seedNum = self.level.player.seeds.index(seed_name)
-                self.prev_mobile_inventory_next = current_inventory_next
+                # Every player has their own controller, inventory and merchant state
+                for viewport in self.level.viewports:
+                    player = viewport.player
+                    overlay = viewport.overlay
+                    mobile_input = get_player_mobile_input(getattr(player, 'player_id', 1))
+                    
+                    # Mobile plant button (E key equivalent)
+                    if mobile_input.get('plant', False) and not player.timers['toolUse'].active and not player.timers['seedUse'].active and not player.sleep:
+                        # Check if near merchant first
+                        if viewport.near_merchant:
+                            overlay.merchant_open = not overlay.merchant_open
+                        else:
+                            # Plant seed
+                            target_pos = player.rect.center + PLAYER_TOOL_OFFSET[player.status.split('_')[0]]
+                            if hasattr(player, 'hitLocation') and player.hitLocation:
+                                target_pos = player.hitLocation
+                            
+                            if player.isWithinReach(target_pos):
+                                player.timers['seedUse'].activate()
+                                player.direction = pygame.math.Vector2()
+                                player.frameIndex = 0
+                                if not hasattr(player, 'hitLocation') or player.hitLocation is None:
+                                    player.hitLocation = target_pos
+                    
+                    # Mobile use button (replaces mouse click) - handled in player.py via action/use button
+                    
+                    # Mobile inventory scroll - previous item (mouse wheel up equivalent)
+                    # Use edge detection to only trigger on button press, not while held
+                    current_inventory_prev = mobile_input.get('inventory_prev', False)
+                    if current_inventory_prev and not self.prev_mobile_inventory_prev.get(player.player_id, False):
+                        self.scrollInventory(player, overlay, -1)
+                    self.prev_mobile_inventory_prev[player.player_id] = current_inventory_prev
+                    
+                    # Mobile inventory scroll - next item (mouse wheel down equivalent)
+                    # Use edge detection to only trigger on button press, not while held
+                    current_inventory_next = mobile_input.get('inventory_next', False)
+                    if current_inventory_next and not self.prev_mobile_inventory_next.get(player.player_id, False):
+                        self.scrollInventory(player, overlay, 1)
+                    self.prev_mobile_inventory_next[player.player_id] = current_inventory_next
             
             # Update scores based on player inventory and gold
             if hasattr(self.level, 'player'):
-                player = self.level.player
-                if hasattr(player, 'itemInventory'):
+                for player, overlay in zip(self.level.players, self.level.overlays):
                     # Calculate score based on items collected + gold + experience
                     total_score = (
                         player.itemInventory.get('wood', 0) * 1 +
@@ -388,17 +330,21 @@ class Game:
                         player.gold +
                         player.experience
                     )
-                    self.scores[0] = total_score  # Single player for now
+                    self.scores[player.player_id - 1] = total_score
+                    overlay.score = total_score
             
-            # Update overlay messages and pass score
+            # Update overlay messages
             if hasattr(self.level, 'overlay'):
-                self.level.overlay.score = self.scores[0]
-                self.level.overlay.updateMessages(dt)
-                self.level.overlay.updateVictory(dt)
+                for overlay in self.level.overlays:
+                    overlay.updateMessages(dt)
+                    overlay.updateVictory(dt)
                 
-                # Check for victory trigger
-                if self.level.player.level >= 3 and not self.level.overlay.victory_active:
-                    self.level.overlay.triggerVictory()
+                # Check for victory trigger (first player to reach level 3)
+                if not self.level.overlay.victory_active:
+                    for player in self.level.players:
+                        if player.level >= 3:
+                            self.triggerVictory(player)
+                            break
             
             # Runs the level/game
             self.level.run(dt)
@@ -413,7 +359,7 @@ class Game:
                 screen_center = self.screen.get_rect().center
                 
                 # Menu title
-                menu_text = self.body_font_medium.render("MENU", True, (255, 255, 255))
+                menu_text = textCache.render(self.body_font_medium, "MENU", (255, 255, 255))
                 menu_rect = menu_text.get_rect(center=(screen_center[0], 100))
                 self.screen.blit(menu_text, menu_rect)
                 
@@ -424,7 +370,7 @@ class Game:
                 button_spacing = 80
                 
                 for i, button_name in enumerate(button_names):
-                    button_text = self.header_font_medium.render(button_name, True, (255, 255, 100))
+                    button_text = textCache.render(self.header_font_medium, button_name, (255, 255, 100))
                     button_rect = button_text.get_rect(center=(screen_center[0], y_start + i * button_spacing))
                     self.menu_buttons[button_name.lower()] = button_rect
                     self.screen.blit(button_text, button_rect)
@@ -441,7 +387,7 @@ class Game:
                         "Hover Over Item View Name"
                     ]
                     for i, text in enumerate(controls):
-                        detail_text = self.body_font_small.render(text, True, (255, 255, 255))
+                        detail_text = textCache.render(self.body_font_small, text, (255, 255, 255))
                         detail_rect = detail_text.get_rect(center=(screen_center[0], details_y + i * 35))
                         self.screen.blit(detail_text, detail_rect)
                 
@@ -454,13 +400,18 @@ class Game:
                         "ESC Close Menu"
                     ]
                     for i, text in enumerate(options):
-                        detail_text = self.body_font_small.render(text, True, (255, 255, 255))
+                        detail_text = textCache.render(self.body_font_small, text, (255, 255, 255))
                         detail_rect = detail_text.get_rect(center=(screen_center[0], details_y + i * 35))
                         self.screen.blit(detail_text, detail_rect)
             
             # Updates the display
             pygame.display.update()
 
+        # Final save, waiting for any autosave still being written first
+        self.level.autosaver.wait()
+        self.level.saveGame()
+        self.level.autosaver.wait()
+
         pygame.quit()
         
         # Return GameJam format result
@@ -476,6 +427,7 @@ def main():
     parser.add_argument("--players", type=int, default=1)
     parser.add_argument("--seed", type=int, default=123)
     parser.add_argument("--mode", type=str, default="jam")
+    parser.add_argument("--fresh", action="store_true")
     args = parser.parse_args()
 
     game = Game(args)
@@ -0,0 +1,258 @@
+"""
+Compiled level cache for Tiled maps.
+
+Parsing map.tmx with pytmx means a full XML parse plus loading every tileset
+image. compileMap() does that once and writes a compact binary file next to the
+map: tile id arrays per layer, object lists and a packed tileset atlas.
+loadMap() reads it back with a single mmap and only recompiles when the TMX is
+newer than the cache.
+
+Run `python mapcache.py` to build the cache ahead of time.
+"""
+import mmap
+import os
+import struct
+from array import array
+import pygame
+
+MAGIC = b'BGLV'
+VERSION = 1
+ATLAS_WIDTH = 2048
+
+HEADER = struct.Struct('<4sHdIIIIIII')  # magic, version, tmx mtime, width, height, tile w, tile h, layers, atlas w, atlas h
+FRAME = struct.Struct('<HHHH')
+LAYER = struct.Struct('<BI')  # layer type, item count
+OBJECT = struct.Struct('<ffffi')
+NAME = struct.Struct('<H')
+
+TILE_LAYER = 0
+OBJECT_LAYER = 1
+
+
+class TileLayer:
+    def __init__(self, name, xs, ys, frames, surfaces):
+        self.name = name
+        self.xs = xs
+        self.ys = ys
+        self.frames = frames
+        self.surfaces = surfaces
+
+    def tiles(self):
+        """Yields (x, y, surface) like pytmx's TiledTileLayer.tiles()."""
+        surfaces = self.surfaces
+        for x, y, frame in zip(self.xs, self.ys, self.frames):
+            yield x, y, surfaces[frame]
+
+
+class MapObject:
+    def __init__(self, name, x, y, width, height, image):
+        self.name = name
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        self.image = image
+
+
+class ObjectLayer(list):
+    def __init__(self, name, objects):
+        super().__init__(objects)
+        self.name = name
+
+
+class CompiledMap:
+    def __init__(self, width, height, tilewidth, tileheight, layers, atlas, surfaces):
+        self.width = width
+        self.height = height
+        self.tilewidth = tilewidth
+        self.tileheight = tileheight
+        self.layers = layers
+        self.layernames = {layer.name: layer for layer in layers}
+        # Every tile/object image is a subsurface of this one surface
+        self.atlas = atlas
+        self.surfaces = surfaces
+
+    def get_layer_by_name(self, name):
+        try:
+            return self.layernames[name]
+        except KeyError:
+            raise ValueError(f'Layer "{name}" not found')
+
+
+def cachePath(tmxPath):
+    return os.path.splitext(tmxPath)[0] + '.lvl'
+
+
+def packString(text):
+    data = text.encode('utf-8')
+    return NAME.pack(len(data)) + data
+
+
+def packAtlas(images):
+    """Shelf pack the images, tallest first. Returns the atlas size and a rect per image."""
+    order = sorted(range(len(images)), key = lambda i: images[i].get_height(), reverse = True)
+    rects = [None] * len(images)
+    x = y = shelfHeight = width = 0
+    for i in order:
+        w, h = images[i].get_size()
+        if x + w > ATLAS_WIDTH:
+            x = 0
+            y += shelfHeight
+            shelfHeight = 0
+        rects[i] = (x, y, w, h)
+        x += w
+        width = max(width, x)
+        shelfHeight = max(shelfHeight, h)
+    return (max(width, 1), max(y + shelfHeight, 1)), rects
+
+
+def compileMap(tmxPath, outPath = None):
+    """Parses the TMX with pytmx and returns the compiled level as bytes (also written to outPath)."""
+    from pytmx import TiledTileLayer, TiledObjectGroup
+    from pytmx.util_pygame import load_pygame
+
+    mapData = load_pygame(tmxPath)
+
+    # Each distinct surface goes into the atlas once
+    images = []
+    imageIndex = {}
+
+    def frameFor(surface):
+        if surface is None:
+            return -1
+        key = id(surface)
+        if key not in imageIndex:
+            imageIndex[key] = len(images)
+            images.append(surface)
+        return imageIndex[key]
+
+    layerData = []
+    for layer in mapData.layers:
+        if isinstance(layer, TiledTileLayer):
+            xs, ys, frames = array('H'), array('H'), array('H')
+            for x, y, surface in layer.tiles():
+                xs.append(x)
+                ys.append(y)
+                frames.append(frameFor(surface))
+            layerData.append(LAYER.pack(TILE_LAYER, len(xs)) + packString(layer.name) +
+                             xs.tobytes() + ys.tobytes() + frames.tobytes())
+        elif isinstance(layer, TiledObjectGroup):
+            objects = [packString(obj.name or '') +
+                       OBJECT.pack(obj.x, obj.y, obj.width, obj.height, frameFor(obj.image))
+                       for obj in layer]
+            layerData.append(LAYER.pack(OBJECT_LAYER, len(objects)) + packString(layer.name) + b''.join(objects))
+
+    atlasSize, rects = packAtlas(images)
+    atlas = pygame.Surface(atlasSize, pygame.SRCALPHA)
+    for image, rect in zip(images, rects):
+        atlas.blit(image, rect[:2])
+
+    data = b''.join([
+        HEADER.pack(MAGIC, VERSION, os.path.getmtime(tmxPath), mapData.width, mapData.height,
+                    mapData.tilewidth, mapData.tileheight, len(layerData), atlasSize[0], atlasSize[1]),
+        struct.pack('<I', len(rects)),
+        b''.join(FRAME.pack(*rect) for rect in rects),
+        b''.join(layerData),
+        pygame.image.tobytes(atlas, 'RGBA')
+    ])
+
+    if outPath:
+        # Write to a temp file first so a crash never leaves a half written cache
+        try:
+            with open(outPath + '.tmp', 'wb') as f:
+                f.write(data)
+            os.replace(outPath + '.tmp', outPath)
+        except OSError as e:
+            print(f"Warning: Could not write map cache: {e}")
+    return data
+
+
+def readString(buffer, offset):
+    length, = NAME.unpack_from(buffer, offset)
+    offset += NAME.size
+    return bytes(buffer[offset:offset + length]).decode('utf-8'), offset + length
+
+
+def parseMap(buffer):
+    """Builds a CompiledMap from compiled level bytes (or an mmap of them)."""
+    magic, version, mtime, width, height, tilewidth, tileheight, layerCount, atlasWidth, atlasHeight = HEADER.unpack_from(buffer, 0)
+    offset = HEADER.size
+
+    frameCount, = struct.unpack_from('<I', buffer, offset)
+    offset += 4
+    rects = [FRAME.unpack_from(buffer, offset + i * FRAME.size) for i in range(frameCount)]
+    offset += frameCount * FRAME.size
+
+    rawLayers = []
+    for _ in range(layerCount):
+        layerType, count = LAYER.unpack_from(buffer, offset)
+        offset += LAYER.size
+        name, offset = readString(buffer, offset)
+        if layerType == TILE_LAYER:
+            arrays = []
+            for _ in range(3):
+                values = array('H')
+                values.frombytes(buffer[offset:offset + count * 2])
+                arrays.append(values)
+                offset += count * 2
+            rawLayers.append((layerType, name, arrays))
+        else:
+            objects = []
+            for _ in range(count):
+                objName, offset = readString(buffer, offset)
+                objects.append((objName,) + OBJECT.unpack_from(buffer, offset))
+                offset += OBJECT.size
+            rawLayers.append((layerType, name, objects))
+
+    atlas = pygame.image.frombytes(buffer[offset:offset + atlasWidth * atlasHeight * 4], (atlasWidth, atlasHeight), 'RGBA')
+    if pygame.display.get_surface():
+        atlas = atlas.convert_alpha()
+    surfaces = [atlas.subsurface(rect) for rect in rects]
+
+    layers = []
+    for layerType, name, items in rawLayers:
+        if layerType == TILE_LAYER:
+            layers.append(TileLayer(name, *items, surfaces))
+        else:
+            layers.append(ObjectLayer(name, [
+                MapObject(objName, x, y, w, h, surfaces[frame] if frame >= 0 else None)
+                for objName, x, y, w, h, frame in items]))
+
+    return CompiledMap(width, height, tilewidth, tileheight, layers, atlas, surfaces)
+
+
+def isCurrent(tmxPath, path):
+    """True if the compiled level exists, matches this format version and is not older than the TMX."""
+    try:
+        with open(path, 'rb') as f:
+            header = f.read(HEADER.size)
+    except OSError:
+        return False
+    if len(header) < HEADER.size:
+        return False
+    magic, version, mtime = HEADER.unpack(header)[:3]
+    return magic == MAGIC and version == VERSION and mtime == os.path.getmtime(tmxPath)
+
+
+def loadMap(tmxPath):
+    """Loads the compiled level for tmxPath, recompiling it first if the TMX has changed."""
+    path = cachePath(tmxPath)
+    if not isCurrent(tmxPath, path):
+        data = compileMap(tmxPath, path)
+        if not isCurrent(tmxPath, path):
+            # Cache could not be written, use the freshly compiled bytes
+            return parseMap(data)
+
+    with open(path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access = mmap.ACCESS_READ) as buffer:
+            return parseMap(buffer)
+
+
+if __name__ == '__main__':
+    # pytmx converts tile images, which needs a display mode (any size will do)
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    tmx = './map/map.tmx'
+    compileMap(tmx, cachePath(tmx))
+    print(f"Compiled {tmx} -> {cachePath(tmx)}")
@@ -1,5 +1,7 @@
 import pygame
 from settings import *
+from scheduler import Scheduler
+from textcache import textCache
 
 class Overlay:
     def __init__(self, player):
@@ -46,6 +48,7 @@ class Overlay:
             self.emote_sheet.fill((200, 200, 200))
             self.emote_back = pygame.Surface((50, 50))
             self.emote_back.fill((100, 100, 100))
+        self.emote_frames = self.buildEmoteFrames()
         
         # Load gold icon
         try:
@@ -80,6 +83,7 @@ class Overlay:
             self.stat_title_font = pygame.font.Font('./body_font.ttf', 30)
             self.stat_value_font = pygame.font.Font('./body_font.ttf', 25)
             self.progress_title_font = pygame.font.Font('./body_font.ttf', 35)
+            self.small_font = pygame.font.Font('./body_font.ttf', 18)
             self.stat_title_font.set_bold(True)
             self.stat_value_font.set_bold(True)
         except:
@@ -89,6 +93,7 @@ class Overlay:
             self.stat_title_font = pygame.font.SysFont(None, 30, bold=True)
             self.stat_value_font = pygame.font.SysFont(None, 25, bold=True)
             self.progress_title_font = pygame.font.SysFont(None, 35)
+            self.small_font = pygame.font.SysFont(None, 18)
         
         # Inventory slot configuration (scaled to 50%)
         self.slot_size = 83 // 2
@@ -136,6 +141,7 @@ class Overlay:
         self.drag_start_pos = None
         self.info_item = None
         self.save_prompt = False  # Disabled for now (exists for possible future use)
+        self.onSave = None  # Set by the level, called when the save prompt is accepted
         self.merchant_open = False
         
         # Load coin icon for merchant
@@ -149,11 +155,14 @@ class Overlay:
             self.coin_icon_small = pygame.Surface((20, 20))
             self.coin_icon_small.fill((255, 215, 0))
         
+        # Message and emote expiry run off their own scheduler (advanced in updateMessages)
+        self.scheduler = Scheduler()
+
         # Message display
         self.current_message = None
-        self.message_timer = 0
         self.message_duration = 3.0
-        self.message_delay_timer = 0
+        self.message_delay = 0.1  # 100ms delay before a message shows
+        self.message_event = None
         
         # Announcement prompt
         self.announcement = None
@@ -169,11 +178,13 @@ class Overlay:
         # Emote system
         self.emote_menu_open = False
         self.current_emote = None
-        self.emote_timer = 0
+        self.emote_event = None
         self.emote_duration = 3.0
         
         # Victory screen
         self.victory_active = False
+        self.winner = player
+        self.winner_score = 0
         self.victory_slide_y = None
         self.victory_stats_slide_y = None
         self.victory_animation_frame = 0
@@ -195,7 +206,43 @@ class Overlay:
         self.highlight = pygame.Surface((self.slot_size, self.slot_size))
         self.highlight.fill((255, 0, 0))
         self.highlight.set_alpha(25)
+        
+        # Item icons scaled once for the inventory slots, progress book and merchant menu
+        self.slotItemSurfaces = {key: pygame.transform.scale(surf, (self.slot_size - 5, self.slot_size - 5)) for key, surf in self.itemSurfaces.items()}
+        self.bookItemSurfaces = {key: pygame.transform.scale(surf, (60, 60)) for key, surf in self.itemSurfaces.items()}
+        self.lockedBookItemSurfaces = {}
+        for key, surf in self.bookItemSurfaces.items():
+            gray_surf = surf.copy()
+            gray_surf.fill((100, 100, 100), special_flags=pygame.BLEND_RGB_MULT)
+            self.lockedBookItemSurfaces[key] = gray_surf
+        self.merchantItemSurfaces = {key: pygame.transform.scale(surf, (30, 30)) for key, surf in self.itemSurfaces.items()}
+        
+        # Retained HUD layers, recomposed only when the values they show change
+        self.stats_layer = None
+        self.stats_layer_key = None
+        self.inventory_layer = None
+        self.inventory_layer_key = None
     
+    def buildEmoteFrames(self):
+        """Slice every emote out of the sheet once, scaled up 25% and composed onto the emote background."""
+        # Emote sheet is 150x150 (50% of 300x300), so each emote is 50x50 in a 3x3 grid
+        emote_size = self.emote_sheet.get_width() // 3
+        scaled_size = int(emote_size * 1.25)
+        width = max(self.emote_back.get_width(), scaled_size)
+        height = max(self.emote_back.get_height(), scaled_size)
+        frames = []
+        for row in range(3):
+            for col in range(3):
+                emote_surf = pygame.Surface((emote_size, emote_size), pygame.SRCALPHA)
+                emote_surf.blit(self.emote_sheet, (0, 0), (col * emote_size, row * emote_size, emote_size, emote_size))
+                emote_scaled = pygame.transform.scale(emote_surf, (scaled_size, scaled_size))
+                
+                frame = pygame.Surface((width, height), pygame.SRCALPHA)
+                frame.blit(self.emote_back, self.emote_back.get_rect(center=(width // 2, height // 2)))
+                frame.blit(emote_scaled, emote_scaled.get_rect(center=(width // 2, height // 2)))
+                frames.append(frame)
+        return frames
+
     def getInventoryPosition(self):
         screen_width = self.displaySurface.get_width()
         screen_height = self.displaySurface.get_height()
@@ -289,6 +336,8 @@ class Overlay:
         
         if yes_rect.collidepoint(mouse_pos):
             # Save game
+            if self.onSave:
+                self.onSave()
             self.addMessage("Game saved!")
             self.save_prompt = False
             return True
@@ -330,8 +379,21 @@ class Overlay:
     def addMessage(self, message):
         """Add a message to display in the inventory area."""
         self.current_message = None
-        self.message_delay_timer = 0.1  # 100ms delay
-        self.pending_message = message
+        # Replaces whatever message was pending or showing
+        self.scheduler.cancel(self.message_event)
+        self.message_event = self.scheduler.schedule(self.message_delay, self.showMessage, message)
+
+    def showMessage(self, message):
+        self.current_message = message
+        self.message_event = self.scheduler.schedule(self.message_duration, self.clearMessage)
+
+    def clearMessage(self):
+        self.current_message = None
+        self.message_event = None
+
+    def clearEmote(self):
+        self.current_emote = None
+        self.emote_event = None
     
     def showAnnouncement(self, header_text, body_text):
         """Show centered announcement with header and body text."""
@@ -361,6 +423,21 @@ class Overlay:
         stat_x = screen_width - self.stat_template.get_width() - 10
         stat_y = 10
         
+        # Only recompose the panel when one of the values changes
+        stats_key = (getattr(self, 'score', 0), self.player.level, self.player.experience, self.player.exp_to_next_level, self.player.gold)
+        if stats_key != self.stats_layer_key:
+            self.stats_layer_key = stats_key
+            self.stats_layer = self.composePlayerStats()
+        self.displaySurface.blit(self.stats_layer, (stat_x, stat_y))
+
+    def composePlayerStats(self):
+        """Build the stat panel (Score, Level, EXP and Gold cards) on its own surface."""
+        stat_height = self.stat_template.get_height() + 5
+        width = max(self.stat_template.get_width(), self.gold_stat_template.get_width())
+        height = stat_height * 3 + self.gold_stat_template.get_height()
+        layer = pygame.Surface((width, height), pygame.SRCALPHA)
+        stat_y = 0
+        
         # Stats to display: Score, Level, EXP (name: value side by side)
         stats = [
             ("Score", str(getattr(self, 'score', 0))),
@@ -370,32 +447,98 @@ class Overlay:
         
         for title, value in stats:
             # Draw stat template background
-            self.displaySurface.blit(self.stat_template, (stat_x, stat_y))
+            layer.blit(self.stat_template, (0, stat_y))
             
             # Draw title and value side by side, centered vertically within template
             text_y = stat_y + (self.stat_template.get_height() - self.stat_title_font.get_height()) // 2
             
             # Draw title left-aligned within template (with margin)
-            title_text = self.stat_title_font.render(title, True, (255, 255, 255))
-            title_x = stat_x + 7
-            self.displaySurface.blit(title_text, (title_x, text_y))
+            title_text = textCache.render(self.stat_title_font, title, (255, 255, 255))
+            layer.blit(title_text, (7, text_y))
             
             # Draw value right-aligned within template (with margin)
-            value_text = self.stat_value_font.render(value, True, (255, 255, 255))
-            value_x = stat_x + self.stat_template.get_width() - value_text.get_width() - 7
-            self.displaySurface.blit(value_text, (value_x, text_y))
+            value_text = textCache.render(self.stat_value_font, value, (255, 255, 255))
+            value_x = self.stat_template.get_width() - value_text.get_width() - 7
+            layer.blit(value_text, (value_x, text_y))
             
             # Move down for next stat
-            stat_y += self.stat_template.get_height() + 5
+            stat_y += stat_height
         
         # Draw Gold stat with gold template (has coin icon built-in)
-        self.displaySurface.blit(self.gold_stat_template, (stat_x, stat_y))
+        layer.blit(self.gold_stat_template, (0, stat_y))
         
         # Draw gold value right aligned, centered vertically
-        gold_value = self.stat_value_font.render(str(self.player.gold), True, (255, 255, 255))
-        value_x = stat_x + self.gold_stat_template.get_width() - gold_value.get_width() - 7
+        gold_value = textCache.render(self.stat_value_font, str(self.player.gold), (255, 255, 255))
+        value_x = self.gold_stat_template.get_width() - gold_value.get_width() - 7
         value_y = stat_y + (self.gold_stat_template.get_height() - self.stat_value_font.get_height()) // 2
-        self.displaySurface.blit(gold_value, (value_x, value_y))
+        layer.blit(gold_value, (value_x, value_y))
+        return layer
+
+    def drawInventory(self):
+        """Draw the inventory bar, recomposing it only when its contents, selection or hover change."""
+        inventory_key = (
+            tuple(self.inventory_order),
+            tuple(self.player.itemInventory.get(item_key, 0) for item_key in self.inventory_order),
+            self.selected_index,
+            self.hovered_index,
+            self.player.axe_unlocked,
+            self.player.tomato_unlocked
+        )
+        if inventory_key != self.inventory_layer_key:
+            self.inventory_layer_key = inventory_key
+            self.inventory_layer = self.composeInventory()
+        self.displaySurface.blit(self.inventory_layer, self.getInventoryPosition())
+
+    def composeInventory(self):
+        """Build the inventory background, items, counts, highlights and slot numbers on one surface."""
+        layer = self.inventory_bg.copy()
+        
+        # Draw items in slots
+        for i, item_key in enumerate(self.inventory_order):
+            if i >= len(self.inventory_slots):
+                break
+            
+            slot = self.inventory_slots[i]
+            
+            # Determine if item should be shown
+            show_item = False
+            count = 0
+            
+            # Hide axe until unlocked
+            if item_key == 'axe' and not self.player.axe_unlocked:
+                show_item = False
+            # Hide tomato seeds until unlocked
+            elif item_key == 'tomato_seeds' and not self.player.tomato_unlocked:
+                show_item = False
+            elif item_key in ['hoe', 'axe', 'water', 'hand']:
+                show_item = True
+            elif item_key in ['corn_seeds', 'tomato_seeds']:
+                count = self.player.itemInventory.get(item_key, 0)
+                show_item = True
+            else:
+                count = self.player.itemInventory.get(item_key, 0)
+                show_item = count > 0
+            
+            if show_item:
+                # Draw item sprite
+                scaled_surf = self.slotItemSurfaces[item_key]
+                surf_rect = scaled_surf.get_rect(center=slot.center)
+                layer.blit(scaled_surf, surf_rect)
+                
+                # Draw count for non-tools
+                if item_key not in ['hoe', 'axe', 'water', 'hand'] and count > 0:
+                    count_text = textCache.render(self.body_font, str(count), (255, 255, 255))
+                    layer.blit(count_text, (slot.right - 15, slot.bottom - 15))
+            
+            # Draw highlight for selected or hovered
+            if i == self.selected_index or i == self.hovered_index:
+                layer.blit(self.highlight, slot.topleft)
+            
+            # Draw slot number (1-9, 0 for slot 10) - moved up 5 pixels
+            slot_num = (i + 1) % 10
+            num_text = textCache.render(self.body_font, str(slot_num), (255, 255, 255))
+            layer.blit(num_text, (slot.x + 2, slot.y - 3))
+        return layer
     
     def getBookPosition(self):
         """Get progress book position (below stats, aligned with left margin of stats)."""
@@ -463,9 +606,10 @@ class Overlay:
                 emote_rect = pygame.Rect(emote_x, emote_y, emote_size, emote_size)
                 
                 if emote_rect.collidepoint(mouse_pos):
-                    # Store emote position in original sheet (100x100 grid)
-                    self.current_emote = (col * 100, row * 100)
-                    self.emote_timer = self.emote_duration
+                    # Store the emote id (index into emote_frames)
+                    self.current_emote = row * 3 + col
+                    self.scheduler.cancel(self.emote_event)
+                    self.emote_event = self.scheduler.schedule(self.emote_duration, self.clearEmote)
                     self.emote_menu_open = False
                     return True
         
@@ -552,9 +696,11 @@ class Overlay:
         self.merchant_open = False
         return True
     
-    def triggerVictory(self):
+    def triggerVictory(self, winner=None, winner_score=None):
         """Trigger victory screen animation."""
         self.victory_active = True
+        self.winner = winner or self.player
+        self.winner_score = winner_score if winner_score is not None else getattr(self, 'score', 0)
         self.victory_slide_y = -self.victory_frames[0].get_height()
         screen_height = self.displaySurface.get_height()
         self.victory_stats_slide_y = screen_height
@@ -592,24 +738,8 @@ class Overlay:
             self.victory_animation_frame = (self.victory_animation_frame + 1) % 2
     
     def updateMessages(self, dt):
-        """Update message timer."""
-        if self.message_delay_timer > 0:
-            self.message_delay_timer -= dt
-            if self.message_delay_timer <= 0 and hasattr(self, 'pending_message'):
-                self.current_message = self.pending_message
-                self.message_timer = self.message_duration
-                delattr(self, 'pending_message')
-        
-        if self.message_timer > 0:
-            self.message_timer -= dt
-            if self.message_timer <= 0:
-                self.current_message = None
-        
-        # Update emote timer
-        if self.emote_timer > 0:
-            self.emote_timer -= dt
-            if self.emote_timer <= 0:
-                self.current_emote = None
+        """Fire due message/emote expiry events."""
+        self.scheduler.update(dt)
         
         # Announcement stays until clicked (timer is negative)
         # Only handle minimization animation
@@ -624,66 +754,14 @@ class Overlay:
         # Draw player stats
         self.drawPlayerStats()
         
-        # Draw inventory background
-        inv_pos = self.getInventoryPosition()
-        self.displaySurface.blit(self.inventory_bg, inv_pos)
-        
-        # Draw items in slots
-        for i, item_key in enumerate(self.inventory_order):
-            if i >= len(self.inventory_slots):
-                break
-            
-            slot = self.inventory_slots[i]
-            slot_center = (inv_pos[0] + slot.centerx, inv_pos[1] + slot.centery)
-            
-            # Determine if item should be shown
-            show_item = False
-            count = 0
-            
-            # Hide axe until unlocked
-            if item_key == 'axe' and not self.player.axe_unlocked:
-                show_item = False
-            # Hide tomato seeds until unlocked
-            elif item_key == 'tomato_seeds' and not self.player.tomato_unlocked:
-                show_item = False
-            elif item_key in ['hoe', 'axe', 'water', 'hand']:
-                show_item = True
-            elif item_key in ['corn_seeds', 'tomato_seeds']:
-                count = self.player.itemInventory.get(item_key, 0)
-                show_item = True
-            else:
-                count = self.player.itemInventory.get(item_key, 0)
-                show_item = count > 0
-            
-            if show_item:
-                # Draw item sprite
-                item_surf = self.itemSurfaces[item_key]
-                scaled_surf = pygame.transform.scale(item_surf, (self.slot_size - 5, self.slot_size - 5))
-                surf_rect = scaled_surf.get_rect(center=slot_center)
-                self.displaySurface.blit(scaled_surf, surf_rect)
-                
-                # Draw count for non-tools
-                if item_key not in ['hoe', 'axe', 'water', 'hand'] and count > 0:
-                    count_text = self.body_font.render(str(count), True, (255, 255, 255))
-                    count_pos = (inv_pos[0] + slot.right - 15, inv_pos[1] + slot.bottom - 15)
-                    self.displaySurface.blit(count_text, count_pos)
-            
-            # Draw highlight for selected or hovered
-            if i == self.selected_index or i == self.hovered_index:
-                highlight_pos = (inv_pos[0] + slot.x, inv_pos[1] + slot.y)
-                self.displaySurface.blit(self.highlight, highlight_pos)
-            
-            # Draw slot number (1-9, 0 for slot 10) - moved up 5 pixels
-            slot_num = (i + 1) % 10
-            num_text = self.body_font.render(str(slot_num), True, (255, 255, 255))
-            num_pos = (inv_pos[0] + slot.x + 2, inv_pos[1] + slot.y - 3)
-            self.displaySurface.blit(num_text, num_pos)
+        # Draw inventory bar (cached layer)
+        self.drawInventory()
         
         # Draw hover text
         if self.hovered_index >= 0 and self.hovered_index < len(self.inventory_order):
             item_key = self.inventory_order[self.hovered_index]
             item_name = self.item_names.get(item_key, item_key)
-            hover_text = self.body_font.render(item_name, True, (255, 255, 255))
+            hover_text = textCache.render(self.body_font, item_name, (255, 255, 255))
             mouse_pos = pygame.mouse.get_pos()
             self.displaySurface.blit(hover_text, (mouse_pos[0] + 10, mouse_pos[1] - 30))
         
@@ -698,17 +776,17 @@ class Overlay:
             self.displaySurface.blit(self.prompt_outline, (prompt_x, prompt_y))
             
             # Draw "Eat?" text (scaled positioning)
-            eat_text = self.body_font.render("Eat?", True, (255, 255, 255))
+            eat_text = textCache.render(self.body_font, "Eat?", (255, 255, 255))
             eat_rect = eat_text.get_rect(center=(prompt_x + 70, prompt_y + 30))
             self.displaySurface.blit(eat_text, eat_rect)
             
             # Draw Yes button
-            yes_text = self.body_font.render("Yes", True, (100, 255, 100))
+            yes_text = textCache.render(self.body_font, "Yes", (100, 255, 100))
             yes_rect = yes_text.get_rect(center=(prompt_x + 45, prompt_y + 70))
             self.displaySurface.blit(yes_text, yes_rect)
             
             # Draw No button
-            no_text = self.body_font.render("No", True, (255, 100, 100))
+            no_text = textCache.render(self.body_font, "No", (255, 100, 100))
             no_rect = no_text.get_rect(center=(prompt_x + 95, prompt_y + 70))
             self.displaySurface.blit(no_text, no_rect)
         
@@ -723,7 +801,7 @@ class Overlay:
             prompt_lines = ["Save?", "Yes", "No"]
             y_offset = -40
             for line in prompt_lines:
-                text = self.body_font.render(line, True, (255, 255, 255))
+                text = textCache.render(self.body_font, line, (255, 255, 255))
                 text_rect = text.get_rect(center=(player_screen_pos[0], player_screen_pos[1] + y_offset))
                 
                 # Draw background
@@ -762,13 +840,13 @@ class Overlay:
             y_offset = bg_rect.top + 20
             for line in info_text.split('\n'):
                 if line.strip():
-                    text = self.body_font.render(line.strip(), True, (255, 255, 255))
+                    text = textCache.render(self.body_font, line.strip(), (255, 255, 255))
                     text_rect = text.get_rect(center=(screen_center[0], y_offset))
                     self.displaySurface.blit(text, text_rect)
                 y_offset += 35
             
             # Draw close instruction
-            close_text = self.body_font.render("Click anywhere to close", True, (150, 150, 150))
+            close_text = textCache.render(self.body_font, "Click anywhere to close", (150, 150, 150))
             close_rect = close_text.get_rect(center=(screen_center[0], bg_rect.bottom - 30))
             self.displaySurface.blit(close_text, close_rect)
         
@@ -780,7 +858,7 @@ class Overlay:
             msg_y = bottom_row_y + 42 + 24
             msg_x = inv_pos[0] + 10
             
-            text = self.message_font.render(self.current_message, True, (255, 255, 255))
+            text = textCache.render(self.message_font, self.current_message, (255, 255, 255))
             self.displaySurface.blit(text, (msg_x, msg_y))
         
         # Draw announcement prompt (centered with animation)
@@ -812,11 +890,11 @@ class Overlay:
                 
                 # Draw text only if not too small
                 if self.announcement_scale > 0.3:
-                    header_text = self.header_font.render(self.announcement[0], True, (255, 255, 255))
+                    header_text = textCache.render(self.header_font, self.announcement[0], (255, 255, 255))
                     header_rect = header_text.get_rect(center=(current_x, prompt_y + 40 * self.announcement_scale))
                     self.displaySurface.blit(header_text, header_rect)
                     
-                    body_text = self.body_font.render(self.announcement[1], True, (255, 255, 255))
+                    body_text = textCache.render(self.body_font, self.announcement[1], (255, 255, 255))
                     body_rect = body_text.get_rect(center=(current_x, prompt_y + 80 * self.announcement_scale))
                     self.displaySurface.blit(body_text, body_rect)
         
@@ -862,11 +940,11 @@ class Overlay:
             pygame.draw.rect(self.displaySurface, (139, 69, 19), (book_x, book_y, 400, 300), 3)
             
             # Draw title
-            title_text = self.progress_title_font.render("Progress Report", True, (0, 0, 0))
-            title_text_bold = self.progress_title_font.render("Progress Report", True, (0, 0, 0))
+            title_text = textCache.render(self.progress_title_font, "Progress Report", (0, 0, 0))
             title_rect = title_text.get_rect(center=(screen_center[0], book_y + 30))
+            # Drawn twice, 1px apart, to fake bold
             self.displaySurface.blit(title_text, title_rect)
-            self.displaySurface.blit(title_text_bold, (title_rect.x + 1, title_rect.y))
+            self.displaySurface.blit(title_text, (title_rect.x + 1, title_rect.y))
             
             # Draw items grid
             items_list = ['hoe', 'axe', 'water', 'hand', 'corn', 'tomato', 'wood', 'apple']
@@ -877,29 +955,23 @@ class Overlay:
                 item_y = book_y + 80 + row * 80
                 
                 if item_key in self.itemSurfaces:
-                    item_surf = self.itemSurfaces[item_key]
-                    scaled_surf = pygame.transform.scale(item_surf, (60, 60))
-                    
                     # Gray out if locked
                     if not self.unlocked_items.get(item_key, False):
-                        gray_surf = scaled_surf.copy()
-                        gray_surf.fill((100, 100, 100), special_flags=pygame.BLEND_RGB_MULT)
-                        self.displaySurface.blit(gray_surf, (item_x, item_y))
+                        self.displaySurface.blit(self.lockedBookItemSurfaces[item_key], (item_x, item_y))
                     else:
-                        self.displaySurface.blit(scaled_surf, (item_x, item_y))
+                        self.displaySurface.blit(self.bookItemSurfaces[item_key], (item_x, item_y))
                     
                     # Draw item name
-                    name_text = self.body_font.render(self.item_names.get(item_key, item_key), True, (0, 0, 0))
+                    name_text = textCache.render(self.body_font, self.item_names.get(item_key, item_key), (0, 0, 0))
                     name_rect = name_text.get_rect(center=(item_x + 30, item_y + 70))
                     # Scale down text if needed
                     if name_rect.width > 70:
-                        small_font = pygame.font.Font('./body_font.ttf', 18) if hasattr(self, 'body_font') else pygame.font.SysFont(None, 18)
-                        name_text = small_font.render(self.item_names.get(item_key, item_key), True, (0, 0, 0))
+                        name_text = textCache.render(self.small_font, self.item_names.get(item_key, item_key), (0, 0, 0))
                         name_rect = name_text.get_rect(center=(item_x + 30, item_y + 70))
                     self.displaySurface.blit(name_text, name_rect)
             
             # Close instruction
-            close_text = self.body_font.render("Click to close", True, (0, 0, 0))
+            close_text = textCache.render(self.body_font, "Click to close", (0, 0, 0))
             close_rect = close_text.get_rect(center=(screen_center[0], book_y + 280))
             self.displaySurface.blit(close_text, close_rect)
         
@@ -925,15 +997,15 @@ class Overlay:
                     
                     # Draw stats centered, stacked vertically
                     stats_lines = [
-                        "Player 1 wins!",
-                        f"Score: {getattr(self, 'score', 0)}",
-                        f"Exp: {self.player.experience}",
-                        f"Gold: {self.player.gold}"
+                        f"Player {self.winner.player_id} wins!",
+                        f"Score: {self.winner_score}",
+                        f"Exp: {self.winner.experience}",
+                        f"Gold: {self.winner.gold}"
                     ]
                     
                     line_height = 35
                     for i, line in enumerate(stats_lines):
-                        text = self.body_font.render(line, True, (255, 255, 255))
+                        text = textCache.render(self.body_font, line, (255, 255, 255))
                         text_rect = text.get_rect(center=(screen_center[0], stats_y + i * line_height))
                         self.displaySurface.blit(text, text_rect)
         
@@ -953,7 +1025,7 @@ class Overlay:
             
             # Draw stat template with "The Merchant" title centered
             self.displaySurface.blit(self.stat_template, (menu_x, menu_y))
-            title_text = self.body_font.render("The Merchant", True, (255, 255, 255))
+            title_text = textCache.render(self.body_font, "The Merchant", (255, 255, 255))
             title_rect = title_text.get_rect(center=(menu_x + self.stat_template.get_width() // 2, menu_y + self.stat_template.get_height() // 2))
             self.displaySurface.blit(title_text, title_rect)
             
@@ -977,16 +1049,14 @@ class Overlay:
                 
                 # Draw item icon (left aligned)
                 if item_key in self.itemSurfaces:
-                    item_surf = self.itemSurfaces[item_key]
-                    scaled_surf = pygame.transform.scale(item_surf, (30, 30))
-                    self.displaySurface.blit(scaled_surf, (menu_x + 15, item_y))
+                    self.displaySurface.blit(self.merchantItemSurfaces[item_key], (menu_x + 15, item_y))
                 
                 # Draw buy/sell indicator
-                action_text = self.body_font.render("Buy" if is_buy else "Sell", True, (100, 255, 100) if is_buy else (255, 215, 0))
+                action_text = textCache.render(self.body_font, "Buy" if is_buy else "Sell", (100, 255, 100) if is_buy else (255, 215, 0))
                 self.displaySurface.blit(action_text, (menu_x + 50, item_y + 5))
                 
                 # Draw price and coin icon (right aligned)
-                price_text = self.body_font.render(str(price), True, (255, 255, 255))
+                price_text = textCache.render(self.body_font, str(price), (255, 255, 255))
                 coin_x = menu_x + self.prompt_outline.get_width() - 35
                 price_x = coin_x - price_text.get_width() - 5
                 self.displaySurface.blit(price_text, (price_x, item_y + 5))
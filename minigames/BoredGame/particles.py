@@ -0,0 +1,148 @@
+"""
+Pooled particles.
+
+Particles are not sprites. Each live particle is a slot in a few parallel
+arrays (spawn position, velocity, spawn time, death time, image), grouped by
+draw layer so the camera can draw a whole layer with one blits() call.
+Positions are worked out from the spawn values when drawing, so moving
+particles cost nothing to update and dead ones are swept out in one pass
+whenever the earliest death time has passed.
+"""
+from array import array
+from random import randint, random, choice
+import pygame
+from settings import *
+from helpful import importFolder
+
+
+class ParticleLayer:
+    def __init__(self):
+        self.xs = array('f')
+        self.ys = array('f')
+        self.vxs = array('f')
+        self.vys = array('f')
+        self.born = array('d')
+        self.deaths = array('d')
+        self.images = []
+
+    def __len__(self):
+        return len(self.images)
+
+    def add(self, x, y, vx, vy, born, death, image):
+        self.xs.append(x)
+        self.ys.append(y)
+        self.vxs.append(vx)
+        self.vys.append(vy)
+        self.born.append(born)
+        self.deaths.append(death)
+        self.images.append(image)
+
+    def sweep(self, time):
+        """Drops every particle that has died, returns the next death time."""
+        keep = [i for i, death in enumerate(self.deaths) if death > time]
+        if len(keep) != len(self.deaths):
+            for name in ('xs', 'ys', 'vxs', 'vys', 'born', 'deaths'):
+                values = getattr(self, name)
+                setattr(self, name, array(values.typecode, [values[i] for i in keep]))
+            images = self.images
+            self.images = [images[i] for i in keep]
+        return min(self.deaths, default = float('inf'))
+
+
+class ParticlePool:
+    """Holds every particle in the level.
+
+    capacity caps how many can be alive at once and spawnBudget how many can
+    be emitted in a single frame, anything over either is dropped.
+    """
+    def __init__(self, capacity = PARTICLE_CAPACITY, spawnBudget = PARTICLE_SPAWN_BUDGET):
+        self.capacity = capacity
+        self.spawnBudget = spawnBudget
+        self.spawned = 0
+        self.count = 0
+        # Game time in seconds, only moves forward in update(dt)
+        self.time = 0
+        self.nextDeath = float('inf')
+        self.layers = {}
+        # White flash of each source image, built once per surface
+        self.silhouettes = {}
+
+    def silhouette(self, surface):
+        flash = self.silhouettes.get(surface)
+        if flash is None:
+            flash = pygame.mask.from_surface(surface).to_surface()
+            flash.set_colorkey((0,0,0))
+            self.silhouettes[surface] = flash
+        return flash
+
+    def emit(self, pos, surface, z, time = 200, velocity = (0,0)):
+        """Spawn a particle for time milliseconds. Returns False if a budget was hit."""
+        if self.spawned >= self.spawnBudget or self.count >= self.capacity:
+            return False
+        layer = self.layers.get(z)
+        if layer is None:
+            layer = self.layers[z] = ParticleLayer()
+        death = self.time + time / 1000
+        layer.add(pos[0], pos[1], velocity[0], velocity[1], self.time, death, surface)
+        self.nextDeath = min(self.nextDeath, death)
+        self.spawned += 1
+        self.count += 1
+        return True
+
+    def flash(self, pos, surface, z, time = 200):
+        # White silhouette of the surface, used when hitting trees
+        return self.emit(pos, self.silhouette(surface), z, time)
+
+    def update(self, dt):
+        self.time += dt
+        self.spawned = 0
+        if self.time >= self.nextDeath:
+            self.nextDeath = min((layer.sweep(self.time) for layer in self.layers.values()), default = float('inf'))
+            self.count = sum(len(layer) for layer in self.layers.values())
+
+    def activeLayers(self):
+        return sorted(z for z, layer in self.layers.items() if len(layer))
+
+    def draw(self, surface, offset, z):
+        layer = self.layers.get(z)
+        if not layer:
+            return
+        time = self.time
+        offsetX, offsetY = int(offset.x), int(offset.y)
+        surface.blits([(image, (int(x + vx * (time - born)) - offsetX, int(y + vy * (time - born)) - offsetY))
+                       for image, x, y, vx, vy, born in zip(layer.images, layer.xs, layer.ys, layer.vxs, layer.vys, layer.born)], False)
+
+    def clear(self):
+        self.layers.clear()
+        self.count = 0
+        self.nextDeath = float('inf')
+
+
+class Rain:
+    """Falling drops and floor splashes, emitted around each viewport while it rains."""
+    def __init__(self, pool):
+        self.pool = pool
+        self.dropFrames = importFolder('./graphics/rain/drops')
+        self.floorFrames = importFolder('./graphics/rain/floor')
+        # Fractional particles carried over between frames
+        self.dropDebt = 0
+        self.floorDebt = 0
+
+    def update(self, dt, views):
+        # Rates are per 1000x1000 pixels of view so split-screen rains just as hard
+        area = sum(view.width * view.height for view in views) / 1000000
+        self.dropDebt += RAIN_DROP_RATE * area * dt
+        self.floorDebt += RAIN_FLOOR_RATE * area * dt
+        drops, self.dropDebt = int(self.dropDebt), self.dropDebt % 1
+        floors, self.floorDebt = int(self.floorDebt), self.floorDebt % 1
+
+        pool = self.pool
+        for _ in range(drops):
+            view = choice(views)
+            # Start above and to the right so drops drift into view
+            pos = (view.left + random() * (view.width + 200), view.top - 50 + random() * view.height)
+            pool.emit(pos, choice(self.dropFrames), LAYERS['rain drops'], randint(400, 500), RAIN_DROP_VELOCITY)
+        for _ in range(floors):
+            view = choice(views)
+            pos = (view.left + random() * view.width, view.top + random() * view.height)
+            pool.emit(pos, choice(self.floorFrames), LAYERS['rain floor'], randint(400, 500))
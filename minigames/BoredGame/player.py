@@ -1,11 +1,12 @@
 import pygame
+from collections import defaultdict
 from settings import *
 from helpful import *
 from timer import Timer
 from random import choice
 
 class Player(pygame.sprite.Sprite):
-    def __init__(self,pos,group, collisionSprites,treeSprites,interactionSprites, soilLayer, player_id=1):
+    def __init__(self,pos,group, collisionSprites,treeSprites,interactionSprites, soilLayer, player_id=1, scheduler=None):
         
         # Creation of groups for the sprites
         super().__init__(group)
@@ -42,14 +43,12 @@ class Player(pygame.sprite.Sprite):
         self.collisionSprites = collisionSprites
 
 
-        # timers
+        # timers (fired by the level scheduler when one is given)
         self.timers = {
-            'toolUse': Timer(350,self.useTool),
-            'seedUse': Timer(350,self.useSeed),
-            'toolTurn': Timer(100)  # Short delay for turning before tool use
+            'toolUse': Timer(350,self.useTool,scheduler),
+            'seedUse': Timer(350,self.useSeed,scheduler),
+            'toolTurn': Timer(100,self.finishToolTurn,scheduler)  # Short delay for turning before tool use
         }
-        # Track if toolTurn just finished (to activate toolUse)
-        self.toolTurnJustFinished = False
 
         # player tools
         self.tools = ['hoe','water','hand']  # Start without axe
@@ -180,7 +179,7 @@ class Player(pygame.sprite.Sprite):
         elif self.selectedTool == 'axe':
             for tree in self.treeSprites:
                 if tree.rect.collidepoint(self.hitLocation):
-                  tree.damage()
+                  tree.damage(self)
             # Remove tilled soil when using axe (only if no plants)
             self.soilLayer.removeHit(self.hitLocation)
         elif self.selectedTool == 'hoe':
@@ -311,7 +310,8 @@ class Player(pygame.sprite.Sprite):
             mobile_available = False
             
         if not self.timers['toolUse'].active and not self.sleep:
-            playerInput = pygame.key.get_pressed()
+            # Keyboard belongs to player 1, everyone else uses mobile controls
+            playerInput = pygame.key.get_pressed() if self.player_id == 1 else defaultdict(bool)
             
             # Get mobile input for all players
             mobile_input = {'up': False, 'down': False, 'left': False, 'right': False, 'action': False, 'plant': False, 'eat': False, 'use': False}
@@ -419,23 +419,19 @@ class Player(pygame.sprite.Sprite):
     
     
     def runTimers(self):
-        # Check if toolTurn just finished (was active last frame, now inactive)
-        was_tool_turn_active = self.timers['toolTurn'].active
-        
         for timer in self.timers.values():
             timer.update()
-        
+
+    def finishToolTurn(self):
         # After turn timer completes, activate tool timer only if hitLocation is valid
-        if was_tool_turn_active and not self.timers['toolTurn'].active:
-            # Timer just finished
-            if not self.timers['toolUse'].active and not self.timers['seedUse'].active and self.hitLocation:
-                # Check if we should use tool or plant seed
-                if self.selectedTool in ['hoe', 'axe', 'water', 'hand']:
-                    self.timers['toolUse'].activate()
-                else:
-                    # If seed is selected, plant it
-                    if not self.timers['seedUse'].active:
-                        self.timers['seedUse'].activate()
+        if not self.timers['toolUse'].active and not self.timers['seedUse'].active and self.hitLocation:
+            # Check if we should use tool or plant seed
+            if self.selectedTool in ['hoe', 'axe', 'water', 'hand']:
+                self.timers['toolUse'].activate()
+            else:
+                # If seed is selected, plant it
+                if not self.timers['seedUse'].active:
+                    self.timers['seedUse'].activate()
 
             
     def getStatus(self):
@@ -0,0 +1,198 @@
+"""
+Save games.
+
+snapshot() copies the world state the save needs (players, soil grid, plants,
+trees) into plain tuples and bytes on the main thread, which is cheap. Packing
+that into the binary save and writing it to disk happens on a worker thread
+through Autosaver, so the game never waits on the disk. Loading is split into
+steps (players, soil, plants, trees) that the level runs a few at a time
+across frames.
+"""
+import os
+import struct
+import threading
+from settings import *
+from mapcache import packString, readString
+
+MAGIC = b'BGSV'
+VERSION = 2
+
+HEADER = struct.Struct('<4sH??B')  # magic, version, raining, finished, players
+PLAYER = struct.Struct('<ffiiii??B')  # x, y, experience, gold, level, exp to next, axe, tomato, inventory items
+ITEM = struct.Struct('<i')
+GRID = struct.Struct('<HH')  # rows, columns, then one flag byte per cell
+PLANT = struct.Struct('<HHBf')  # tile x, tile y, age, seconds to next stage, then the plant type
+TREE = struct.Struct('<BBBb?B')  # chunk x, chunk y, index in chunk, health, alive, apple bits
+COUNT = struct.Struct('<I')
+
+# Soil grid markers stored as bits
+CELL_FLAGS = {'F': 1, 'X': 2, 'W': 4, 'P': 8}
+
+# Records applied per frame while loading
+LOAD_STEP = 32
+
+
+class SaveState:
+    def __init__(self, raining, finished, players, rows, columns, grid, plants, trees):
+        self.raining = raining
+        # The session was won, there is nothing left to resume
+        self.finished = finished
+        self.players = players
+        self.rows = rows
+        self.columns = columns
+        self.grid = grid
+        self.plants = plants
+        self.trees = trees
+
+
+def snapshot(level):
+    """Copies everything a save needs out of the level, nothing in it is shared with the game."""
+    players = tuple((player.pos.x, player.pos.y, int(player.experience), int(player.gold), player.level, int(player.exp_to_next_level),
+                     player.axe_unlocked, player.tomato_unlocked, tuple(player.itemInventory.items()))
+                    for player in level.players)
+
+    soilGrid = level.soilLayer.grid
+    grid = bytes(sum(CELL_FLAGS.get(mark, 0) for mark in cell) for row in soilGrid for cell in row)
+
+    scheduler = level.scheduler
+    plants = tuple((plant.rect.x // TILE_SIZE, plant.rect.y // TILE_SIZE, plant.age, scheduler.timeLeft(plant.growth_event), plant.plant_type)
+                   for plant in level.soilLayer.plantSprites)
+
+    trees = tuple((cx, cy, i, tree.health, tree.alive, sum(1 << apple.appleIndex for apple in tree.appleSprites))
+                  for (cx, cy), chunk in level.world.chunks.items() if chunk.trees
+                  for i, tree in enumerate(chunk.trees))
+
+    return SaveState(level.raining, level.finished, players, len(soilGrid), len(soilGrid[0]) if soilGrid else 0, grid, plants, trees)
+
+
+def encode(state):
+    data = [HEADER.pack(MAGIC, VERSION, state.raining, state.finished, len(state.players))]
+    for x, y, experience, gold, level, expToNext, axe, tomato, inventory in state.players:
+        data.append(PLAYER.pack(x, y, experience, gold, level, expToNext, axe, tomato, len(inventory)))
+        for item, amount in inventory:
+            data.append(packString(item) + ITEM.pack(amount))
+    data.append(GRID.pack(state.rows, state.columns) + state.grid)
+    data.append(COUNT.pack(len(state.plants)))
+    for x, y, age, timeLeft, plantType in state.plants:
+        data.append(PLANT.pack(x, y, age, timeLeft) + packString(plantType))
+    data.append(COUNT.pack(len(state.trees)))
+    data.extend(TREE.pack(*tree) for tree in state.trees)
+    return b''.join(data)
+
+
+def decode(buffer):
+    magic, version, raining, finished, playerCount = HEADER.unpack_from(buffer, 0)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError('Not a save from this version of the game')
+    offset = HEADER.size
+
+    players = []
+    for _ in range(playerCount):
+        *values, itemCount = PLAYER.unpack_from(buffer, offset)
+        offset += PLAYER.size
+        inventory = []
+        for _ in range(itemCount):
+            item, offset = readString(buffer, offset)
+            inventory.append((item, ITEM.unpack_from(buffer, offset)[0]))
+            offset += ITEM.size
+        players.append(tuple(values) + (tuple(inventory),))
+
+    rows, columns = GRID.unpack_from(buffer, offset)
+    offset += GRID.size
+    grid = bytes(buffer[offset:offset + rows * columns])
+    offset += rows * columns
+
+    plantCount, = COUNT.unpack_from(buffer, offset)
+    offset += COUNT.size
+    plants = []
+    for _ in range(plantCount):
+        values = PLANT.unpack_from(buffer, offset)
+        plantType, offset = readString(buffer, offset + PLANT.size)
+        plants.append(values + (plantType,))
+
+    treeCount, = COUNT.unpack_from(buffer, offset)
+    offset += COUNT.size
+    trees = [TREE.unpack_from(buffer, offset + i * TREE.size) for i in range(treeCount)]
+
+    return SaveState(raining, finished, tuple(players), rows, columns, grid, tuple(plants), tuple(trees))
+
+
+def writeSave(path, state):
+    # Write to a temp file first so a crash mid save never leaves a broken save behind
+    try:
+        with open(path + '.tmp', 'wb') as f:
+            f.write(encode(state))
+        os.replace(path + '.tmp', path)
+    except OSError as e:
+        print(f"Warning: Could not write save: {e}")
+
+
+def readSave(path):
+    """Returns the SaveState stored at path, or None if there isn't a usable one."""
+    try:
+        with open(path, 'rb') as f:
+            return decode(f.read())
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, struct.error) as e:
+        print(f"Warning: Could not load save: {e}")
+        return None
+
+
+def applySteps(level, state):
+    """Applies a save to the level, yielding between steps so it can be spread over frames."""
+    for player, (x, y, experience, gold, playerLevel, expToNext, axe, tomato, inventory) in zip(level.players, state.players):
+        player.pos.update(x, y)
+        player.rect.center = (round(x), round(y))
+        player.hitbox.center = player.rect.center
+        player.experience = experience
+        player.gold = gold
+        player.level = playerLevel
+        player.exp_to_next_level = expToNext
+        player.tomato_unlocked = tomato
+        if axe and not player.axe_unlocked:
+            player.axe_unlocked = True
+            player.tools.insert(1, 'axe')
+        player.itemInventory.update(inventory)
+    level.raining = state.raining
+    yield
+
+    columns = state.columns
+    grid = [[[mark for mark, bit in CELL_FLAGS.items() if state.grid[row * columns + col] & bit] for col in range(columns)]
+            for row in range(state.rows)]
+    level.soilLayer.restoreGrid(grid)
+    yield
+
+    for i, (x, y, age, timeLeft, plantType) in enumerate(state.plants):
+        level.soilLayer.restorePlant(x, y, plantType, age, timeLeft)
+        if i % LOAD_STEP == LOAD_STEP - 1:
+            yield
+
+    for i, (cx, cy, index, health, alive, apples) in enumerate(state.trees):
+        trees = level.world.chunkTrees((cx, cy))
+        if index < len(trees):
+            trees[index].restore(health, alive, [bit for bit in range(8) if apples & (1 << bit)])
+        if i % LOAD_STEP == LOAD_STEP - 1:
+            yield
+
+
+class Autosaver:
+    """Writes snapshots to disk on a background thread, one save at a time."""
+    def __init__(self, path = SAVE_PATH):
+        self.path = path
+        self.thread = None
+
+    def busy(self):
+        return self.thread is not None and self.thread.is_alive()
+
+    def save(self, state):
+        # Skip this save if the last one is still being written, the next will catch up
+        if self.busy():
+            return False
+        self.thread = threading.Thread(target = writeSave, args = (self.path, state), daemon = True)
+        self.thread.start()
+        return True
+
+    def wait(self):
+        if self.thread is not None:
+            self.thread.join()
@@ -0,0 +1,54 @@
+import heapq
+from itertools import count
+
+
+class ScheduledEvent:
+    def __init__(self, due, func, args):
+        self.due = due
+        self.func = func
+        self.args = args
+        # Set once the event has fired or been cancelled
+        self.done = False
+
+    def cancel(self):
+        self.done = True
+
+
+class Scheduler:
+    """Fires callbacks once game time reaches their due time.
+
+    Game time only moves forward through update(dt), so everything scheduled
+    here pauses along with the owner (e.g. while the victory screen is up).
+    Per frame cost depends on the number of events due, not on how many
+    things are waiting.
+    """
+    def __init__(self):
+        self.currentTime = 0
+        self.events = []
+        # Tie breaker so events due at the same time fire in scheduling order
+        self.counter = count()
+
+    def schedule(self, delay, func, *args):
+        """Call func(*args) after delay seconds of game time. Returns the event so it can be cancelled."""
+        event = ScheduledEvent(self.currentTime + delay, func, args)
+        heapq.heappush(self.events, (event.due, next(self.counter), event))
+        return event
+
+    def cancel(self, event):
+        if event is not None:
+            event.cancel()
+
+    def timeLeft(self, event):
+        """Seconds of game time until the event fires (0 if it already has)."""
+        if event is None or event.done:
+            return 0
+        return max(0, event.due - self.currentTime)
+
+    def update(self, dt):
+        self.currentTime += dt
+        # Pop everything that is due, cancelled events are just skipped
+        while self.events and self.events[0][0] <= self.currentTime:
+            event = heapq.heappop(self.events)[2]
+            if not event.done:
+                event.done = True
+                event.func(*event.args)
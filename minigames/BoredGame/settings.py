@@ -16,6 +16,9 @@ PLAYER_TOOL_OFFSET = {
 	'down': Vector2(0,50)
 }
 
+# Spawn offsets from the map start point for players 1-4
+PLAYER_SPAWN_OFFSETS = [(0, 0), (96, 0), (-96, 0), (0, 96)]
+
 LAYERS = {
 	'water': 0,
 	'ground': 1,
@@ -31,6 +34,25 @@ LAYERS = {
 	'rain drops': 11
 }
 
+# World chunks: size in tiles, and how far past a view (pixels) chunks are loaded / kept before unloading
+CHUNK_TILES = 8
+CHUNK_LOAD_MARGIN = 256
+CHUNK_EVICT_MARGIN = 768
+
+# Save file, autosaved every AUTOSAVE_INTERVAL seconds of game time and at the end of each day
+SAVE_PATH = './savegame.sav'
+AUTOSAVE_INTERVAL = 15
+
+# Particle pool limits (alive at once / emitted per frame)
+PARTICLE_CAPACITY = 4096
+PARTICLE_SPAWN_BUDGET = 256
+
+# Rain: chance of a rainy day, particles per second per 1000x1000 pixels of view, drop speed
+RAIN_CHANCE = 0.25
+RAIN_DROP_RATE = 400
+RAIN_FLOOR_RATE = 150
+RAIN_DROP_VELOCITY = (-400, 800)
+
 APPLE_POS = {
 	'Small': [(18,17), (30,37), (12,50), (30,45), (20,30), (30,10)],
 	'Large': [(30,24), (60,65), (50,50), (16,40),(45,50), (42,70)]
@@ -1,6 +1,5 @@
 import pygame
 from settings import *
-from pytmx.util_pygame import load_pygame
 from helpful import *
 import random
 
@@ -10,7 +9,7 @@ class Plant(pygame.sprite.Sprite):
         self.plant_type = plant_type
         self.age = 0
         self.max_age = 4
-        self.growth_timer = 0  # Timer for 1-minute intervals
+        self.growth_event = None  # Scheduled next growth stage
         self.fully_grown = False
         
         # Load plant images
@@ -42,7 +41,7 @@ class SoilTile(pygame.sprite.Sprite):
 
 
 class SoilLayer:
-    def __init__(self,allSprites):
+    def __init__(self,allSprites,scheduler,mapData):
 
 
         # sprite groups
@@ -51,6 +50,10 @@ class SoilLayer:
         self.waterSprites = pygame.sprite.Group()
         self.plantSprites = pygame.sprite.Group()
 
+        # Plant growth is driven by scheduled events instead of per frame timers
+        self.scheduler = scheduler
+        # 22.5 seconds per growth stage (90 seconds total / 4 stages)
+        self.growth_interval = 22.5
 
         # Soil Images
         self.soilSurf = pygame.image.load('./graphics/soil/o.png')
@@ -70,7 +73,7 @@ class SoilLayer:
             self.hover_surf_red.set_alpha(100)
             self.hover_surf_red.fill((255, 0, 0))
         # Create grid
-        self.createSoilGrid()
+        self.createSoilGrid(mapData)
 
         # Create hitboxes
         self.createHitbox()
@@ -82,14 +85,14 @@ class SoilLayer:
 
         # Contains Plant?
 
-    def createSoilGrid(self):
+    def createSoilGrid(self, mapData):
         groundImage = pygame.image.load('./graphics/world/ground.png')
         hLength = groundImage.get_width() // TILE_SIZE
         vLength = groundImage.get_height() // TILE_SIZE
         
         self.grid = [  [[] for col in range(hLength)  ] for row in range(vLength) ]
         try:
-            for x, y, surface in load_pygame('./map/map.tmx').get_layer_by_name('Farmable').tiles():
+            for x, y, surface in mapData.get_layer_by_name('Farmable').tiles():
                 self.grid[y][x].append('F')
         except Exception as e:
             print(f"Warning: Could not load tilemap: {e}")
@@ -166,7 +169,8 @@ class SoilLayer:
                 if 'X' in self.grid[y][x] and 'P' not in self.grid[y][x]:
                     self.grid[y][x].append('P')  # Mark as planted
                     # Create plant sprite
-                    Plant(seedType, (rect.x, rect.y), [self.allSprites, self.plantSprites])
+                    plant = Plant(seedType, (rect.x, rect.y), [self.allSprites, self.plantSprites])
+                    plant.growth_event = self.scheduler.schedule(self.growth_interval, self.growPlant, plant)
                     return True
         return False
 
@@ -205,22 +209,22 @@ class SoilLayer:
                         # Create water tile sprite
                         WaterTile((rect.x, rect.y), [self.allSprites, self.waterSprites])
 
-    def updatePlants(self, dt):
-        """Update plant growth over time - 22.5 second intervals for 1.5 minute total."""
-        for plant in self.plantSprites:
-            if not plant.fully_grown:
-                plant.growth_timer += dt
-                # 22.5 seconds per growth stage (90 seconds total / 4 stages)
-                if plant.growth_timer >= 22.5:
-                    plant.age += 1
-                    plant.growth_timer = 0
-                    
-                    if plant.age >= plant.max_age:
-                        plant.age = plant.max_age
-                        plant.fully_grown = True
-                    
-                    # Update plant image
-                    plant.image = plant.frames[plant.age]
+    def growPlant(self, plant):
+        """Advance a plant one growth stage and schedule the next one."""
+        plant.growth_event = None
+        # Plant was removed before it finished growing
+        if not plant.alive():
+            return
+
+        plant.age += 1
+        if plant.age >= plant.max_age:
+            plant.age = plant.max_age
+            plant.fully_grown = True
+        else:
+            plant.growth_event = self.scheduler.schedule(self.growth_interval, self.growPlant, plant)
+
+        # Update plant image
+        plant.image = plant.frames[plant.age]
 
     def harvestPlant(self, hitLocation):
         """Harvest a fully grown plant. Returns plant type if successful."""
@@ -237,10 +241,36 @@ class SoilLayer:
                             plant_type = plant.plant_type
                             # Remove plant from grid and sprite
                             self.grid[y][x].remove('P')
+                            self.scheduler.cancel(plant.growth_event)
                             plant.kill()
                             return plant_type
         return None
 
+    def restoreGrid(self, grid):
+        """Replace the soil grid with one from a save, rebuilding the soil and water sprites."""
+        for plant in self.plantSprites:
+            self.scheduler.cancel(plant.growth_event)
+            plant.kill()
+        for sprite in self.waterSprites:
+            sprite.kill()
+
+        self.grid = grid
+        for rowNum,row in enumerate(self.grid):
+            for tileNum,tile in enumerate(row):
+                if 'W' in tile:
+                    WaterTile((tileNum * TILE_SIZE, rowNum * TILE_SIZE), [self.allSprites, self.waterSprites])
+        self.createSoilTiles()
+
+    def restorePlant(self, x, y, plantType, age, timeLeft):
+        """Put back a plant from a save on tile (x, y), timeLeft seconds away from its next growth stage."""
+        plant = Plant(plantType, (x * TILE_SIZE, y * TILE_SIZE), [self.allSprites, self.plantSprites])
+        plant.age = min(age, plant.max_age)
+        plant.image = plant.frames[plant.age]
+        if plant.age >= plant.max_age:
+            plant.fully_grown = True
+        else:
+            plant.growth_event = self.scheduler.schedule(timeLeft, self.growPlant, plant)
+
     def getHoveredTile(self, mousePos):
         """Get the tile position under mouse cursor."""
         for rect in self.hitBoxes:
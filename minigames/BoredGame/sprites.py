@@ -25,55 +25,45 @@ class Interactions(Ordinary):
 
 
 
-class Particle(Ordinary):
-    def __init__(self, pos, surface, groups, z, time = 200):
-        super().__init__(pos, surface, groups, z)
-
-
-
-        self.startTime = pygame.time.get_ticks()
-        self.duration = time
-
+class Animation:
+    """Frames shared by every sprite playing them in lockstep, advanced once per frame for all of them."""
+    def __init__(self, frames, speed = 8):
+        self.frames = frames
+        self.speed = speed
+        self.frameNum = 0
+        self.image = self.frames[0]
 
-        # Creating the white surface
-        maskSurface = pygame.mask.from_surface(self.image)
-        particleSurface = maskSurface.to_surface()
-        particleSurface.set_colorkey((0,0,0))
-        self.image = particleSurface
+    def update(self,dt):
+        self.frameNum += self.speed * dt
 
+        # ensure we dont go over the amount of frames we have for an animation
+        if self.frameNum >= len(self.frames):
+            self.frameNum = 0
 
-    def update(self,dt):
-        currTime = pygame.time.get_ticks()
-        if currTime - self.startTime > self.duration:
-            self.kill()
+        self.image = self.frames[int(self.frameNum)]
 
 class waterSprite(Ordinary):
-    def __init__(self, pos, animationFrame, groups):
+    def __init__(self, pos, animation, groups):
 
         #animation
-        self.animation = animationFrame
-        self.frameNum = 0
+        self.animation = animation
 
         #sprite creation
         super().__init__(
                             pos = pos, 
-                            surface = self.animation[self.frameNum], 
+                            surface = self.animation.image, 
                             groups = groups,
                             z = LAYERS['water']
         )
 
+    # Water tiles always show the shared animation's current frame
+    @property
+    def image(self):
+        return self.animation.image
 
-    def animateWater(self,dt):
-        self.frameNum += 8 * dt
-
-        # ensure we dont go over the amount of frames we have for an animation
-        if self.frameNum >= len(self.animation):
-            self.frameNum = 0
-
-        self.image = self.animation[int(self.frameNum)]
-
-    def update(self,dt):
-        self.animateWater(dt)
+    @image.setter
+    def image(self, surface):
+        pass
         
 class natFlower(Ordinary):
     def __init__(self, pos, surface, groups):
@@ -81,7 +71,7 @@ class natFlower(Ordinary):
         self.hitbox = self.rect.copy().inflate(-20,-self.rect.height * 0.9)
 
 class Tree(Ordinary):
-    def  __init__(self, pos, surface, groups, name, inventoryAdd):
+    def  __init__(self, pos, surface, groups, name, inventoryAdd, particles, awakeSprites):
         super().__init__(pos,surface,groups,LAYERS['main'])
         self.name = name
 
@@ -104,46 +94,61 @@ class Tree(Ordinary):
 
 
         self.addToInventory = inventoryAdd
+        self.particles = particles
+        # Trees sleep until they are hit, damage() puts them in here for one update
+        self.awakeSprites = awakeSprites
+        # Player who last hit the tree gets the apples and wood
+        self.lastHitBy = None
 
-    def damage(self):
+    def damage(self, player=None):
         # Tick health down
         self.health -= 1
+        self.lastHitBy = player
+        self.awakeSprites.add(self)
         # Removing apples
         if len(self.appleSprites.sprites()) > 0:
             randomApple = choice(self.appleSprites.sprites())
-            Particle(
-                pos = randomApple.rect.topleft,
-                surface=randomApple.image,
-                groups= self.groups()[0],
-                z = LAYERS['fruit'],
-                time = 200)
+            self.particles.flash(randomApple.rect.topleft, randomApple.image, LAYERS['fruit'], 200)
             randomApple.kill()
-            self.addToInventory("apple")
+            self.addToInventory("apple", self.lastHitBy)
 
     def checkHealth(self):
         if self.health <= 0:
-            Particle(
-                pos = self.rect.topleft,
-                surface=self.image,
-                groups= self.groups()[0],
-                z = LAYERS['fruit'],
-                time = 300
-            )
-            # if tree is dead then set the trees image to the corresponding stump
-            self.image = self.stumpSurface
-            # Create a new rect that has an equivalent mid bottom
-            self.rect = self.image.get_rect(midbottom = self.rect.midbottom)
-            # Copy that rect into our hitbox but make it slightly narrower and much shorter
-            self.hitbox = self.rect.copy().inflate(-10, -self.rect.height * 0.6)
-            self.alive = False
-            self.addToInventory('wood')
-
-    def createApples(self):
+            self.particles.flash(self.rect.topleft, self.image, LAYERS['fruit'], 300)
+            self.becomeStump()
+            self.addToInventory('wood', self.lastHitBy)
+
+    def becomeStump(self):
+        # if tree is dead then set the trees image to the corresponding stump
+        self.image = self.stumpSurface
+        # Create a new rect that has an equivalent mid bottom
+        self.rect = self.image.get_rect(midbottom = self.rect.midbottom)
+        # Copy that rect into our hitbox but make it slightly narrower and much shorter
+        self.hitbox = self.rect.copy().inflate(-10, -self.rect.height * 0.6)
+        self.alive = False
+
+    def createApples(self, positions = None):
+        # positions picks exact apple spots (loading a save), otherwise they are random
         for i, pos in enumerate(self.applePos):
-            if i == 0 or randint(0,10) < 2:
+            if positions is None:
+                grow = i == 0 or randint(0,10) < 2
+            else:
+                grow = i in positions
+            if grow:
                 x = pos[0] + self.rect.left
                 y = pos[1] + self.rect.top
-                Ordinary((x,y), self.applesSurface, [self.appleSprites, self.groups()[0]], z=LAYERS['fruit'])
+                # Parked trees (chunk not loaded) keep their apples out of the camera group
+                apple = Ordinary((x,y), self.applesSurface, [self.appleSprites] + self.groups()[:1], z=LAYERS['fruit'])
+                apple.appleIndex = i
+
+    def restore(self, health, alive, applePositions):
+        """Puts back the state from a save."""
+        self.health = health
+        for apple in self.appleSprites.sprites():
+            apple.kill()
+        self.createApples(applePositions)
+        if self.alive and not alive:
+            self.becomeStump()
 
 
 
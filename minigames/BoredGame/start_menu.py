@@ -1,5 +1,6 @@
 import pygame
 from settings import *
+from textcache import textCache
 
 class StartMenu:
     def __init__(self, screen):
@@ -65,16 +66,16 @@ class StartMenu:
             title_bottom = title_rect.bottom + 50
         
         # Player selection
-        player_text = self.font_medium.render(f"Players {self.num_players}", True, (255, 255, 255))
+        player_text = textCache.render(self.font_medium, f"Players {self.num_players}", (255, 255, 255))
         player_rect = player_text.get_rect(center=(screen_width // 2, title_bottom + 50))
         self.screen.blit(player_text, player_rect)
         
         # Instructions
-        up_text = self.font_small.render("UP or DOWN Change players", True, (200, 200, 200))
+        up_text = textCache.render(self.font_small, "UP or DOWN Change players", (200, 200, 200))
         up_rect = up_text.get_rect(center=(screen_width // 2, player_rect.bottom + 50))
         self.screen.blit(up_text, up_rect)
         
-        start_text = self.font_small.render("ENTER Start Game", True, (200, 200, 200))
+        start_text = textCache.render(self.font_small, "ENTER Start Game", (200, 200, 200))
         start_rect = start_text.get_rect(center=(screen_width // 2, up_rect.bottom + 40))
         self.screen.blit(start_text, start_rect)
         
@@ -0,0 +1,32 @@
+from collections import OrderedDict
+
+
+class TextCache:
+    """Keeps rendered text surfaces so the same string isn't rasterised every frame.
+
+    Entries are keyed by font, text and colour and the least recently used one
+    is dropped once the cache is full.
+    """
+    def __init__(self, maxSize = 512):
+        self.maxSize = maxSize
+        self.surfaces = OrderedDict()
+
+    def render(self, font, text, colour, antialias = True):
+        key = (font, text, colour, antialias)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            return surface
+
+        surface = font.render(text, antialias, colour)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.maxSize:
+            self.surfaces.popitem(last = False)
+        return surface
+
+    def clear(self):
+        self.surfaces.clear()
+
+
+# Shared by the overlays and menus
+textCache = TextCache()
@@ -1,21 +1,39 @@
 import pygame
 
 class Timer:
-    def __init__(self, duration, func = None):
+    def __init__(self, duration, func = None, scheduler = None):
         self.duration = duration
         self.func = func
         self.startTime = 0
         self.active = False
+        # When a scheduler is given the timer fires from it instead of being polled
+        self.scheduler = scheduler
+        self.event = None
 
     def activate(self):
         self.active = True
         self.startTime = pygame.time.get_ticks()
+        if self.scheduler:
+            self.scheduler.cancel(self.event)
+            # duration is in milliseconds, the scheduler runs in seconds
+            self.event = self.scheduler.schedule(self.duration / 1000, self.expire)
 
     def deactivate(self):
         self.active = False
         self.startTime = 0
+        if self.scheduler:
+            self.scheduler.cancel(self.event)
+            self.event = None
+
+    def expire(self):
+        if self.func:
+            self.func()
+        self.deactivate()
 
     def update(self):
+        # Scheduled timers have nothing to poll
+        if self.scheduler:
+            return
         currentTime = pygame.time.get_ticks()
         if currentTime - self.startTime >= self.duration:
             if self.func and self.startTime != 0:
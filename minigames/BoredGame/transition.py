@@ -2,10 +2,10 @@ import pygame
 from settings import *
 
 class Transition:
-    def __init__(self,reset,player):
+    def __init__(self,reset,players):
         self.display = pygame.display.get_surface()
         self.reset = reset
-        self.player = player
+        self.players = players
 
         # Overlay Image
         self.image = pygame.Surface((SCREEN_WIDTH,SCREEN_HEIGHT))
@@ -22,7 +22,9 @@ class Transition:
         # Ensure we dont go above 255
         if self.color > 255:
             self.color = 255
-            self.player.sleep = False
+            # Everyone wakes up together
+            for player in self.players:
+                player.sleep = False
             self.speed = -2
             
         
@@ -0,0 +1,199 @@
+"""
+Chunk streamed world.
+
+The map is split into square chunks of CHUNK_TILES tiles. At startup only the
+tile and object data is bucketed per chunk; sprites, collision tiles and the
+baked house floor surface of a chunk are built when a viewport gets near it
+and thrown away again once every viewport has moved far enough off. Trees
+hold state (health, stump, apples), so instead of being rebuilt they are
+parked out of the sprite groups while their chunk is unloaded.
+"""
+import pygame
+from settings import *
+from sprites import Ordinary, waterSprite, natFlower, Tree
+
+# Tile layers streamed per chunk and the layer they are drawn on (None = collision only)
+TILE_LAYERS = {
+    'HouseFloor': LAYERS['house bottom'],
+    'HouseFurnitureBottom': LAYERS['house bottom'],
+    'HouseWalls': LAYERS['main'],
+    'HouseFurnitureTop': LAYERS['main'],
+    'Fence': LAYERS['main'],
+    'Water': LAYERS['water'],
+    'Collision': None
+}
+
+
+class Chunk:
+    def __init__(self, rect):
+        self.rect = rect
+        # Raw map data, filled in once at startup
+        self.tiles = []
+        self.flowers = []
+        self.treeData = []
+        # Built while loaded
+        self.loaded = False
+        self.sprites = []
+        # Created on first load, parked while the chunk is unloaded
+        self.trees = None
+
+
+class World:
+    def __init__(self, mapData, allSprites, collisionSprites, treeSprites, awakeSprites, waterAnimation, particles, inventoryAdd):
+        self.allSprites = allSprites
+        self.collisionSprites = collisionSprites
+        self.treeSprites = treeSprites
+        self.awakeSprites = awakeSprites
+        self.waterAnimation = waterAnimation
+        self.particles = particles
+        self.addToInventory = inventoryAdd
+
+        # The pre-rendered ground, each chunk draws a subsurface of it
+        self.ground = pygame.image.load('./graphics/ground/ground.png').convert_alpha()
+        # Collision tiles are never drawn so they can all share one surface
+        self.collisionSurface = pygame.Surface((TILE_SIZE, TILE_SIZE))
+
+        self.chunkSize = CHUNK_TILES * TILE_SIZE
+        self.columns = -(-mapData.width // CHUNK_TILES)
+        self.rows = -(-mapData.height // CHUNK_TILES)
+        self.chunks = {(cx, cy): Chunk(pygame.Rect(cx * self.chunkSize, cy * self.chunkSize, self.chunkSize, self.chunkSize))
+                       for cx in range(self.columns) for cy in range(self.rows)}
+        self.loadedChunks = []
+        self.index(mapData)
+
+    def chunkAt(self, x, y):
+        cx = min(max(int(x) // self.chunkSize, 0), self.columns - 1)
+        cy = min(max(int(y) // self.chunkSize, 0), self.rows - 1)
+        return self.chunks[(cx, cy)]
+
+    def index(self, mapData):
+        for mapLayer in TILE_LAYERS:
+            for x, y, surface in mapData.get_layer_by_name(mapLayer).tiles():
+                # multiply by tile size so that you convert correctly from tiled
+                self.chunkAt(x * TILE_SIZE, y * TILE_SIZE).tiles.append((mapLayer, x * TILE_SIZE, y * TILE_SIZE, surface))
+
+        # Natrual Flowers : Main Layer
+        for flower in mapData.get_layer_by_name("Decoration"):
+            # Dont need to multiply as these are not tiles and therefore have pixel measurements
+            self.chunkAt(flower.x, flower.y).flowers.append((flower.x, flower.y, flower.image))
+
+        # Trees : Main Layer (filter out trees too close to edges and walkway area)
+        map_width = mapData.width * TILE_SIZE
+        map_height = mapData.height * TILE_SIZE
+        for tree in mapData.get_layer_by_name("Trees"):
+            # Skip trees too close to edges (within 200px of any edge)
+            # Skip trees in the walkway-enclosed area (approximate bounds)
+
+            # Edge filtering: 200px margin from all edges
+            if (tree.x < 200 or tree.x > map_width - 200 or
+                tree.y < 200 or tree.y > map_height - 200):
+                continue
+
+            # Walkway area filtering (approximate center area enclosed by walkway)
+            # Adjust these bounds based on your map's walkway layout
+            # This is a rough approximation - adjust as needed
+            walkway_left = 400
+            walkway_right = 1200
+            walkway_top = 300
+            walkway_bottom = 900
+
+            if (tree.x > walkway_left and tree.x < walkway_right and
+                tree.y > walkway_top and tree.y < walkway_bottom):
+                continue
+
+            self.chunkAt(tree.x, tree.y).treeData.append((tree.x, tree.y, tree.image, tree.name))
+
+    def trees(self):
+        """Every tree created so far, loaded or parked."""
+        return [tree for chunk in self.chunks.values() if chunk.trees for tree in chunk.trees]
+
+    def load(self, chunk):
+        sprites = chunk.sprites
+
+        # Creating the ground sprite
+        groundRect = chunk.rect.clip(self.ground.get_rect())
+        if groundRect.width and groundRect.height:
+            sprites.append(Ordinary(groundRect.topleft, self.ground.subsurface(groundRect), self.allSprites, LAYERS['ground']))
+
+        houseBottom = []
+        for mapLayer, x, y, surface in chunk.tiles:
+            z = TILE_LAYERS[mapLayer]
+            if mapLayer == 'Water':
+                sprites.append(waterSprite((x, y), self.waterAnimation, self.allSprites))
+            elif mapLayer == 'Collision':
+                sprites.append(Ordinary((x, y), self.collisionSurface, self.collisionSprites))
+            elif mapLayer == 'Fence':
+                sprites.append(Ordinary((x, y), surface, [self.allSprites, self.collisionSprites], z))
+            elif z == LAYERS['house bottom']:
+                houseBottom.append((x, y, surface))
+            else:
+                sprites.append(Ordinary((x, y), surface, self.allSprites, z))
+        if houseBottom:
+            sprites.append(self.bake(houseBottom, LAYERS['house bottom']))
+
+        for x, y, image in chunk.flowers:
+            sprites.append(natFlower((x, y), image, [self.allSprites, self.collisionSprites]))
+
+        if chunk.trees is None:
+            self.createTrees(chunk)
+        else:
+            for tree in chunk.trees:
+                # allSprites first, apples are added to the trees first group
+                tree.add(self.allSprites, self.collisionSprites, self.treeSprites)
+                self.allSprites.add(*tree.appleSprites)
+
+        chunk.loaded = True
+        self.loadedChunks.append(chunk)
+
+    def createTrees(self, chunk):
+        chunk.trees = [Tree((x, y), image, [self.allSprites, self.collisionSprites, self.treeSprites], name, self.addToInventory, self.particles, self.awakeSprites)
+                       for x, y, image, name in chunk.treeData]
+        return chunk.trees
+
+    def chunkTrees(self, key):
+        """The trees of a chunk, created (and parked if the chunk is unloaded) if they dont exist yet."""
+        chunk = self.chunks[key]
+        if chunk.trees is None:
+            self.createTrees(chunk)
+            if not chunk.loaded:
+                self.parkTrees(chunk)
+        return chunk.trees
+
+    def parkTrees(self, chunk):
+        for tree in chunk.trees:
+            tree.kill()
+            # Removing the apples from the camera only, the tree keeps them
+            self.allSprites.remove(*tree.appleSprites)
+
+    def bake(self, tiles, z):
+        """Blits tiles that share a layer into one sprite, in the order the camera would draw them."""
+        rect = pygame.Rect(tiles[0][0], tiles[0][1], 0, 0).unionall([pygame.Rect((x, y), surface.get_size()) for x, y, surface in tiles])
+        surface = pygame.Surface(rect.size, pygame.SRCALPHA)
+        tiles.sort(key = lambda tile: tile[1] + tile[2].get_height() // 2)
+        surface.blits([(image, (x - rect.x, y - rect.y)) for x, y, image in tiles], False)
+        return Ordinary(rect.topleft, surface, self.allSprites, z)
+
+    def unload(self, chunk):
+        for sprite in chunk.sprites:
+            sprite.kill()
+        chunk.sprites = []
+        self.parkTrees(chunk)
+        chunk.loaded = False
+        self.loadedChunks.remove(chunk)
+
+    def update(self, views):
+        """Loads the chunks near any of the views and unloads those that every view has left."""
+        size = self.chunkSize
+        for view in views:
+            area = view.inflate(CHUNK_LOAD_MARGIN * 2, CHUNK_LOAD_MARGIN * 2)
+            for cx in range(max(area.left // size, 0), min(area.right // size + 1, self.columns)):
+                for cy in range(max(area.top // size, 0), min(area.bottom // size + 1, self.rows)):
+                    chunk = self.chunks[(cx, cy)]
+                    if not chunk.loaded:
+                        self.load(chunk)
+
+        # Unloading further out than loading so chunks on the edge dont flicker in and out
+        keepAreas = [view.inflate(CHUNK_EVICT_MARGIN * 2, CHUNK_EVICT_MARGIN * 2) for view in views]
+        for chunk in self.loadedChunks[:]:
+            if chunk.rect.collidelist(keepAreas) == -1:
+                self.unload(chunk)
@@ -1,21 +1,53 @@
+"""
+Legacy level registry
+A level's module sets up its window and background when it is imported, so levels are
+only imported when they are played and forgotten again when they end. Startup doesn't pay
+for all five and only the level being played keeps its surfaces around
+"""
+import gc
+import importlib
+import sys
 import pygame
-from Levels import level_one
-from Levels import level_two
-from Levels import level_three
-from Levels import level_four
-from Levels import level_five
+
+# Level number -> module that plays it
+LEVELS = {
+    1: 'Levels.level_one',
+    2: 'Levels.level_two',
+    3: 'Levels.level_three',
+    4: 'Levels.level_four',
+    5: 'Levels.level_five',
+}
+
+def load_level(level):
+    """Import a level's module, returns None if it can't be loaded"""
+    try:
+        return importlib.import_module(LEVELS[level])
+    except ImportError as e:
+        print(f"Warning: Could not load level {level}: {e}")
+        return None
+
+def unload_level(level):
+    """Drop a level's module so its background and level state are freed"""
+    name = LEVELS[level]
+    sys.modules.pop(name, None)
+    package = sys.modules.get('Levels')
+    attribute = name.rsplit('.', 1)[1]
+    if package is not None and hasattr(package, attribute):
+        delattr(package, attribute)
+    # Module globals and the Level() functions reference each other, collect them now
+    gc.collect()
 
 async def play_level(level):
     pygame.display.flip()
     pygame.event.pump()
-    pygame.time.wait(100) 
-    if level == 1:
-        await level_one.Level()
-    elif level == 2:
-        await level_two.Level()
-    elif level == 3:
-        await level_three.Level()
-    elif level == 4:
-        await level_four.Level()
-    elif level == 5:
-        await level_five.Level()
\ No newline at end of file
+    pygame.time.wait(100)
+    if level not in LEVELS:
+        return
+    module = load_level(level)
+    if module is None:
+        return
+    try:
+        await module.Level()
+    finally:
+        del module
+        unload_level(level)
@@ -0,0 +1,241 @@
+"""
+Batch physics for large numbers of cubes
+Positions and velocities of every body are kept in NumPy arrays, one row per body, and each
+step (gravity, sweeping into platforms, screen edges, body to body contacts, player pushes)
+works on the whole batch at once instead of looping over cube objects in Python.
+Bodies follow the same rules as CubeObj: weight is added to the fall speed every move,
+speed decays by 0.999, and bouncing off a wall scales the speed by the elasticity
+"""
+import os
+import numpy as np
+import pygame
+from Utils.GameScale import CUBE_SIZE
+
+class CubeBatch:
+    def __init__(self, count, area, platforms=(), weight=0.0999, elasticity=0.2, seed=None, size=CUBE_SIZE, passes=3):
+        """
+        Args:
+            count: Number of bodies
+            area: Rect the bodies are scattered over
+            platforms: Platforms the bodies bounce off
+            weight: Speed added downwards every move
+            elasticity: Speed kept after hitting a wall
+            seed: Seed for the spawn positions and velocities
+            passes: Collision passes per update
+        """
+        rng = np.random.default_rng(seed)
+        self.size = size
+        self.weight = weight
+        self.elasticity = elasticity
+        self.passes = passes
+        self.set_platforms(platforms)
+        self.pos = self.scatter(count, area, rng)
+        self.vel = rng.uniform(-0.3, 0.3, (count, 2))
+
+        base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        try:
+            image = pygame.image.load(os.path.join(base_dir, 'Assets', 'CompanionCube_Asset.png')).convert_alpha()
+            self.image = pygame.transform.scale(image, (size, size))
+        except (pygame.error, FileNotFoundError) as e:
+            print(f"Warning: Could not load cube image: {e}")
+            self.image = pygame.Surface((size, size))
+            self.image.fill((180, 180, 190))
+
+    def __len__(self):
+        return len(self.pos)
+
+    def set_platforms(self, platforms):
+        """Platforms the bodies bounce off, call again if platforms turn on or off"""
+        # Rows of (left, top, right, bottom)
+        walls = [(p.rect.left, p.rect.top, p.rect.right, p.rect.bottom) for p in platforms if p.active and not p.collision == 1]
+        self.walls = np.array(walls, dtype=float).reshape(-1, 4)
+
+    def scatter(self, count, area, rng):
+        """Spawn positions on free cube sized cells of area, clear of the platforms"""
+        size = self.size
+        step = size + 2
+        xs, ys = np.meshgrid(np.arange(area.left, area.right - size + 1, step), np.arange(area.top, area.bottom - size + 1, step))
+        cells = np.column_stack((xs.ravel(), ys.ravel())).astype(float)
+        if len(self.walls):
+            left, top, right, bottom = self.walls.T
+            x, y = cells[:, :1], cells[:, 1:]
+            blocked = ((x + size > left) & (x < right) & (y + size > top) & (y < bottom)).any(axis=1)
+            cells = cells[~blocked]
+        if not len(cells):
+            cells = np.array([area.topleft], dtype=float)
+        # With more bodies than cells some start on top of each other and get pushed apart
+        return cells[rng.choice(len(cells), count, replace=count > len(cells))]
+
+    def update(self, dt, width, height, obstacles=()):
+        """Move every body by one step
+        obstacles: rects (players) that push bodies out of the way
+        """
+        if not len(self.pos):
+            return
+        start = self.pos.copy()
+        self.vel[:, 1] += self.weight
+        self.pos += self.vel * dt
+        self.vel *= 0.999
+
+        self.sweep_walls(start)
+        self.keep_on_screen(width, height)
+        obstacles = np.array([(rect.left, rect.top, rect.right, rect.bottom) for rect in obstacles], dtype=float).reshape(-1, 4)
+        # Separating one pair can push a body into another or into a platform, a few
+        # passes settle piles
+        for _ in range(self.passes):
+            self.collide_bodies()
+            self.push_out(obstacles)
+            self.push_out(self.walls)
+        self.keep_on_screen(width, height)
+
+    def sweep_walls(self, start):
+        """Stop bodies at the first platform they crossed since start, every body against every
+        platform in one go, so fast bodies can't pass through thin platforms
+        """
+        if not len(self.walls):
+            return
+        size = self.size
+        move = self.pos - start
+        # Bodies down the rows, platforms across the columns
+        x, y = start[:, :1], start[:, 1:]
+        dx, dy = move[:, :1], move[:, 1:]
+        left, top, right, bottom = self.walls.T
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            entry_x = np.where(dx > 0, (left - (x + size)) / dx, (right - x) / dx)
+            exit_x = np.where(dx > 0, (right - x) / dx, (left - (x + size)) / dx)
+            entry_y = np.where(dy > 0, (top - (y + size)) / dy, (bottom - y) / dy)
+            exit_y = np.where(dy > 0, (bottom - y) / dy, (top - (y + size)) / dy)
+        # Not moving on an axis, either always lined up with the platform on it or never
+        still = np.broadcast_to(dx == 0, entry_x.shape)
+        inside = (x + size > left) & (x < right)
+        entry_x[still] = np.where(inside[still], -np.inf, np.inf)
+        exit_x[still] = np.inf
+        still = np.broadcast_to(dy == 0, entry_y.shape)
+        inside = (y + size > top) & (y < bottom)
+        entry_y[still] = np.where(inside[still], -np.inf, np.inf)
+        exit_y[still] = np.inf
+
+        entry = np.maximum(entry_x, entry_y)
+        valid = (entry >= 0) & (entry <= 1) & (entry < np.minimum(exit_x, exit_y))
+        entry[~valid] = np.inf
+        wall = np.argmin(entry, axis=1)
+        body = np.arange(len(start))
+        first = entry[body, wall]
+        hit = np.isfinite(first)
+        if not hit.any():
+            return
+        body, wall, first = body[hit], wall[hit], first[hit]
+        # Landing wins ties on corners, same as swept_aabb
+        side = entry_x[body, wall] > entry_y[body, wall]
+        self.pos[body] = start[body] + move[body] * first[:, None]
+
+        wall_left, wall_top, wall_right, wall_bottom = self.walls[wall].T
+        step_x, step_y = move[body, 0], move[body, 1]
+        self.pos[body[side], 0] = np.where(step_x > 0, wall_left - size, wall_right)[side]
+        self.pos[body[~side], 1] = np.where(step_y > 0, wall_top - size, wall_bottom)[~side]
+        self.vel[body[side], 0] *= -1
+        self.vel[body[~side], 1] *= -1
+        self.vel[body] *= self.elasticity
+
+    def collide_bodies(self):
+        """Separate overlapping bodies along the shallower axis and bounce them off each other"""
+        count = len(self.pos)
+        if count < 2:
+            return
+        size = self.size
+        x, y = self.pos[:, 0], self.pos[:, 1]
+        # Sort along x so each body only has to be compared with the next few, bodies more
+        # than one size apart on x can't touch
+        order = np.argsort(x)
+        sx = x[order]
+        first, second = [], []
+        for offset in range(1, count):
+            near = sx[offset:] - sx[:-offset] < size
+            if not near.any():
+                break
+            index = np.nonzero(near)[0]
+            first.append(order[index])
+            second.append(order[index + offset])
+        if not first:
+            return
+        i = np.concatenate(first)
+        j = np.concatenate(second)
+        gap_x = x[j] - x[i]
+        gap_y = y[j] - y[i]
+        overlap_x = size - np.abs(gap_x)
+        overlap_y = size - np.abs(gap_y)
+        touching = (overlap_x > 0) & (overlap_y > 0)
+        if not touching.any():
+            return
+        i, j = i[touching], j[touching]
+        gap_x, gap_y = gap_x[touching], gap_y[touching]
+        overlap_x, overlap_y = overlap_x[touching], overlap_y[touching]
+
+        along_x = overlap_x < overlap_y
+        normal = np.zeros((len(i), 2))
+        normal[along_x, 0] = np.where(gap_x[along_x] < 0, -1, 1)
+        normal[~along_x, 1] = np.where(gap_y[~along_x] < 0, -1, 1)
+        depth = np.where(along_x, overlap_x, overlap_y)
+
+        # Side by side bodies share the push, in a stack the upper body takes all of it so piles
+        # build up from what they rest on instead of sinking into it
+        share = np.where(along_x, 0.5, np.where(normal[:, 1] > 0, 1.0, 0.0))
+        # A body touching several others averages their pushes instead of adding them up
+        contacts = np.bincount(i, share, count) + np.bincount(j, 1 - share, count)
+        scale = 1 / np.maximum(contacts, 1)
+        push = normal * depth[:, None]
+        np.add.at(self.pos, i, -push * (share * scale[i])[:, None])
+        np.add.at(self.pos, j, push * ((1 - share) * scale[j])[:, None])
+
+        # Bounce off each other along the normal, the same split as the push
+        closing = np.einsum('ij,ij->i', self.vel[j] - self.vel[i], normal)
+        impulse = np.where(closing < 0, -closing * (1 + self.elasticity), 0)
+        kick = normal * impulse[:, None]
+        np.add.at(self.vel, i, -kick * (share * scale[i])[:, None])
+        np.add.at(self.vel, j, kick * ((1 - share) * scale[j])[:, None])
+
+    def push_out(self, boxes):
+        """Move bodies overlapping any of boxes (rows of left, top, right, bottom) out of them
+        along the axis they overlap least, towards the side their centre is on so bodies pushed
+        deep into a thin platform don't come out the other side
+        """
+        if not len(boxes):
+            return
+        size = self.size
+        x, y = self.pos[:, :1], self.pos[:, 1:]
+        left, top, right, bottom = boxes.T
+        overlap_x = np.minimum(x + size, right) - np.maximum(x, left)
+        overlap_y = np.minimum(y + size, bottom) - np.maximum(y, top)
+        body, box = np.nonzero((overlap_x > 0) & (overlap_y > 0))
+        if not len(body):
+            return
+        rows = np.arange(len(body))
+        centre = self.pos[body] + size / 2
+        box_centre = np.column_stack(((left + right) / 2, (top + bottom) / 2))[box]
+        axis = (overlap_y[body, box] < overlap_x[body, box]).astype(int)
+        sign = np.where(centre[rows, axis] < box_centre[rows, axis], -1, 1)
+        # Distance to the edge on the pushed side
+        edges = boxes[box]
+        depth = np.where(axis == 0,
+                         np.where(sign < 0, self.pos[body, 0] + size - edges[:, 0], edges[:, 2] - self.pos[body, 0]),
+                         np.where(sign < 0, self.pos[body, 1] + size - edges[:, 1], edges[:, 3] - self.pos[body, 1]))
+        np.add.at(self.pos, (body, axis), sign * depth)
+        # Don't keep moving into the box
+        into = self.vel[body, axis] * sign < 0
+        self.vel[body[into], axis[into]] = 0
+
+    def keep_on_screen(self, width, height):
+        size = self.size
+        for axis, limit in ((0, width - size), (1, height - size)):
+            low = self.pos[:, axis] < 0
+            high = self.pos[:, axis] > limit
+            self.pos[low, axis] = 0
+            self.pos[high, axis] = limit
+            out = low | high
+            self.vel[out, axis] *= -1
+            self.vel[out] *= self.elasticity
+
+    def draw(self, screen):
+        image = self.image
+        screen.blits([(image, position) for position in self.pos.astype(int).tolist()], False)
@@ -2,6 +2,7 @@
 Professional character sprites - detailed pixel art style
 Much better than stick figures!
 """
+import os
 import pygame
 
 def create_character_sprite(color=(100, 150, 255), size=(64, 64), facing_right=True, is_running=False):
@@ -189,8 +190,13 @@ def create_player_sprites():
 _player_sprites_cache = None
 
 def get_player_sprites():
-    """Get cached player sprites"""
+    """Get cached player sprites, all 16 are frames of one atlas
+    The atlas is kept on disk and only redrawn when this file or the player size changes
+    """
     global _player_sprites_cache
     if _player_sprites_cache is None:
-        _player_sprites_cache = create_player_sprites()
+        from Utils.GameScale import PLAYER_WIDTH, PLAYER_HEIGHT
+        from Utils.SpriteAtlas import cached_atlas
+        _player_sprites_cache = cached_atlas('characters', [os.path.abspath(__file__)], create_player_sprites,
+                                             (PLAYER_WIDTH, PLAYER_HEIGHT))
     return _player_sprites_cache
@@ -0,0 +1,82 @@
+"""
+Swept AABB collision
+Moving boxes are tested along their whole path for the frame instead of only where they
+end up, so fast objects (bullets, players and cubes leaving a portal) can't skip through
+platforms thinner than the distance they move in one frame
+"""
+import math
+import pygame
+from Utils.Platform import platforms_near
+
+def swept_aabb(box, dx, dy, rect):
+    """Sweep box (x, y, width, height) by (dx, dy) against rect
+    Returns (time, normal): time of impact from 0 to 1 along the move and the normal of the
+    surface that was hit. Returns None if the path misses, or if box already overlaps rect
+    """
+    x, y, w, h = box
+
+    if dx > 0:
+        entry_x = (rect.left - (x + w)) / dx
+        exit_x = (rect.right - x) / dx
+    elif dx < 0:
+        entry_x = (rect.right - x) / dx
+        exit_x = (rect.left - (x + w)) / dx
+    elif x + w <= rect.left or x >= rect.right:
+        return None
+    else:
+        entry_x, exit_x = -math.inf, math.inf
+
+    if dy > 0:
+        entry_y = (rect.top - (y + h)) / dy
+        exit_y = (rect.bottom - y) / dy
+    elif dy < 0:
+        entry_y = (rect.bottom - y) / dy
+        exit_y = (rect.top - (y + h)) / dy
+    elif y + h <= rect.top or y >= rect.bottom:
+        return None
+    else:
+        entry_y, exit_y = -math.inf, math.inf
+
+    entry = max(entry_x, entry_y)
+    if entry < 0 or entry > 1 or entry >= min(exit_x, exit_y):
+        return None
+    # Landing wins ties on corners
+    if entry_x > entry_y:
+        return entry, (-1 if dx > 0 else 1, 0)
+    return entry, (0, -1 if dy > 0 else 1)
+
+def sweep(box, dx, dy, platforms, blocks=None):
+    """Find the first platform box runs into when moved by (dx, dy)
+    blocks(platform) decides which active platforms stop the box, default is all of them
+    Returns (time, normal, platform), or (1.0, None, None) if nothing is in the way
+    """
+    x, y, w, h = box
+    left = math.floor(min(x, x + dx))
+    top = math.floor(min(y, y + dy))
+    area = pygame.Rect(left, top, math.ceil(max(x, x + dx) + w) - left + 1, math.ceil(max(y, y + dy) + h) - top + 1)
+
+    result = (1.0, None, None)
+    for platform in platforms_near(platforms, area):
+        if not platform.active or (blocks and not blocks(platform)):
+            continue
+        hit = swept_aabb(box, dx, dy, platform.rect)
+        if hit and (result[2] is None or hit[0] < result[0]):
+            result = (hit[0], hit[1], platform)
+    return result
+
+def contact(box, dx, dy, time, normal, rect):
+    """Position of box after moving time of the way along (dx, dy)
+    The axis that hit is snapped flush to rect so rounding never leaves it overlapping
+    """
+    x = box[0] + dx * time
+    y = box[1] + dy * time
+    if normal:
+        if normal[0] < 0:
+            x = rect.left - box[2]
+        elif normal[0] > 0:
+            x = rect.right
+        elif normal[1] < 0:
+            y = rect.top - box[3]
+        else:
+            y = rect.bottom
+    return x, y
@@ -54,6 +54,26 @@ PHYSICS_SCALE = BASE_SCALE  # Scale physics to match visual scale
 JUMP_STRENGTH = 14 * BASE_SCALE  # Jump height scales with size
 GRAVITY_SCALE = 0.5 * BASE_SCALE  # Gravity scales with size
 
+# Movement in per second units, so it is the same at any frame rate
+# Tuned to play as the game did at PHYSICS_FPS frames a second
+PHYSICS_FPS = 60
+WALK_SPEED = 250 * BASE_SCALE  # pixels a second
+GRAVITY = GRAVITY_SCALE * PHYSICS_FPS * 50  # pixels a second gained every second of falling
+JUMP_FALL_SPEED = 250 * BASE_SCALE  # pixels a second down when the jump arc ends
+FALL_SCALE = 4  # falls off a ledge cover this many times the fall speed, as in the original levels
+JUMP_RATE = PHYSICS_FPS  # jump count used up a second
+# Share of horizontal speed left after a second of decay
+GROUND_FRICTION = 0.9 ** PHYSICS_FPS  # no input
+AIR_RESISTANCE = 0.98 ** PHYSICS_FPS
+LANDING_FRICTION = 0.5 ** PHYSICS_FPS
+STOP_SPEED = 0.6  # pixels a second, slower than this stops
+MOVING_SPEED = 6  # pixels a second, slower than this counts as standing still
+PORTAL_EXIT_SPEED_X = 60  # least speed out of a portal, pixels a second
+PORTAL_EXIT_SPEED_Y = 100
+WARP_COOLDOWN = 2000  # ms before the player can warp again
+RUN_FRAME_TIME = 5000 / PHYSICS_FPS  # ms each running frame is shown
+MAX_PHYSICS_STEP = 20  # ms, longer frames move the players in several steps so they can't skip a landing
+
 def scale_surface(surface, target_size=None, scale_factor=None):
     """Scale a surface by either target size or scale factor"""
     if target_size:
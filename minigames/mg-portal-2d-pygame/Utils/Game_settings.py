@@ -26,4 +26,22 @@ BULLET_LIFETIME = 1000
 PORTAL_SCALE = 0.2
 SPAWNED_PORTALS = 0
 PORTAL_COOLDOWN = 8
-MAX_PORTALS = 2
\ No newline at end of file
+MAX_PORTALS = 2
+TEAM_SIZE = 2
+PORTAL_GRID_CELL = 128
+
+#sprite settings
+ROTATION_STEP = 5
+#collision settings
+PLATFORM_GRID_CELL = 128
+#network settings
+NET_PORT = 5555
+NET_TICK_RATE = 20
+MAX_PLAYERS = 8
+#ghost settings
+GHOST_RATE = 60  # samples a second
+GHOST_SECONDS = 180  # longest run a recording holds, older samples are overwritten
+GHOST_EVENTS = 256  # portals a recording holds
+GHOST_COUNT = 4  # fastest runs kept for each level
+GHOST_ALPHA = 90
+GHOSTS_ENABLED = True
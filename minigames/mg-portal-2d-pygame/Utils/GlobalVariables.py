@@ -46,29 +46,47 @@ Player_size_Y = PLAYER_HEIGHT
 base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 assets_dir = os.path.join(base_dir, 'Assets')
 
-FirstPlayer_RightStandingImage = pygame.image.load(os.path.join(assets_dir, 'Cut_AvatarSprite_StandingStill_Blue.png')).convert_alpha()
-FirstPlayer_RightStandingImage = pygame.transform.scale(FirstPlayer_RightStandingImage, (Player_size_X, Player_size_Y))
-FirstPlayer_LeftStandingImage = pygame.transform.flip(FirstPlayer_RightStandingImage, True, False)
-FirstPlayer_RightRunningImage = pygame.image.load(os.path.join(assets_dir, 'Cut_AvatarSprite_Running_Blue.png')).convert_alpha()
-FirstPlayer_RightRunningImage = pygame.transform.scale(FirstPlayer_RightRunningImage, (Player_size_X, Player_size_Y))
-FirstPlayer_LeftRunningImage = pygame.transform.flip(FirstPlayer_RightRunningImage, True, False)
-
-SecondPlayer_RightStandingImage = pygame.image.load(os.path.join(assets_dir, 'Cut_AvatarSprite_StandingStill_Orange.png')).convert_alpha()
-SecondPlayer_RightStandingImage = pygame.transform.scale(SecondPlayer_RightStandingImage, (Player_size_X, Player_size_Y))
-SecondPlayer_LeftStandingImage = pygame.transform.flip(SecondPlayer_RightStandingImage, True, False)
-SecondPlayer_RightRunningImage = pygame.image.load(os.path.join(assets_dir, 'Cut_AvatarSprite_Running_Orange.png')).convert_alpha()
-SecondPlayer_RightRunningImage = pygame.transform.scale(SecondPlayer_RightRunningImage, (Player_size_X, Player_size_Y))
-SecondPlayer_LeftRunningImage = pygame.transform.flip(SecondPlayer_RightRunningImage, True, False)
-
-# Additional player colors (for 4 players)
-ThirdPlayer_RightStandingImage = FirstPlayer_RightStandingImage.copy()
-ThirdPlayer_LeftStandingImage = FirstPlayer_LeftStandingImage.copy()
-ThirdPlayer_RightRunningImage = FirstPlayer_RightRunningImage.copy()
-ThirdPlayer_LeftRunningImage = FirstPlayer_LeftRunningImage.copy()
-
-FourthPlayer_RightStandingImage = SecondPlayer_RightStandingImage.copy()
-FourthPlayer_LeftStandingImage = SecondPlayer_LeftStandingImage.copy()
-FourthPlayer_RightRunningImage = SecondPlayer_RightRunningImage.copy()
-FourthPlayer_LeftRunningImage = SecondPlayer_LeftStandingImage.copy()
-
-Medal_Image = pygame.image.load(os.path.join(assets_dir, 'medal.png')).convert_alpha()
+def load_avatar(name):
+    image = pygame.image.load(os.path.join(assets_dir, name)).convert_alpha()
+    return pygame.transform.scale(image, (Player_size_X, Player_size_Y))
+
+def create_avatars():
+    """Every avatar pose for the blue and orange players, plus the medal"""
+    avatars = {}
+    for colour in ('Blue', 'Orange'):
+        avatars[colour + '_RightStanding'] = load_avatar(f'Cut_AvatarSprite_StandingStill_{colour}.png')
+        avatars[colour + '_LeftStanding'] = pygame.transform.flip(avatars[colour + '_RightStanding'], True, False)
+        avatars[colour + '_RightRunning'] = load_avatar(f'Cut_AvatarSprite_Running_{colour}.png')
+        avatars[colour + '_LeftRunning'] = pygame.transform.flip(avatars[colour + '_RightRunning'], True, False)
+    avatars['Medal'] = pygame.image.load(os.path.join(assets_dir, 'medal.png')).convert_alpha()
+    return avatars
+
+# All avatars are frames of one atlas, cached on disk
+from Utils.SpriteAtlas import cached_atlas
+
+avatar_files = [f'Cut_AvatarSprite_{pose}_{colour}.png' for colour in ('Blue', 'Orange') for pose in ('StandingStill', 'Running')]
+avatars = cached_atlas('avatars', [os.path.join(assets_dir, name) for name in avatar_files + ['medal.png']],
+                       create_avatars, (Player_size_X, Player_size_Y))
+
+FirstPlayer_RightStandingImage = avatars['Blue_RightStanding']
+FirstPlayer_LeftStandingImage = avatars['Blue_LeftStanding']
+FirstPlayer_RightRunningImage = avatars['Blue_RightRunning']
+FirstPlayer_LeftRunningImage = avatars['Blue_LeftRunning']
+
+SecondPlayer_RightStandingImage = avatars['Orange_RightStanding']
+SecondPlayer_LeftStandingImage = avatars['Orange_LeftStanding']
+SecondPlayer_RightRunningImage = avatars['Orange_RightRunning']
+SecondPlayer_LeftRunningImage = avatars['Orange_LeftRunning']
+
+# Additional player colors (for 4 players), same frames as players 1 and 2
+ThirdPlayer_RightStandingImage = FirstPlayer_RightStandingImage
+ThirdPlayer_LeftStandingImage = FirstPlayer_LeftStandingImage
+ThirdPlayer_RightRunningImage = FirstPlayer_RightRunningImage
+ThirdPlayer_LeftRunningImage = FirstPlayer_LeftRunningImage
+
+FourthPlayer_RightStandingImage = SecondPlayer_RightStandingImage
+FourthPlayer_LeftStandingImage = SecondPlayer_LeftStandingImage
+FourthPlayer_RightRunningImage = SecondPlayer_RightRunningImage
+FourthPlayer_LeftRunningImage = SecondPlayer_LeftStandingImage
+
+Medal_Image = avatars['Medal']
@@ -38,11 +38,6 @@ def load_image(name, scale=None, subdir=None):
             return None
     return None
 
-# Load existing assets
-companion_cube_img = load_image('CompanionCube_Asset.png')
-cube_spawner_img = load_image('Cube_Spawner.png')
-exit_door_closed = load_image('ExitDoor_Closed.png', (75, 150))
-exit_door_open = load_image('ExitDoor_Open.png', (150, 150))
 
 def create_broken_block_surface(size=40):
     """Create a broken/damaged block texture"""
@@ -130,6 +125,9 @@ def get_broken_block(size=40):
     """Get or create broken block surface
     Tries to load from Assets/blocks/ first, falls back to programmatic generation
     """
+    name = f'broken_block_{size}'
+    if name in props:
+        return props[name]
     if size not in _broken_block_cache:
         # Try to load sprite file first
         sprite = load_image(f'broken_block_{size}.png', subdir='blocks')
@@ -162,6 +160,9 @@ def get_checkered_flag(size=60):
     Tries to load from Assets/props/ first, falls back to programmatic generation
     """
     global _checkered_flag_cache
+    name = f'checkered_flag_{size}'
+    if name in props:
+        return props[name]
     if _checkered_flag_cache is None:
         # Try to load sprite file first
         sprite = load_image('checkered_flag.png', scale=(size, size), subdir='props')
@@ -177,6 +178,9 @@ def get_glass_tube(width=40, height=120):
     Tries to load from Assets/props/ first, falls back to programmatic generation
     """
     global _glass_tube_cache
+    name = f'glass_tube_{width}x{height}'
+    if name in props:
+        return props[name]
     if _glass_tube_cache is None:
         # Try to load sprite file first
         sprite = load_image('glass_tube.png', scale=(width, height), subdir='props')
@@ -191,6 +195,9 @@ def get_wall_bar(is_yellow=True, width=10, height=60):
     """Get or create wall bar
     Tries to load from Assets/props/ first, falls back to programmatic generation
     """
+    name = f"wall_bar_{'yellow' if is_yellow else 'blue'}_{width}x{height}"
+    if name in props:
+        return props[name]
     key = (is_yellow, width, height)
     if key not in _wall_bar_cache:
         # Try to load sprite file first
@@ -203,6 +210,57 @@ def get_wall_bar(is_yellow=True, width=10, height=60):
             _wall_bar_cache[key] = create_wall_bar_surface(is_yellow, width, height)
     return _wall_bar_cache[key]
 
+# Props drawn at the sizes the game uses, packed into one atlas. Other sizes are made on
+# demand by the getters above and kept in their own caches
+from Utils.GameScale import DOOR_WIDTH, DOOR_HEIGHT
+
+PROP_IMAGES = [
+    # frame name, file, subdirectory, scale
+    ('companion_cube', 'CompanionCube_Asset.png', None, None),
+    ('cube_spawner', 'Cube_Spawner.png', None, None),
+    ('exit_door_closed', 'ExitDoor_Closed.png', None, (75, 150)),
+    ('exit_door_open', 'ExitDoor_Open.png', None, (150, 150)),
+]
+BLOCK_SIZES = (40, 60, 80)
+FLAG_SIZE = 60
+WALL_BAR_SIZE = (10, 60)
+
+def create_props():
+    """Every prop for the atlas, from Assets where there's a file, drawn otherwise"""
+    props = {}
+    for name, filename, subdir, scale in PROP_IMAGES:
+        image = load_image(filename, scale, subdir)
+        if image:
+            props[name] = image
+    for size in BLOCK_SIZES:
+        props[f'broken_block_{size}'] = load_image(f'broken_block_{size}.png', subdir='blocks') or create_broken_block_surface(size)
+    props[f'checkered_flag_{FLAG_SIZE}'] = (load_image('checkered_flag.png', (FLAG_SIZE, FLAG_SIZE), 'props')
+                                            or create_checkered_flag_surface(FLAG_SIZE))
+    props[f'glass_tube_{DOOR_WIDTH}x{DOOR_HEIGHT}'] = (load_image('glass_tube.png', (DOOR_WIDTH, DOOR_HEIGHT), 'props')
+                                                       or create_glass_tube_surface(DOOR_WIDTH, DOOR_HEIGHT))
+    for is_yellow in (True, False):
+        color_name = 'yellow' if is_yellow else 'blue'
+        props[f'wall_bar_{color_name}_{WALL_BAR_SIZE[0]}x{WALL_BAR_SIZE[1]}'] = (
+            load_image(f'wall_bar_{color_name}.png', WALL_BAR_SIZE, 'props') or create_wall_bar_surface(is_yellow, *WALL_BAR_SIZE))
+    return props
+
+def prop_sources():
+    """Files the props come from, a file being added or removed changes the atlas key too"""
+    candidates = [os.path.join(subdir or '', filename) for _, filename, subdir, _ in PROP_IMAGES]
+    candidates += [os.path.join('blocks', f'broken_block_{size}.png') for size in BLOCK_SIZES]
+    candidates += [os.path.join('props', name) for name in ('checkered_flag.png', 'glass_tube.png', 'wall_bar_yellow.png', 'wall_bar_blue.png')]
+    paths = [os.path.join(assets_dir, candidate) for candidate in candidates]
+    return [os.path.abspath(__file__)] + [path for path in paths if os.path.exists(path)]
+
+from Utils.SpriteAtlas import cached_atlas
+
+props = cached_atlas('props', prop_sources(), create_props, (DOOR_WIDTH, DOOR_HEIGHT, FLAG_SIZE, WALL_BAR_SIZE))
+
+companion_cube_img = props.get('companion_cube')
+cube_spawner_img = props.get('cube_spawner')
+exit_door_closed = props.get('exit_door_closed')
+exit_door_open = props.get('exit_door_open')
+
 def get_platform_texture():
     """Get platform texture for tiling
     Returns a texture surface that can be tiled across platforms
@@ -0,0 +1,169 @@
+"""
+Level files
+Levels are described in Levels/data/<name>.json (platforms, button, door, spawn points,
+cube), nothing about a level is Python so adding one costs no imports.
+The first load compiles the JSON into Assets/cache/<name>.level, a packed binary that also
+holds the platform collision grid, and later loads read just that one file.
+The cache is keyed on the JSON file, editing a level recompiles it
+"""
+import json
+import os
+import struct
+import pygame
+from Utils.Platform import Platform, PlatformGrid, grid_cells
+from Utils.ButtonObject import ButtonObject
+from Utils.ExitDoor import ExitDoor
+from Utils.Game_settings import PLATFORM_GRID_CELL
+from Utils.SpriteCache import cache_dir, source_key
+
+base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+levels_dir = os.path.join(base_dir, 'Levels', 'data')
+
+MAGIC = b'PLVL'
+VERSION = 1
+
+HEADER = struct.Struct('<4sH20sH3BH')  # magic, version, key, cell size, background colour, platforms
+PLATFORM = struct.Struct('<hhHH?B?')  # x, y, width, height, portable, collision, dynamic
+BUTTON = struct.Struct('<?hhB')  # present, x, y, type
+POINT = struct.Struct('<hh')
+OPTIONAL_POINT = struct.Struct('<?hh')  # present, x, y
+STORM = struct.Struct('<IhhHH')  # cubes (0 = no storm), area x, y, width, height
+COUNT = struct.Struct('<H')
+CELL = struct.Struct('<hhH')  # cell x, cell y, platforms in it, then their indices
+
+# Defaults for keys a level file can leave out of a platform
+PLATFORM_DEFAULTS = {'portable': True, 'collision': 0, 'dynamic': False}
+
+def level_path(name):
+    return os.path.join(levels_dir, name + '.json')
+
+def read_level_file(path):
+    """Parse a level JSON into plain tuples"""
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    platforms = []
+    for entry in data['platforms']:
+        entry = {**PLATFORM_DEFAULTS, **entry}
+        x, y, width, height = entry['rect']
+        platforms.append((x, y, width, height, entry['portable'], entry['collision'], entry['dynamic']))
+
+    button = data.get('button')
+    storm = data.get('cube_storm')
+    return {
+        'platforms': platforms,
+        'button': (button['x'], button['y'], button.get('type', 0)) if button else None,
+        'door': tuple(data['door']),
+        'start_positions': [tuple(position) for position in data['start_positions']],
+        'cube_position': tuple(data['cube_position']) if data.get('cube_position') else None,
+        'cube_storm': (storm['count'], tuple(storm['area'])) if storm else None,
+        'background_color': tuple(data['background_color']),
+    }
+
+def encode(key, level, cell_size=PLATFORM_GRID_CELL):
+    platforms = level['platforms']
+    data = [HEADER.pack(MAGIC, VERSION, key, cell_size, *level['background_color'], len(platforms))]
+    data.extend(PLATFORM.pack(*platform) for platform in platforms)
+
+    button = level['button']
+    data.append(BUTTON.pack(True, *button) if button else BUTTON.pack(False, 0, 0, 0))
+    data.append(POINT.pack(*level['door']))
+    data.append(COUNT.pack(len(level['start_positions'])))
+    data.extend(POINT.pack(*position) for position in level['start_positions'])
+    cube = level['cube_position']
+    data.append(OPTIONAL_POINT.pack(True, *cube) if cube else OPTIONAL_POINT.pack(False, 0, 0))
+    storm = level['cube_storm']
+    data.append(STORM.pack(storm[0], *storm[1]) if storm else STORM.pack(0, 0, 0, 0, 0))
+
+    # Collision grid over the platforms, so loading doesn't have to build it
+    cells = grid_cells([pygame.Rect(platform[:4]) for platform in platforms], cell_size)
+    data.append(COUNT.pack(len(cells)))
+    for (cx, cy), indices in cells.items():
+        data.append(CELL.pack(cx, cy, len(indices)))
+        data.append(struct.pack(f'<{len(indices)}H', *indices))
+    return b''.join(data)
+
+def decode(buffer, key):
+    """Plain level tuples and collision cells from a compiled level, None if it's stale or broken"""
+    magic, version, stored_key, cell_size, red, green, blue, platformCount = HEADER.unpack_from(buffer, 0)
+    if magic != MAGIC or version != VERSION or stored_key != key:
+        return None
+    offset = HEADER.size
+
+    platforms = [PLATFORM.unpack_from(buffer, offset + i * PLATFORM.size) for i in range(platformCount)]
+    offset += platformCount * PLATFORM.size
+
+    present, *button = BUTTON.unpack_from(buffer, offset)
+    offset += BUTTON.size
+    door = POINT.unpack_from(buffer, offset)
+    offset += POINT.size
+    startCount, = COUNT.unpack_from(buffer, offset)
+    offset += COUNT.size
+    start_positions = [POINT.unpack_from(buffer, offset + i * POINT.size) for i in range(startCount)]
+    offset += startCount * POINT.size
+    has_cube, *cube = OPTIONAL_POINT.unpack_from(buffer, offset)
+    offset += OPTIONAL_POINT.size
+    cubes, *area = STORM.unpack_from(buffer, offset)
+    offset += STORM.size
+
+    cellCount, = COUNT.unpack_from(buffer, offset)
+    offset += COUNT.size
+    cells = {}
+    for _ in range(cellCount):
+        cx, cy, count = CELL.unpack_from(buffer, offset)
+        offset += CELL.size
+        cells[(cx, cy)] = list(struct.unpack_from(f'<{count}H', buffer, offset))
+        offset += count * 2
+
+    level = {
+        'platforms': platforms,
+        'button': tuple(button) if present else None,
+        'door': door,
+        'start_positions': start_positions,
+        'cube_position': tuple(cube) if has_cube else None,
+        'cube_storm': (cubes, tuple(area)) if cubes else None,
+        'background_color': (red, green, blue),
+    }
+    return level, cell_size, cells
+
+def compiled_level(name):
+    """Plain level tuples and collision cells for a level, compiling it if the cache is stale"""
+    path = level_path(name)
+    key = source_key([path])
+    compiled = os.path.join(cache_dir, name + '.level')
+    try:
+        with open(compiled, 'rb') as f:
+            result = decode(f.read(), key)
+        if result is not None:
+            return result
+    except (OSError, struct.error):
+        pass
+
+    level = read_level_file(path)
+    data = encode(key, level)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        # Write to a temp file first so a half written level is never read back
+        with open(compiled + '.tmp', 'wb') as f:
+            f.write(data)
+        os.replace(compiled + '.tmp', compiled)
+    except OSError as e:
+        print(f"Warning: Could not cache level {name}: {e}")
+    return decode(data, key)
+
+def load_level(name):
+    """Load Levels/data/<name>.json as a level dict"""
+    level, cell_size, cells = compiled_level(name)
+    platforms = [Platform(x, y, width, height, portable, collision, dynamic)
+                 for x, y, width, height, portable, collision, dynamic in level['platforms']]
+    button = level['button']
+    return {
+        'name': name,
+        'platforms': PlatformGrid(platforms, cell_size, cells),
+        'button': ButtonObject(*button) if button else None,
+        'door': ExitDoor(*level['door']),
+        'start_positions': level['start_positions'],
+        'cube_position': level['cube_position'],
+        'cube_storm': level['cube_storm'],
+        'background_color': level['background_color'],
+    }
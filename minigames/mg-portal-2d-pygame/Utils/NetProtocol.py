@@ -0,0 +1,144 @@
+"""
+Wire format shared by Server.py and Network.py
+Packets are struct packed and sent over UDP. Clients send their own player's state, the
+server sends every client a snapshot of the other players at a fixed tick rate. Snapshots
+are deltas against the last snapshot the client acknowledged, only fields that changed
+since then are sent, so a player standing still costs a few bytes
+"""
+import struct
+
+# Packet types
+JOIN, WELCOME, STATE, SNAPSHOT, LEAVE = range(1, 6)
+
+TYPE = struct.Struct('<B')
+NAME = struct.Struct('<B')  # length of a utf-8 string that follows
+WELCOME_PACKET = struct.Struct('<BBB')  # type, player id, tick rate
+STATE_HEADER = struct.Struct('<BBII')  # type, player id, sequence, newest snapshot tick received
+SNAPSHOT_HEADER = struct.Struct('<BIIBB')  # type, tick, base tick (0 = full snapshot), players, players removed
+PLAYER_HEADER = struct.Struct('<BH')  # player id, bit per field that follows
+PLAYER_ID = struct.Struct('<B')
+
+# Fields of a player's state, in order, a state is a tuple of these
+FIELDS = (
+    ('x', 'f'),
+    ('y', 'f'),
+    ('left', '?'),
+    ('cube_x', 'h'),
+    ('cube_y', 'h'),
+    ('cube_state', 'b'),
+    ('angle', 'h'),
+    ('portal', '?'),
+    ('portal_x', 'h'),
+    ('portal_y', 'h'),
+    ('portal_rot', 'h'),
+    ('room', 'h'),
+    ('name', 's'),
+)
+FIELD_INDEX = {name: i for i, (name, _) in enumerate(FIELDS)}
+FIELD_STRUCTS = [None if code == 's' else struct.Struct('<' + code) for _, code in FIELDS]
+ALL_FIELDS = (1 << len(FIELDS)) - 1
+DEFAULT_STATE = (0.0, 0.0, False, 0, 0, -1, 0, False, 0, 0, 0, 0, '')
+
+def make_state(base=DEFAULT_STATE, **fields):
+    """A player state tuple, base with the named fields replaced"""
+    state = list(base)
+    for name, value in fields.items():
+        state[FIELD_INDEX[name]] = value
+    return tuple(state)
+
+def field(state, name):
+    return state[FIELD_INDEX[name]]
+
+def pack_string(text):
+    data = text.encode('utf-8')[:255]
+    return NAME.pack(len(data)) + data
+
+def read_string(buffer, offset):
+    length, = NAME.unpack_from(buffer, offset)
+    offset += NAME.size
+    return bytes(buffer[offset:offset + length]).decode('utf-8', 'replace'), offset + length
+
+def changed_fields(old, new):
+    """Bit mask of the fields that differ between two states"""
+    if old is None:
+        return ALL_FIELDS
+    mask = 0
+    for i, (a, b) in enumerate(zip(old, new)):
+        if a != b:
+            mask |= 1 << i
+    return mask
+
+def pack_fields(state, mask):
+    data = []
+    for i, value in enumerate(state):
+        if mask & (1 << i):
+            packer = FIELD_STRUCTS[i]
+            data.append(pack_string(value) if packer is None else packer.pack(value))
+    return b''.join(data)
+
+def unpack_fields(buffer, offset, mask, base):
+    """Read the fields in mask, the rest come from base. Returns (state, offset)"""
+    state = list(base)
+    for i, packer in enumerate(FIELD_STRUCTS):
+        if mask & (1 << i):
+            if packer is None:
+                state[i], offset = read_string(buffer, offset)
+            else:
+                state[i], = packer.unpack_from(buffer, offset)
+                offset += packer.size
+    return tuple(state), offset
+
+def encode_join(name):
+    return TYPE.pack(JOIN) + pack_string(name)
+
+def encode_welcome(player_id, tick_rate):
+    return WELCOME_PACKET.pack(WELCOME, player_id, tick_rate)
+
+def encode_leave(player_id):
+    return TYPE.pack(LEAVE) + PLAYER_ID.pack(player_id)
+
+def encode_state(player_id, sequence, ack, state):
+    return STATE_HEADER.pack(STATE, player_id, sequence, ack) + pack_fields(state, ALL_FIELDS)
+
+def decode_state(buffer):
+    """(player id, sequence, ack, state)"""
+    _, player_id, sequence, ack = STATE_HEADER.unpack_from(buffer, 0)
+    state, _ = unpack_fields(buffer, STATE_HEADER.size, ALL_FIELDS, DEFAULT_STATE)
+    return player_id, sequence, ack, state
+
+def encode_snapshot(tick, players, base_tick=0, base=None):
+    """Snapshot of players ({id: state}) as a delta against base, the snapshot sent at base_tick
+    Without a base every field of every player is sent
+    """
+    base = base or {}
+    data = []
+    for player_id, state in players.items():
+        old = base.get(player_id)
+        mask = changed_fields(old, state)
+        if mask or old is None:
+            data.append(PLAYER_HEADER.pack(player_id, mask) + pack_fields(state, mask))
+    removed = [player_id for player_id in base if player_id not in players]
+    data.extend(PLAYER_ID.pack(player_id) for player_id in removed)
+    return SNAPSHOT_HEADER.pack(SNAPSHOT, tick, base_tick, len(data) - len(removed), len(removed)) + b''.join(data)
+
+def decode_snapshot(buffer, snapshots):
+    """Rebuild a snapshot, snapshots holds the earlier ones received by tick
+    Returns (tick, {id: state}), or None if its base snapshot is no longer known
+    """
+    _, tick, base_tick, count, removed = SNAPSHOT_HEADER.unpack_from(buffer, 0)
+    if base_tick:
+        if base_tick not in snapshots:
+            return None
+        players = dict(snapshots[base_tick])
+    else:
+        players = {}
+    offset = SNAPSHOT_HEADER.size
+    for _ in range(count):
+        player_id, mask = PLAYER_HEADER.unpack_from(buffer, offset)
+        offset += PLAYER_HEADER.size
+        players[player_id], offset = unpack_fields(buffer, offset, mask, players.get(player_id, DEFAULT_STATE))
+    for _ in range(removed):
+        player_id, = PLAYER_ID.unpack_from(buffer, offset)
+        offset += PLAYER_ID.size
+        players.pop(player_id, None)
+    return tick, players
@@ -1,30 +1,121 @@
-import socket
+"""
+Game client, talks to Utils/Server.py over UDP (see NetProtocol.py)
+Nothing here waits on the network during a frame: send() hands the local player's state
+to the socket and returns, snapshots from the server are applied as they arrive while the
+level's loop awaits. The local player is simulated on this machine straight away, other
+players are predicted forward from their last two snapshots until the next one arrives
+"""
+import asyncio
+import struct
+from Utils.Game_settings import NET_PORT
+from Utils.NetProtocol import (TYPE, WELCOME, SNAPSHOT, WELCOME_PACKET, encode_join, encode_state,
+                               encode_leave, decode_snapshot, field)
 
-class Network:
+# Snapshots kept as bases for the server's deltas
+HISTORY = 64
+# Longest a remote player is predicted past their last snapshot, in seconds
+MAX_PREDICTION = 0.25
 
-    def __init__(self):
-        self.client = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        self.host = "localhost" # For this to work on your machine this must be equal to the ipv4 address of the machine running the server
-                                    # You can find this address by typing ipconfig in CMD and copying the ipv4 address. Again this must be the servers
-                                    # ipv4 address. This feild will be the same for all your clients.
-        self.port = 5555
-        self.addr = (self.host, self.port)
-        self.id = self.connect()
-        print("id: " + self.id)
+class Network(asyncio.DatagramProtocol):
 
-    def connect(self):
-        self.client.connect(self.addr)
-        return self.client.recv(2048).decode()
+    def __init__(self, name='Player'):
+        self.name = name
+        self.id = None
+        self.tick_rate = None
+        self.transport = None
+        self.welcomed = None
+        self.sequence = 0
+        # Newest snapshot received, also what the server gets acknowledged
+        self.tick = 0
+        self.snapshots = {}
+        # Other players: id -> state from the newest snapshot
+        self.players = {}
+        # id -> ((tick, x, y) before, (tick, x, y) newest) for prediction
+        self.motion = {}
+        # When the newest snapshot arrived
+        self.received_at = 0
 
-    def send(self, data):
-        """
-        :param data: str
-        :return: str
-        """
+    async def connect(self, host='localhost', port=NET_PORT, timeout=5.0):
+        """Join the server, returns this player's id"""
+        loop = asyncio.get_running_loop()
+        self.welcomed = loop.create_future()
+        self.transport, _ = await loop.create_datagram_endpoint(lambda: self, remote_addr=(host, port))
+        # The join or its answer can be lost, ask until the server answers
+        deadline = loop.time() + timeout
+        while not self.welcomed.done():
+            if loop.time() > deadline:
+                self.transport.close()
+                raise ConnectionError(f"No answer from server at {host}:{port}")
+            self.transport.sendto(encode_join(self.name))
+            try:
+                await asyncio.wait_for(asyncio.shield(self.welcomed), 0.25)
+            except asyncio.TimeoutError:
+                pass
+        return self.id
+
+    def datagram_received(self, data, addr):
         try:
-            #print(data)
-            self.client.send(str.encode(data))
-            reply = self.client.recv(2048).decode()
-            return reply
-        except socket.error as e:
-            return str(e)
+            kind, = TYPE.unpack_from(data, 0)
+            if kind == WELCOME:
+                _, self.id, self.tick_rate = WELCOME_PACKET.unpack_from(data, 0)
+                if self.welcomed and not self.welcomed.done():
+                    self.welcomed.set_result(self.id)
+            elif kind == SNAPSHOT:
+                self.receive_snapshot(data)
+        except struct.error as e:
+            print(f"Warning: Bad packet from server: {e}")
+
+    def error_received(self, exc):
+        print(f"Warning: Network error: {exc}")
+
+    def receive_snapshot(self, data):
+        result = decode_snapshot(data, self.snapshots)
+        if result is None:
+            # Its base is gone, the server sends a full snapshot once our ack is old enough
+            return
+        tick, players = result
+        self.snapshots[tick] = players
+        for old in [old for old in self.snapshots if old <= tick - HISTORY]:
+            del self.snapshots[old]
+        if tick <= self.tick:
+            # Arrived late, kept as a base but not newer than what is shown
+            return
+        self.tick = tick
+        self.received_at = asyncio.get_running_loop().time()
+
+        for player_id, state in players.items():
+            sample = (tick, field(state, 'x'), field(state, 'y'))
+            previous = self.motion.get(player_id)
+            self.motion[player_id] = (previous[1] if previous else sample, sample)
+        for player_id in [player_id for player_id in self.motion if player_id not in players]:
+            del self.motion[player_id]
+        self.players = players
+
+    def send(self, state):
+        """Send the local player's state (a NetProtocol state tuple), never blocks"""
+        if self.transport is None or self.id is None:
+            return
+        self.sequence += 1
+        self.transport.sendto(encode_state(self.id, self.sequence, self.tick, state))
+
+    def predicted(self, player_id):
+        """Where another player should be drawn now, their newest position carried on at the
+        speed between their last two snapshots
+        """
+        motion = self.motion.get(player_id)
+        if motion is None:
+            return None
+        (tick0, x0, y0), (tick1, x1, y1) = motion
+        if tick1 <= tick0:
+            return x1, y1
+        # Snapshots are sent on a fixed tick, so ticks give the time between them without jitter
+        seconds = (tick1 - tick0) / self.tick_rate
+        ahead = min(asyncio.get_running_loop().time() - self.received_at, MAX_PREDICTION)
+        return x1 + (x1 - x0) / seconds * ahead, y1 + (y1 - y0) / seconds * ahead
+
+    def close(self):
+        if self.transport is not None:
+            if self.id is not None:
+                self.transport.sendto(encode_leave(self.id))
+            self.transport.close()
+            self.transport = None
@@ -2,6 +2,7 @@ import pygame
 import math
 import sys
 import os
+from Utils.Collision import sweep, contact
 
 # Code based off of: https://www.petercollingridge.co.uk/tutorials/pygame-physics-simulation/
 class PhysObj():
@@ -15,10 +16,13 @@ class PhysObj():
         self.speed = speed
         self.weight = weight
         self.elasticity = elasticity
+        # Where move() started from, bounce() sweeps from here so fast objects can't pass through walls
+        self.last_pos = None
 
     # Moves Object
     # Speed: Pixels to move per call
     def move(self, dt):
+        self.last_pos = self.rect.topleft
         self.angle, self.speed = addVectors(self.angle, self.speed, math.pi, self.weight)
         self.rect.x += math.sin(self.angle) * self.speed * dt
         self.rect.y -= math.cos(self.angle) * self.speed * dt
@@ -31,6 +35,21 @@ class PhysObj():
     # TODO, swap width/height checks with wall collision
     def bounce(self, width, height, wallList):
         if self.rect.left > -100 and self.rect.top > -100:
+            if self.last_pos:
+                # Walls crossed during the last move
+                x, y = self.last_pos
+                box = (x, y, self.rect.width, self.rect.height)
+                dx, dy = self.rect.x - x, self.rect.y - y
+                time, normal, plat = sweep(box, dx, dy, wallList, lambda plat: not plat.collision == 1)
+                if plat:
+                    self.rect.topleft = contact(box, dx, dy, time, normal, plat.rect)
+                    if normal[0]:
+                        self.angle = -self.angle
+                    else:
+                        self.angle = math.pi - self.angle
+                    self.speed *= self.elasticity
+                self.last_pos = None
+
             for plat in wallList:
                 wall = plat.rect
                 if self.rect.colliderect(wall) and plat.active and not plat.collision == 1:
@@ -160,31 +179,18 @@ class CubeObj(PhysObj, pygame.sprite.Sprite):
         super().bounce(width, height, wallList)
 
     def portalWarp(self, portals):
-        """Cube teleports through portals - portals only link within the same team"""
+        """Cube teleports through portals (a PortalRegistry) - portals only link within the same team"""
         touchedPortal = False
-        for portal in portals:
-            if portal and self.rect.colliderect(portal.rect):
-                touchedPortal = True
-                if self.warpCooldown > 0 or not self.runPhysics:
-                    return
-                # Determine which team this portal belongs to
-                # Team 1: Player 0 (Blue) and Player 1 (Orange)
-                # Team 2: Player 2 (Red) and Player 3 (Yellow)
-                portal_team = 0 if portal.playerNum < 2 else 1
-                
-                # Find another portal from the same team
-                other_portal = None
-                for p in portals:
-                    if p and p != portal:
-                        p_team = 0 if p.playerNum < 2 else 1
-                        if p_team == portal_team:  # Same team
-                            other_portal = p
-                            break
-                
-                if other_portal:
-                    self.rect.center = other_portal.rect.center
-                    self.angle = (270 - other_portal.angle) % 360 * math.pi / 180
-                    self.warpCooldown = 20
-                    return
+        for portal in portals.touching(self.rect):
+            touchedPortal = True
+            if self.warpCooldown > 0 or not self.runPhysics:
+                return
+            # The teammate portal this one exits through
+            other_portal = portals.linked(portal)
+            if other_portal:
+                self.rect.center = other_portal.rect.center
+                self.angle = (270 - other_portal.angle) % 360 * math.pi / 180
+                self.warpCooldown = 20
+                return
         if not touchedPortal:
             self.warpCooldown = 0
\ No newline at end of file
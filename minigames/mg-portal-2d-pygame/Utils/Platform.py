@@ -1,5 +1,6 @@
 import pygame
 from Utils.LevelAssets import get_platform_texture, tile_texture
+from Utils.Game_settings import PLATFORM_GRID_CELL
 
 # Cache platform texture
 _platform_texture_cache = None
@@ -20,23 +21,36 @@ class Platform():
     #       1 = Only player collide, cube passes through
     #       2 = Only cube collides, player passes through
     # active: determins if the platform should be rendered/collided with
-    def __init__(self, x, y, width, length, isPortable, collision):
-        self.surface = pygame.Surface((width, length))
-        self.rect = self.surface.get_rect()
-        self.rect.x = x
-        self.rect.y = y
+    # dynamic: platform can change (toggle active, resize) during a level so it
+    #       is drawn every frame instead of being baked into the level background
+    def __init__(self, x, y, width, length, isPortable, collision, dynamic=False):
+        self.rect = pygame.Rect(x, y, width, length)
+        # Built on first render()
+        self.surface = None
         self.isPortable = isPortable
         self.collision = collision
         self.active = True
+        self.dynamic = dynamic
+        # What the current surface was built for, see render()
+        self._surface_key = None
 
     # Draws wall with professional styling
     def draw(self, screen):
         if not self.active:
             return
+        screen.blit(self.render(), (self.rect.x, self.rect.y))
 
-        # Recreate surface each frame for dynamic effects
+    def render(self):
+        """Return the platform surface, only rebuilt when active or the size changed"""
+        key = (self.active, self.rect.width, self.rect.height)
+        if key != self._surface_key:
+            self._build_surface()
+            self._surface_key = key
+        return self.surface
+
+    def _build_surface(self):
         self.surface = pygame.Surface((self.rect.width, self.rect.height))
-        
+
         if self.collision == 1:
             # Red barrier (player only)
             self.surface.fill((200, 50, 50))
@@ -68,8 +82,6 @@ class Platform():
             # Add subtle detail
             pygame.draw.rect(self.surface, (60, 60, 65), (0, 0, self.rect.width, self.rect.height), 1)
 
-        screen.blit(self.surface, (self.rect.x, self.rect.y))
-    
     def _draw_portable_fallback(self):
         """Fallback drawing for portal-able surfaces when no texture is available"""
         # Portal-able surface (grey with subtle texture)
@@ -78,4 +90,74 @@ class Platform():
         for i in range(0, self.rect.width, 10):
             pygame.draw.line(self.surface, (100, 100, 110), (i, 0), (i, self.rect.height), 1)
         # Highlight edges
-        pygame.draw.rect(self.surface, (140, 140, 150), (0, 0, self.rect.width, self.rect.height), 2)
\ No newline at end of file
+        pygame.draw.rect(self.surface, (140, 140, 150), (0, 0, self.rect.width, self.rect.height), 2)
+
+def bake_level_background(width, height, platforms, background=None, background_color=(0, 0, 0)):
+    """Draw the background and every static platform onto one surface
+    Returns the baked surface and the dynamic platforms that still have to be drawn each frame
+    """
+    surface = pygame.Surface((width, height))
+    if background:
+        surface.blit(background, (0, 0))
+    else:
+        surface.fill(background_color)
+
+    dynamic = []
+    for platform in platforms:
+        if platform.dynamic:
+            dynamic.append(platform)
+        else:
+            platform.draw(surface)
+    return surface, dynamic
+
+def grid_cells(rects, cell_size):
+    """Grid cell -> indices of the rects overlapping it, in order"""
+    cells = {}
+    for i, rect in enumerate(rects):
+        for cx in range(rect.left // cell_size, (rect.right - 1) // cell_size + 1):
+            for cy in range(rect.top // cell_size, (rect.bottom - 1) // cell_size + 1):
+                cells.setdefault((cx, cy), []).append(i)
+    return cells
+
+class PlatformGrid(list):
+    """A level's platforms, with a uniform grid over them for collision queries
+    Still a plain list so anything that loops over every platform keeps working.
+    Built once when the level is created, call rebuild() if a platform moves or resizes
+    """
+    def __init__(self, platforms, cell_size=PLATFORM_GRID_CELL, cells=None):
+        super().__init__(platforms)
+        self.cell_size = cell_size
+        if cells is None:
+            self.rebuild()
+        else:
+            # Precompiled by grid_cells(), level files store it
+            self.set_cells(cells)
+
+    def rebuild(self):
+        self.set_cells(grid_cells([platform.rect for platform in self], self.cell_size))
+
+    def set_cells(self, cells):
+        self.cells = {cell: [self[i] for i in indices] for cell, indices in cells.items()}
+        # Results per block of cells, the grid never changes so they stay valid until the next rebuild
+        self.queries = {}
+
+    def near(self, rect):
+        """Platforms sharing a grid cell with rect, in level order"""
+        size = self.cell_size
+        key = (rect.left // size, (rect.right - 1) // size, rect.top // size, (rect.bottom - 1) // size)
+        found = self.queries.get(key)
+        if found is None:
+            left, right, top, bottom = key
+            found = set()
+            for cx in range(left, right + 1):
+                for cy in range(top, bottom + 1):
+                    found.update(self.cells.get((cx, cy), ()))
+            found = [platform for platform in self if platform in found]
+            self.queries[key] = found
+        return found
+
+def platforms_near(platforms, rect):
+    """Platforms that could touch rect, every platform if the level has no grid"""
+    if isinstance(platforms, PlatformGrid):
+        return platforms.near(rect)
+    return platforms
@@ -8,6 +8,24 @@ import os
 import math
 from Utils import GlobalVariables
 from Utils.Portal_gun import Pgun, Portal
+from Utils.Platform import platforms_near
+from Utils.Collision import sweep, contact
+from Utils.GameScale import (WALK_SPEED, GRAVITY, JUMP_FALL_SPEED, FALL_SCALE, JUMP_RATE, GROUND_FRICTION, AIR_RESISTANCE,
+                             LANDING_FRICTION, STOP_SPEED, MOVING_SPEED, PORTAL_EXIT_SPEED_X, PORTAL_EXIT_SPEED_Y,
+                             WARP_COOLDOWN, RUN_FRAME_TIME, MAX_PHYSICS_STEP)
+
+def decay(speed, keep, seconds):
+    """Speed after seconds of exponential decay, keep is the share left after one second"""
+    return speed * keep ** seconds
+
+def decay_distance(speed, keep, seconds):
+    """Distance covered while speed decays, the exact integral so it doesn't depend on step size"""
+    return speed * (1 - keep ** seconds) / -math.log(keep)
+
+def physics_steps(dt):
+    """Split a frame's dt into equal steps no longer than MAX_PHYSICS_STEP"""
+    steps = max(1, math.ceil(dt / MAX_PHYSICS_STEP))
+    return [dt / steps] * steps
 
 class Player():
     def __init__(self, x, y, player_num=1, controllingCube=False):
@@ -18,6 +36,7 @@ class Player():
         self.background_y = GlobalVariables.Height
         self.size_x = GlobalVariables.Player_size_X
         self.size_y = GlobalVariables.Player_size_Y
+        self._rect = pygame.Rect(x, y, self.size_x, self.size_y)
         self.isJump = False
         self.isJumping = False
         self.canJump = True
@@ -25,10 +44,18 @@ class Player():
         from Utils.GameScale import JUMP_STRENGTH, GRAVITY_SCALE
         self.jump_count = JUMP_STRENGTH
         self.count = JUMP_STRENGTH
+        # Shares of this frame spent coming down the jump arc and falling after it ended
+        self.fallShare = 1.0
+        self.freeShare = 1.0
+        # Platform last landed on and where this frame's move started, to time walking off it
+        self.support = None
+        self.frameX = x
+        # Arc descent held back until the frame's drift has carried the player off the edge
+        self.arcDrop = 0
         self.runningCount = 0
         self.gravity = GRAVITY_SCALE
-        self.velocity = 0  # Vertical velocity
-        self.velocity_x = 0  # Horizontal velocity for momentum
+        self.velocity = 0  # Vertical velocity, pixels a second
+        self.velocity_x = 0  # Horizontal velocity for momentum, pixels a second
         self.running = False
         self.runningAnim = False
         self.allowAnim = False
@@ -66,17 +93,127 @@ class Player():
         }
         return controls.get(self.player_num, controls[1])
 
-    def draw(self, screen):
+    def draw(self, screen, body=True):
+        """Draw the player, body=False leaves out the sprite for callers that batch them"""
         if self.cube:
             self.cube.rect.center = self.rect().center
-        screen.blit(self.image, (self.x, self.y))
+        if body:
+            screen.blit(self.image, (self.x, self.y))
         from Utils.GameScale import UI_FONT_SMALL
         name_text = GlobalVariables.font(UI_FONT_SMALL).render(self.name, True, GlobalVariables.Text_NameColor)
         screen.blit(name_text, (self.x, self.y - 30))
         self.pGun.draw(screen)
 
     def rect(self):
-        return pygame.Rect(self.x, self.y, self.size_x, self.size_y)
+        # The same Rect is reused every call, copy it to keep the old position
+        self._rect.update(self.x, self.y, self.size_x, self.size_y)
+        return self._rect
+
+    def blocked_by(self, platform):
+        # Cube only platforms stop the player while they carry a cube
+        return not platform.collision == 2 or self.cube != None
+
+    def on_platform(self, platforms):
+        """Check if the player is touching a platform they collide with"""
+        rect = self.rect()
+        for platform in platforms_near(platforms, rect):
+            if rect.colliderect(platform.rect) and platform.active and self.blocked_by(platform):
+                return True
+        return False
+
+    def sweep_move(self, dx, dy, platforms):
+        """Move by (dx, dy), stopping flush against the first platform in the way
+        Returns the normal and platform that were hit, or (None, None)
+        """
+        box = (self.x, self.y, self.size_x, self.size_y)
+        time, normal, platform = sweep(box, dx, dy, platforms, self.blocked_by)
+        self.x, self.y = contact(box, dx, dy, time, normal, platform.rect if platform else None)
+        return normal, platform
+
+    def fall(self, distance, platforms):
+        """Move vertically by distance, landing on or bumping into any platform on the way"""
+        normal, platform = self.sweep_move(0, distance, platforms)
+        if normal and normal[1] < 0:
+            self.land(platform)
+        elif normal:
+            self.hit_ceiling(platform)
+
+    def friction(self, in_air):
+        """Share of horizontal speed kept after a second, held input keeps the speed up"""
+        if self.running:
+            return 1.0
+        return GROUND_FRICTION * AIR_RESISTANCE if in_air else GROUND_FRICTION
+
+    def drift(self, platforms, seconds):
+        """Carry horizontal momentum while in the air"""
+        keep = self.friction(True)
+        if abs(self.velocity_x) > STOP_SPEED:
+            from Utils.GameScale import PLATFORM_THICKNESS
+            wall_thickness = PLATFORM_THICKNESS
+            if keep < 1:
+                distance = decay_distance(self.velocity_x, keep, seconds)
+            else:
+                distance = self.velocity_x * seconds
+            normal, _ = self.sweep_move(distance, 0, platforms)
+            if normal:
+                self.velocity_x = 0
+            # Clamp to boundaries
+            min_x = wall_thickness
+            max_x = self.background_x - self.size_x - wall_thickness
+            if self.x < min_x:
+                self.x = min_x
+                self.velocity_x = 0
+            elif self.x > max_x:
+                self.x = max_x
+                self.velocity_x = 0
+        # Friction and slight air resistance
+        self.velocity_x = decay(self.velocity_x, keep, seconds)
+
+    def falling_time(self, seconds):
+        """Seconds of this step spent falling, gravity starts where the player walked off the
+        platform they stood on rather than at the start of the frame
+        """
+        if self.support is None:
+            return seconds
+        share = self.off_edge_share()
+        self.support = None
+        return seconds * share
+
+    def off_edge_share(self, ahead=0):
+        """Share of this frame since the player walked off the platform they stood on,
+        ahead is how much further they still move this frame
+        """
+        rect = self.support.rect
+        x = self.x + ahead
+        moved = x - self.frameX
+        if moved > 0:
+            over = x - rect.right
+        elif moved < 0:
+            over = rect.left - (x + self.size_x)
+        else:
+            return 1.0
+        if over < 0:
+            # Still over it, the platform went away rather than being walked off
+            return 1.0
+        return min(1.0, over / abs(moved))
+
+    def land(self, platform):
+        self.support = platform
+        self.y = platform.rect.top - self.size_y
+        self.velocity = 0
+        self.isJump = False
+        self.canJump = True
+        self.hitPlatform = False
+
+    def hit_ceiling(self, platform):
+        self.support = None
+        self.y = platform.rect.bottom
+        self.velocity = 0
+        self.count = 0
+        self.isJump = False
+        self.isJumping = False
+        self.canJump = True
+        self.hitPlatform = True
 
     def update(self, platforms, dt):
         self.set_gravity(platforms, dt)
@@ -120,7 +257,7 @@ class Player():
         self.pGun.update(platforms, aim_dir)
 
         if self.warpCooldown > 0:
-            self.warpCooldown -= 1
+            self.warpCooldown -= dt
 
         if self.cubeState == "10":
             self.cubeState = "0"
@@ -132,8 +269,7 @@ class Player():
 
     def move(self, input_state, platforms, dt):
         """Move player based on input state dict"""
-        from Utils.GameScale import BASE_SCALE
-        
+        self.frameX = self.x
         left_key = self.control_keys['left']
         right_key = self.control_keys['right']
         jump_key = self.control_keys['jump']
@@ -146,8 +282,8 @@ class Player():
         # Track facing direction for gun rotation
         was_facing_left = self.leftSide
         
-        # Scale movement speed to match character size (reduced for better control)
-        movement_speed = 0.25 * BASE_SCALE  # Reduced movement speed for better control
+        # Distance walked this frame, WALK_SPEED is already scaled to the character size
+        step = WALK_SPEED * dt / 1000
         
         if moving_right:
             # Boundary check with wall thickness
@@ -155,33 +291,15 @@ class Player():
             wall_thickness = PLATFORM_THICKNESS
             max_x = self.background_x - self.size_x - wall_thickness
             if self.x < max_x:
-                # Scaled movement speed for smaller characters
-                self.velocity_x = movement_speed * dt
-                # Check collision before moving
-                test_x = self.x + self.velocity_x
-                test_rect = pygame.Rect(test_x, self.y, self.size_x, self.size_y)
-                can_move = True
-                for platform in platforms:
-                    if platform.active and (not platform.collision == 2 or self.cube != None):
-                        if test_rect.colliderect(platform.rect):
-                            can_move = False
-                            self.velocity_x = 0
-                            break
-                
-                if can_move:
-                    self.x += self.velocity_x
-                    # Clamp to boundary
-                    if self.x > max_x:
-                        self.x = max_x
-                        self.velocity_x = 0
-                else:
-                    # Adjust position to be just before the wall
-                    self.x = min(self.x, max_x)
-                    for platform in platforms:
-                        if platform.active and platform.rect.colliderect(test_rect):
-                            if platform.rect.left > self.x:
-                                self.x = platform.rect.left - self.size_x
-                            break
+                self.velocity_x = WALK_SPEED
+                # Stops just before the wall if one is in the way
+                normal, _ = self.sweep_move(step, 0, platforms)
+                if normal:
+                    self.velocity_x = 0
+                # Clamp to boundary
+                if self.x > max_x:
+                    self.x = max_x
+                    self.velocity_x = 0
                 
                 self.check_collision(platforms, 1, 0)
                 self.running = True
@@ -190,7 +308,7 @@ class Player():
                     self.runningAnim = True
                 else:
                     self.runningAnim = False
-                self.runningCount += 1
+                self.runningCount += dt
             else:
                 self.velocity_x = 0
         elif moving_left:
@@ -199,33 +317,15 @@ class Player():
             wall_thickness = PLATFORM_THICKNESS
             min_x = wall_thickness
             if self.x > min_x:
-                # Scaled movement speed for smaller characters
-                self.velocity_x = -movement_speed * dt
-                # Check collision before moving
-                test_x = self.x + self.velocity_x
-                test_rect = pygame.Rect(test_x, self.y, self.size_x, self.size_y)
-                can_move = True
-                for platform in platforms:
-                    if platform.active and (not platform.collision == 2 or self.cube != None):
-                        if test_rect.colliderect(platform.rect):
-                            can_move = False
-                            self.velocity_x = 0
-                            break
-                
-                if can_move:
-                    self.x += self.velocity_x
-                    # Clamp to boundary
-                    if self.x < min_x:
-                        self.x = min_x
-                        self.velocity_x = 0
-                else:
-                    # Adjust position to be just before the wall
-                    self.x = max(self.x, min_x)
-                    for platform in platforms:
-                        if platform.active and platform.rect.colliderect(test_rect):
-                            if platform.rect.right < self.x + self.size_x:
-                                self.x = platform.rect.right
-                            break
+                self.velocity_x = -WALK_SPEED
+                # Stops just before the wall if one is in the way
+                normal, _ = self.sweep_move(-step, 0, platforms)
+                if normal:
+                    self.velocity_x = 0
+                # Clamp to boundary
+                if self.x < min_x:
+                    self.x = min_x
+                    self.velocity_x = 0
                 
                 self.running = True
                 self.leftSide = True
@@ -234,14 +334,10 @@ class Player():
                 else:
                     self.runningAnim = False
                 self.check_collision(platforms, -1, 0)
-                self.runningCount += 1
+                self.runningCount += dt
             else:
                 self.velocity_x = 0
-        else:
-            # Decay horizontal velocity when not moving (friction)
-            self.velocity_x *= 0.9
-            if abs(self.velocity_x) < 0.01:
-                self.velocity_x = 0
+        # Without input the horizontal velocity decays (friction), in set_gravity with the rest of the momentum
         
         # Update gun direction when player turns (always follows player direction)
         if was_facing_left != self.leftSide:
@@ -262,24 +358,23 @@ class Player():
                     self._aim_direction = 225 if self.leftSide else 315
                 
         if jumping and self.canJump:
-            from Utils.GameScale import BASE_SCALE
             self.isJump = True
             self.isJumping = True
             self.canJump = False
             self.count = self.jump_count
-            # Scaled jump velocity for smaller characters
-            jump_velocity = 6 * BASE_SCALE * dt * 0.05
-            self.velocity = jump_velocity
+            self.support = None
+            # Fall speed once the jump arc is over
+            self.velocity = JUMP_FALL_SPEED
             self.check_collision(platforms, 0, 1)
             
-        if self.runningCount >= 5 and self.running and self.runningAnim:
+        if self.runningCount >= RUN_FRAME_TIME and self.running and self.runningAnim:
             if self.leftSide:
                 self.image = self.leftRunningImage
             else:
                 self.image = self.rightRunningImage
             self.runningCount = 0
             self.allowAnim = False
-        elif self.runningCount >= 5 and self.running and not self.runningAnim:
+        elif self.runningCount >= RUN_FRAME_TIME and self.running and not self.runningAnim:
             if self.leftSide:
                 self.image = self.leftStandingImage
             else:
@@ -297,94 +392,103 @@ class Player():
             self.runningAnim = False
             self.runningCount = 0
 
-    def jump(self, dt):
-        if self.count >= -self.jump_count:
-            if self.count >= 0 and self.isJump:
-                add_y = 1
-                self.actually_jump(add_y)
+    def arc_end(self):
+        """Count the jump arc stops at, where counting down a whole count a frame ended it"""
+        return self.jump_count - math.floor(2 * self.jump_count) - 1
+
+    def jump(self, dt, platforms=None):
+        """Follow the jump arc, count runs down from jump_count (rising) to arc_end() (falling)"""
+        self.fallShare = 1.0
+        self.freeShare = 1.0
+        if self.isJump or self.count < 0:
+            start = self.count
+            steps = JUMP_RATE * dt / 1000
+            self.actually_jump(dt, platforms)
+            # Phases change as soon as the arc passes them, not a frame later,
+            # and only the part of the frame after the change is spent in the new one
             if self.count < 0:
+                if steps > 0:
+                    self.fallShare = min(1.0, (min(start, 0) - self.count) / steps)
                 self.isJump = False
-                add_y = -1
-                self.actually_jump(add_y)
-        else:
-            self.isJumping = False
-            self.isJump = False
-            self.count = self.jump_count
+            if self.count <= self.arc_end():
+                self.freeShare = max(0.0, 1 - (start - self.count) / steps) if steps > 0 else 1.0
+                self.isJumping = False
+                self.isJump = False
+                self.count = self.jump_count
     
-    def actually_jump(self, add_y):
-        if self.y - self.count**2 * 0.1 * add_y > 0:
-            self.y -= self.count**2 * 0.1 * add_y
+    def actually_jump(self, dt, platforms=None):
+        # The arc rises 0.1 * c * |c| pixels per count used up, centred half a count on.
+        # Rising by its integral over the step gives the same arc at any frame rate
+        start = self.count
+        end = max(start - JUMP_RATE * dt / 1000, self.arc_end())
+        off_edge = False
+        if start < 0 and self.support is not None and platforms is not None and not self.on_platform(platforms):
+            # Walking off a ledge while the arc comes down, it only carries them down past the edge
+            share = self.off_edge_share(self.velocity_x * dt / 1000)
+            off_edge = share < 1
+            start = end + (start - end) * share
+        rise = 0.1 * (abs(start + 0.5) ** 3 - abs(end + 0.5) ** 3) / 3
+        if self.y - rise > 0:
+            if off_edge:
+                # Still over the edge until set_gravity drifts them past it
+                self.arcDrop = -rise
+            elif rise < 0 and platforms is not None:
+                # Coming down, land on whatever is below instead of sinking into it
+                normal, platform = self.sweep_move(0, -rise, platforms)
+                if normal and normal[1] < 0:
+                    self.land(platform)
+            else:
+                self.y -= rise
+            self.count = end
         else:
-            self.count = 0
-        self.count -= 1
+            # Reached the top of the level, fall from here
+            self.count = -0.5
 
     def set_gravity(self, platforms, dt):
+        seconds = dt / 1000
+        drifted = 0
+        if not self.isJump and (self.isJumping or self.freeShare < 1):
+            # Coming down the arc, for the part of the frame after its top
+            arc_seconds = seconds * self.fallShare
+            if self.on_platform(platforms):
+                self.velocity += GRAVITY * arc_seconds
+            else:
+                # Apply horizontal velocity when falling (momentum)
+                self.drift(platforms, arc_seconds)
+                drifted += arc_seconds
+                falling = self.falling_time(arc_seconds)
+                gained = GRAVITY * falling
+                self.velocity += gained
+                self.fall((self.velocity - gained / 2) * falling, platforms)
         if not self.isJump and not self.isJumping:
-            self.velocity += self.gravity
-            count = 0
-            on_platform = False
-            for platform in platforms:
-                if self.rect().colliderect(platform.rect) and platform.active and (not platform.collision == 2 or self.cube != None):
-                    on_platform = True
-                    # Reset horizontal velocity when landing
-                    if abs(self.velocity_x) > 0.1:
-                        self.velocity_x *= 0.5  # Friction on landing
-                    break
+            # Falling freely, for the part of the frame after the arc ended
+            seconds_free = seconds * self.freeShare
+            on_platform = self.on_platform(platforms)
+            if on_platform:
+                self.velocity += GRAVITY * seconds_free
+                # Reset horizontal velocity when landing
+                if abs(self.velocity_x) > MOVING_SPEED:
+                    self.velocity_x = decay(self.velocity_x, LANDING_FRICTION, seconds_free)  # Friction on landing
             
             if not on_platform:
                 # Apply horizontal velocity when in air (momentum)
-                if abs(self.velocity_x) > 0.01:
-                    from Utils.GameScale import PLATFORM_THICKNESS
-                    wall_thickness = PLATFORM_THICKNESS
-                    old_x = self.x
-                    self.x += self.velocity_x
-                    # Clamp to boundaries
-                    min_x = wall_thickness
-                    max_x = self.background_x - self.size_x - wall_thickness
-                    if self.x < min_x:
-                        self.x = min_x
-                        self.velocity_x = 0
-                    elif self.x > max_x:
-                        self.x = max_x
-                        self.velocity_x = 0
-                    # Slight air resistance
-                    self.velocity_x *= 0.98
+                self.drift(platforms, seconds_free)
+                drifted += seconds_free
                 
-                for platform in platforms:
-                    if not self.rect().colliderect(platform.rect) or not platform.active or (platform.collision == 2 and self.cube == None):
-                        if self.hitPlatform == True:
-                            self.y += self.velocity * 0.02 * dt
-                        else:
-                            if count <= 3:
-                                self.y += self.velocity * 0.05 * dt
-                                count+= 1
-                    else:
-                        break
-        elif not self.isJump and self.isJumping:
-            self.velocity += self.gravity
-            on_platform = False
-            for platform in platforms:
-                if self.rect().colliderect(platform.rect) and platform.active and (not platform.collision == 2 or self.cube != None):
-                    on_platform = True
-                    break
-            if not on_platform:
-                self.y += self.velocity * 0.05 * dt
-                # Apply horizontal velocity when falling (momentum)
-                if abs(self.velocity_x) > 0.01:
-                    from Utils.GameScale import PLATFORM_THICKNESS
-                    wall_thickness = PLATFORM_THICKNESS
-                    self.x += self.velocity_x
-                    # Clamp to boundaries
-                    min_x = wall_thickness
-                    max_x = self.background_x - self.size_x - wall_thickness
-                    if self.x < min_x:
-                        self.x = min_x
-                        self.velocity_x = 0
-                    elif self.x > max_x:
-                        self.x = max_x
-                        self.velocity_x = 0
-                    # Slight air resistance
-                    self.velocity_x *= 0.98
+                falling = self.falling_time(seconds_free)
+                gained = GRAVITY * falling
+                self.velocity += gained
+                # Falls use the average speed over the step, the exact distance under constant gravity
+                # Swept in one move so the fall speed can't carry the player through a platform
+                self.fall((self.velocity - gained / 2) * falling * FALL_SCALE, platforms)
+        if self.arcDrop:
+            self.fall(self.arcDrop, platforms)
+            self.arcDrop = 0
+        # Friction for the rest of the frame, when the player wasn't drifting
+        if seconds > drifted:
+            self.velocity_x = decay(self.velocity_x, self.friction(False), seconds - drifted)
+        if not self.running and abs(self.velocity_x) < STOP_SPEED:
+            self.velocity_x = 0
         # Clamp Y position to map boundaries
         from Utils.GameScale import PLATFORM_THICKNESS
         wall_thickness = PLATFORM_THICKNESS
@@ -400,7 +504,7 @@ class Player():
     def check_collision(self, platforms, x, y):
         """Improved collision detection that prevents going through walls"""
         rect = self.rect()
-        for platformObj in platforms:
+        for platformObj in platforms_near(platforms, rect):
             if not platformObj.active:
                 continue
             if platformObj.collision == 2 and self.cube == None:
@@ -426,23 +530,13 @@ class Player():
                 elif y < 0:
                     # Check if we're moving into the platform from below
                     if self.y + self.size_y > platform.top:
-                        self.y = platform.top - self.size_y
-                        self.velocity = 0
-                        self.isJump = False
-                        self.canJump = True
-                        self.hitPlatform = False
+                        self.land(platformObj)
                         break
                 # Vertical collision (moving down/falling)
                 elif y > 0:
                     # Check if we're moving into the platform from above
                     if self.y < platform.bottom:
-                        self.y = platform.bottom
-                        self.velocity = 0
-                        self.count = 0
-                        self.isJump = False
-                        self.isJumping = False
-                        self.canJump = True
-                        self.hitPlatform = True
+                        self.hit_ceiling(platformObj)
                         break
                 
                 # Additional check for landing on top of platform
@@ -538,151 +632,142 @@ class Player():
             self.cubeState = "0"
 
     def portalWarp(self, portals):
-        """Teleport through portals with momentum preservation"""
+        """Teleport through portals with momentum preservation
+        portals is the level's PortalRegistry, portals only link within the same team
+        """
         import math
         touchingPortal = False
-        for portal in portals:
-            if portal and self.rect().colliderect(portal.rect):
-                touchingPortal = True
-                if self.warpCooldown > 0:
-                    return
-                # Determine which team this portal belongs to
-                # Team 1: Player 0 (Blue) and Player 1 (Orange)
-                # Team 2: Player 2 (Red) and Player 3 (Yellow)
-                portal_team = 0 if portal.playerNum < 2 else 1
+        for portal in portals.touching(self.rect()):
+            touchingPortal = True
+            if self.warpCooldown > 0:
+                return
+            # The teammate portal this one exits through
+            other_portal = portals.linked(portal)
+            if other_portal:
+                # Store velocity before warping
+                entry_velocity_x = self.velocity_x
+                entry_velocity_y = self.velocity
                 
-                # Find another portal from the same team
-                other_portal = None
-                for p in portals:
-                    if p and p != portal:
-                        p_team = 0 if p.playerNum < 2 else 1
-                        if p_team == portal_team:  # Same team
-                            other_portal = p
-                            break
+                # Calculate entry angle (direction player is moving relative to portal)
+                entry_angle = portal.angle  # Portal's orientation
+                exit_angle = other_portal.angle  # Exit portal's orientation
                 
-                if other_portal:
-                    # Store velocity before warping
-                    entry_velocity_x = self.velocity_x
-                    entry_velocity_y = self.velocity
-                    
-                    # Calculate entry angle (direction player is moving relative to portal)
-                    entry_angle = portal.angle  # Portal's orientation
-                    exit_angle = other_portal.angle  # Exit portal's orientation
-                    
-                    # Transform velocity based on portal angles
-                    # Convert entry velocity to portal-relative coordinates
-                    # Then transform to exit portal coordinates
-                    angle_diff = (exit_angle - entry_angle) % 360
-                    
-                    # Calculate velocity magnitude
-                    velocity_magnitude = math.sqrt(entry_velocity_x**2 + entry_velocity_y**2)
-                    
-                    # Transform velocity direction based on portal angles
-                    if entry_angle == 0:  # Entering from left portal
-                        if exit_angle == 0:  # Exiting to left
-                            new_velocity_x = -velocity_magnitude if velocity_magnitude > 0.1 else entry_velocity_x
-                            new_velocity_y = 0
-                        elif exit_angle == 180:  # Exiting to right
-                            new_velocity_x = velocity_magnitude if velocity_magnitude > 0.1 else -entry_velocity_x
-                            new_velocity_y = 0
-                        elif exit_angle == 90:  # Exiting downward
-                            new_velocity_x = 0
-                            new_velocity_y = velocity_magnitude if velocity_magnitude > 0.1 else abs(entry_velocity_y)
-                        elif exit_angle == 270:  # Exiting upward
-                            new_velocity_x = 0
-                            new_velocity_y = -velocity_magnitude if velocity_magnitude > 0.1 else -abs(entry_velocity_y)
-                    elif entry_angle == 180:  # Entering from right portal
-                        if exit_angle == 0:  # Exiting to left
-                            new_velocity_x = -velocity_magnitude if velocity_magnitude > 0.1 else -entry_velocity_x
-                            new_velocity_y = 0
-                        elif exit_angle == 180:  # Exiting to right
-                            new_velocity_x = velocity_magnitude if velocity_magnitude > 0.1 else entry_velocity_x
-                            new_velocity_y = 0
-                        elif exit_angle == 90:  # Exiting downward
-                            new_velocity_x = 0
-                            new_velocity_y = velocity_magnitude if velocity_magnitude > 0.1 else abs(entry_velocity_y)
-                        elif exit_angle == 270:  # Exiting upward
-                            new_velocity_x = 0
-                            new_velocity_y = -velocity_magnitude if velocity_magnitude > 0.1 else -abs(entry_velocity_y)
-                    elif entry_angle == 90:  # Entering from bottom portal
-                        if exit_angle == 0:  # Exiting to left
-                            new_velocity_x = -velocity_magnitude if velocity_magnitude > 0.1 else -abs(entry_velocity_x)
-                            new_velocity_y = 0
-                        elif exit_angle == 180:  # Exiting to right
-                            new_velocity_x = velocity_magnitude if velocity_magnitude > 0.1 else abs(entry_velocity_x)
-                            new_velocity_y = 0
-                        elif exit_angle == 90:  # Exiting downward
-                            new_velocity_x = 0
-                            new_velocity_y = velocity_magnitude if velocity_magnitude > 0.1 else entry_velocity_y
-                        elif exit_angle == 270:  # Exiting upward
-                            new_velocity_x = 0
-                            new_velocity_y = -velocity_magnitude if velocity_magnitude > 0.1 else -entry_velocity_y
-                    elif entry_angle == 270:  # Entering from top portal
-                        if exit_angle == 0:  # Exiting to left
-                            new_velocity_x = -velocity_magnitude if velocity_magnitude > 0.1 else -abs(entry_velocity_x)
-                            new_velocity_y = 0
-                        elif exit_angle == 180:  # Exiting to right
-                            new_velocity_x = velocity_magnitude if velocity_magnitude > 0.1 else abs(entry_velocity_x)
-                            new_velocity_y = 0
-                        elif exit_angle == 90:  # Exiting downward
-                            new_velocity_x = 0
-                            new_velocity_y = velocity_magnitude if velocity_magnitude > 0.1 else abs(entry_velocity_y)
-                        elif exit_angle == 270:  # Exiting upward
-                            new_velocity_x = 0
-                            new_velocity_y = -velocity_magnitude if velocity_magnitude > 0.1 else -entry_velocity_y
-                    else:
-                        # Default: preserve velocity direction
-                        new_velocity_x = entry_velocity_x
-                        new_velocity_y = entry_velocity_y
-                    
-                    # Position player at exit portal - place further away to prevent immediate re-collision
-                    exit_offset = 20  # Distance to place player from portal edge
-                    if other_portal.angle == 0:  # left (portal on left wall, exit to right)
-                        self.x = other_portal.rect.right + exit_offset
-                        self.y = other_portal.rect.centery - (GlobalVariables.Player_size_Y / 2)
-                        # Push player away from portal
-                        self.velocity_x = max(abs(new_velocity_x), 1.0) if abs(new_velocity_x) > 0.1 else 1.0
-                    elif other_portal.angle == 180:  # right (portal on right wall, exit to left)
-                        self.x = other_portal.rect.left - self.size_x - exit_offset
-                        self.y = other_portal.rect.centery - (GlobalVariables.Player_size_Y / 2)
-                        # Push player away from portal
-                        self.velocity_x = -max(abs(new_velocity_x), 1.0) if abs(new_velocity_x) > 0.1 else -1.0
-                    elif other_portal.angle == 90:  # bottom (portal on floor, exit upward)
-                        self.x = other_portal.rect.centerx - (GlobalVariables.Player_size_X / 2)
-                        self.y = other_portal.rect.top - self.size_y - exit_offset
-                        # Push player upward
-                        self.velocity = -max(abs(new_velocity_y), 2.0) if abs(new_velocity_y) > 0.1 else -2.0
-                    elif other_portal.angle == 270:  # top (portal on ceiling, exit downward)
-                        self.x = other_portal.rect.centerx - (GlobalVariables.Player_size_X / 2)
-                        self.y = other_portal.rect.bottom + exit_offset
-                        # Push player downward
-                        self.velocity = max(abs(new_velocity_y), 2.0) if abs(new_velocity_y) > 0.1 else 2.0
-                    
-                    # Clamp player position to map boundaries
-                    from Utils.GameScale import PLATFORM_THICKNESS
-                    wall_thickness = PLATFORM_THICKNESS
-                    min_x = wall_thickness
-                    max_x = self.background_x - self.size_x - wall_thickness
-                    min_y = wall_thickness
-                    max_y = self.background_y - self.size_y - wall_thickness
-                    self.x = max(min_x, min(self.x, max_x))
-                    self.y = max(min_y, min(self.y, max_y))
-                    
-                    # Apply preserved momentum with boost
-                    if other_portal.angle in [0, 180]:  # Horizontal exit
-                        self.velocity_x = new_velocity_x * 1.5 if abs(new_velocity_x) > 0.1 else self.velocity_x
-                    else:  # Vertical exit
-                        self.velocity = new_velocity_y * 1.5 if abs(new_velocity_y) > 0.1 else self.velocity
-                    
-                    # If exiting upward, allow jump
-                    if other_portal.angle == 270:
-                        self.canJump = True
-                    else:
-                        self.canJump = False
-                    
-                    # Longer cooldown to prevent immediate re-teleportation
-                    self.warpCooldown = 120
-                    return
+                # Transform velocity based on portal angles
+                # Convert entry velocity to portal-relative coordinates
+                # Then transform to exit portal coordinates
+                angle_diff = (exit_angle - entry_angle) % 360
+                
+                # Calculate velocity magnitude
+                velocity_magnitude = math.sqrt(entry_velocity_x**2 + entry_velocity_y**2)
+                
+                # Transform velocity direction based on portal angles
+                if entry_angle == 0:  # Entering from left portal
+                    if exit_angle == 0:  # Exiting to left
+                        new_velocity_x = -velocity_magnitude if velocity_magnitude > MOVING_SPEED else entry_velocity_x
+                        new_velocity_y = 0
+                    elif exit_angle == 180:  # Exiting to right
+                        new_velocity_x = velocity_magnitude if velocity_magnitude > MOVING_SPEED else -entry_velocity_x
+                        new_velocity_y = 0
+                    elif exit_angle == 90:  # Exiting downward
+                        new_velocity_x = 0
+                        new_velocity_y = velocity_magnitude if velocity_magnitude > MOVING_SPEED else abs(entry_velocity_y)
+                    elif exit_angle == 270:  # Exiting upward
+                        new_velocity_x = 0
+                        new_velocity_y = -velocity_magnitude if velocity_magnitude > MOVING_SPEED else -abs(entry_velocity_y)
+                elif entry_angle == 180:  # Entering from right portal
+                    if exit_angle == 0:  # Exiting to left
+                        new_velocity_x = -velocity_magnitude if velocity_magnitude > MOVING_SPEED else -entry_velocity_x
+                        new_velocity_y = 0
+                    elif exit_angle == 180:  # Exiting to right
+                        new_velocity_x = velocity_magnitude if velocity_magnitude > MOVING_SPEED else entry_velocity_x
+                        new_velocity_y = 0
+                    elif exit_angle == 90:  # Exiting downward
+                        new_velocity_x = 0
+                        new_velocity_y = velocity_magnitude if velocity_magnitude > MOVING_SPEED else abs(entry_velocity_y)
+                    elif exit_angle == 270:  # Exiting upward
+                        new_velocity_x = 0
+                        new_velocity_y = -velocity_magnitude if velocity_magnitude > MOVING_SPEED else -abs(entry_velocity_y)
+                elif entry_angle == 90:  # Entering from bottom portal
+                    if exit_angle == 0:  # Exiting to left
+                        new_velocity_x = -velocity_magnitude if velocity_magnitude > MOVING_SPEED else -abs(entry_velocity_x)
+                        new_velocity_y = 0
+                    elif exit_angle == 180:  # Exiting to right
+                        new_velocity_x = velocity_magnitude if velocity_magnitude > MOVING_SPEED else abs(entry_velocity_x)
+                        new_velocity_y = 0
+                    elif exit_angle == 90:  # Exiting downward
+                        new_velocity_x = 0
+                        new_velocity_y = velocity_magnitude if velocity_magnitude > MOVING_SPEED else entry_velocity_y
+                    elif exit_angle == 270:  # Exiting upward
+                        new_velocity_x = 0
+                        new_velocity_y = -velocity_magnitude if velocity_magnitude > MOVING_SPEED else -entry_velocity_y
+                elif entry_angle == 270:  # Entering from top portal
+                    if exit_angle == 0:  # Exiting to left
+                        new_velocity_x = -velocity_magnitude if velocity_magnitude > MOVING_SPEED else -abs(entry_velocity_x)
+                        new_velocity_y = 0
+                    elif exit_angle == 180:  # Exiting to right
+                        new_velocity_x = velocity_magnitude if velocity_magnitude > MOVING_SPEED else abs(entry_velocity_x)
+                        new_velocity_y = 0
+                    elif exit_angle == 90:  # Exiting downward
+                        new_velocity_x = 0
+                        new_velocity_y = velocity_magnitude if velocity_magnitude > MOVING_SPEED else abs(entry_velocity_y)
+                    elif exit_angle == 270:  # Exiting upward
+                        new_velocity_x = 0
+                        new_velocity_y = -velocity_magnitude if velocity_magnitude > MOVING_SPEED else -entry_velocity_y
+                else:
+                    # Default: preserve velocity direction
+                    new_velocity_x = entry_velocity_x
+                    new_velocity_y = entry_velocity_y
+                
+                # Position player at exit portal - place further away to prevent immediate re-collision
+                exit_offset = 20  # Distance to place player from portal edge
+                if other_portal.angle == 0:  # left (portal on left wall, exit to right)
+                    self.x = other_portal.rect.right + exit_offset
+                    self.y = other_portal.rect.centery - (GlobalVariables.Player_size_Y / 2)
+                    # Push player away from portal
+                    self.velocity_x = max(abs(new_velocity_x), PORTAL_EXIT_SPEED_X) if abs(new_velocity_x) > MOVING_SPEED else PORTAL_EXIT_SPEED_X
+                elif other_portal.angle == 180:  # right (portal on right wall, exit to left)
+                    self.x = other_portal.rect.left - self.size_x - exit_offset
+                    self.y = other_portal.rect.centery - (GlobalVariables.Player_size_Y / 2)
+                    # Push player away from portal
+                    self.velocity_x = -max(abs(new_velocity_x), PORTAL_EXIT_SPEED_X) if abs(new_velocity_x) > MOVING_SPEED else -PORTAL_EXIT_SPEED_X
+                elif other_portal.angle == 90:  # bottom (portal on floor, exit upward)
+                    self.x = other_portal.rect.centerx - (GlobalVariables.Player_size_X / 2)
+                    self.y = other_portal.rect.top - self.size_y - exit_offset
+                    # Push player upward
+                    self.velocity = -max(abs(new_velocity_y), PORTAL_EXIT_SPEED_Y) if abs(new_velocity_y) > MOVING_SPEED else -PORTAL_EXIT_SPEED_Y
+                elif other_portal.angle == 270:  # top (portal on ceiling, exit downward)
+                    self.x = other_portal.rect.centerx - (GlobalVariables.Player_size_X / 2)
+                    self.y = other_portal.rect.bottom + exit_offset
+                    # Push player downward
+                    self.velocity = max(abs(new_velocity_y), PORTAL_EXIT_SPEED_Y) if abs(new_velocity_y) > MOVING_SPEED else PORTAL_EXIT_SPEED_Y
+                
+                # Clamp player position to map boundaries
+                from Utils.GameScale import PLATFORM_THICKNESS
+                wall_thickness = PLATFORM_THICKNESS
+                min_x = wall_thickness
+                max_x = self.background_x - self.size_x - wall_thickness
+                min_y = wall_thickness
+                max_y = self.background_y - self.size_y - wall_thickness
+                self.x = max(min_x, min(self.x, max_x))
+                self.y = max(min_y, min(self.y, max_y))
+                
+                # Apply preserved momentum with boost
+                if other_portal.angle in [0, 180]:  # Horizontal exit
+                    self.velocity_x = new_velocity_x * 1.5 if abs(new_velocity_x) > MOVING_SPEED else self.velocity_x
+                else:  # Vertical exit
+                    self.velocity = new_velocity_y * 1.5 if abs(new_velocity_y) > MOVING_SPEED else self.velocity
+                
+                # If exiting upward, allow jump
+                if other_portal.angle == 270:
+                    self.canJump = True
+                else:
+                    self.canJump = False
+                
+                # Left whatever they stood on through the portal, not off its edge
+                self.support = None
+                # Longer cooldown to prevent immediate re-teleportation
+                self.warpCooldown = WARP_COOLDOWN
+                return
         if not touchingPortal:
             self.warpCooldown = 0
 
@@ -0,0 +1,88 @@
+"""
+Registry of the portals currently in the level
+Portals are added and removed as the guns spawn and replace them, so nothing has to be
+rebuilt per frame. Each team's portals are kept in player order and linked in a ring
+(with two portals each one exits through the other), and a small grid over the level
+finds the portals a rect touches without checking every portal
+"""
+from Utils.Game_settings import TEAM_SIZE, PORTAL_GRID_CELL
+
+def portal_team(player_num):
+    """Team of a 0 based player number, Team 1: Players 0 and 1, Team 2: Players 2 and 3"""
+    return player_num // TEAM_SIZE
+
+class PortalRegistry:
+    def __init__(self, cell_size=PORTAL_GRID_CELL):
+        self.cell_size = cell_size
+        # Player number -> their portal, each gun holds one portal at a time
+        self.by_player = {}
+        # Team -> that team's portals in player order
+        self.teams = {}
+        # Team -> {portal: portal it exits through}
+        self.links = {}
+        self.cells = {}
+
+    def __len__(self):
+        return len(self.by_player)
+
+    def _cells(self, rect):
+        size = self.cell_size
+        for cx in range(rect.left // size, (rect.right - 1) // size + 1):
+            for cy in range(rect.top // size, (rect.bottom - 1) // size + 1):
+                yield (cx, cy)
+
+    def _relink(self, team):
+        portals = self.teams.get(team, [])
+        if len(portals) < 2:
+            self.links[team] = {}
+        else:
+            self.links[team] = {portal: portals[(i + 1) % len(portals)] for i, portal in enumerate(portals)}
+
+    def add(self, portal):
+        """Register a newly spawned portal, replacing the previous portal of the same player"""
+        old = self.by_player.get(portal.playerNum)
+        if old is not None:
+            self.remove(old)
+        self.by_player[portal.playerNum] = portal
+
+        team = portal_team(portal.playerNum)
+        portals = self.teams.setdefault(team, [])
+        portals.append(portal)
+        portals.sort(key=lambda p: p.playerNum)
+        self._relink(team)
+
+        for cell in self._cells(portal.rect):
+            self.cells.setdefault(cell, []).append(portal)
+
+    def remove(self, portal):
+        if self.by_player.get(portal.playerNum) is not portal:
+            return
+        del self.by_player[portal.playerNum]
+
+        team = portal_team(portal.playerNum)
+        self.teams[team].remove(portal)
+        self._relink(team)
+
+        for cell in self._cells(portal.rect):
+            self.cells[cell].remove(portal)
+            if not self.cells[cell]:
+                del self.cells[cell]
+
+    def clear(self):
+        self.by_player.clear()
+        self.teams.clear()
+        self.links.clear()
+        self.cells.clear()
+
+    def linked(self, portal):
+        """The portal this one exits through, None until a teammate has placed one"""
+        return self.links.get(portal_team(portal.playerNum), {}).get(portal)
+
+    def touching(self, rect):
+        """Portals overlapping rect, in player order"""
+        found = set()
+        for cell in self._cells(rect):
+            for portal in self.cells.get(cell, ()):
+                if rect.colliderect(portal.rect):
+                    found.add(portal)
+        return sorted(found, key=lambda p: p.playerNum)
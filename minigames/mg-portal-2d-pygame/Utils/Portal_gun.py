@@ -2,6 +2,7 @@ import pygame
 import math
 import os
 import sys
+import numpy as np
 from Utils.Game_settings import *
 from Utils.GameScale import (
     PORTAL_GUN_WIDTH, PORTAL_GUN_HEIGHT,
@@ -9,6 +10,9 @@ from Utils.GameScale import (
     BULLET_WIDTH, BULLET_HEIGHT,
     scale_surface
 )
+from Utils.SpriteCache import cached_sprite
+from Utils.Platform import platforms_near
+from Utils.Collision import sweep, contact
 
 # Get the directory of this file and find assets
 base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -25,62 +29,42 @@ def colorize_sprite(surface, target_color):
     colored.blit(overlay, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
     return colored
 
-def replace_color_in_sprite(surface, source_color, target_color, threshold=50):
-    """Replace blue color in portal sprite with target color (red/yellow), preserving shape and details"""
-    result = surface.copy()
-    sr, sg, sb = source_color
-    tr, tg, tb = target_color
-    
-    for x in range(result.get_width()):
-        for y in range(result.get_height()):
-            pixel = result.get_at((x, y))
-            if pixel[3] == 0:  # Skip transparent pixels
-                continue
-            r, g, b, a = pixel
-            
-            # Only replace pixels that are clearly blue (not borders, outlines, or other colors)
-            # Check: blue must be the dominant color component
-            blue_dominant = (b > max(r, g) + 30)  # Blue is significantly higher
-            
-            # Check if it's in the blue color range
-            color_dist = ((r - sr)**2 + (g - sg)**2 + (b - sb)**2)**0.5
-            
-            # Only replace if it's clearly a blue pixel
-            if blue_dominant and color_dist < threshold:
-                # Simple, clean replacement: map blue intensity to target color intensity
-                # Use the blue channel as a brightness guide
-                blue_intensity = b / 255.0
-                
-                # Scale target color by blue intensity to preserve shading
-                new_r = int(tr * blue_intensity)
-                new_g = int(tg * blue_intensity)
-                new_b = int(tb * blue_intensity)
-                
-                # Ensure we don't go below a minimum brightness to avoid too-dark colors
-                min_brightness = 50
-                current_brightness = (new_r + new_g + new_b) / 3.0
-                if current_brightness < min_brightness and blue_intensity > 0.3:
-                    # Boost brightness for visible areas
-                    brightness_boost = min_brightness / current_brightness if current_brightness > 0 else 1.0
-                    new_r = min(255, int(new_r * brightness_boost))
-                    new_g = min(255, int(new_g * brightness_boost))
-                    new_b = min(255, int(new_b * brightness_boost))
-                
-                result.set_at((x, y), (new_r, new_g, new_b, a))
-    
-    return result
+def grayscale_tint(surface, color):
+    """Convert a sprite to grayscale then tint it with color
+    This avoids brown artifacts from blending the tint with the original colours
+    """
+    rgb = pygame.surfarray.array3d(surface).astype(np.float64)
+    alpha = pygame.surfarray.array_alpha(surface)
+    gray_val = (0.299 * rgb[..., 0] + 0.587 * rgb[..., 1] + 0.114 * rgb[..., 2]).astype(np.int32)
+    # Use grayscale value as intensity
+    intensity = gray_val / 255.0
+    # Transparent pixels stay fully clear
+    visible = alpha != 0
+
+    tinted = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
+    tinted_rgb = pygame.surfarray.pixels3d(tinted)
+    for i, c in enumerate(color):
+        tinted_rgb[..., i] = np.where(visible, (c * intensity).astype(np.int32), 0)
+    del tinted_rgb
+    pygame.surfarray.pixels_alpha(tinted)[...] = alpha
+    return tinted
 
 # Load base sprites
 try:
-    base_gun_blue = pygame.image.load(os.path.join(assets_dir, "8bitPortalGun_Sprite_Blue.png")).convert_alpha()
+    gun_blue_path = os.path.join(assets_dir, "8bitPortalGun_Sprite_Blue.png")
+    base_gun_blue = pygame.image.load(gun_blue_path).convert_alpha()
     base_gun_orange = pygame.image.load(os.path.join(assets_dir, "8bitPortalGun_Sprite_Orange.png")).convert_alpha()
 except:
     # Fallback: create simple colored rectangles if assets don't exist
+    gun_blue_path = None
     base_gun_blue = pygame.Surface((64, 42), pygame.SRCALPHA)
     base_gun_blue.fill((100, 150, 255))
     base_gun_orange = pygame.Surface((64, 42), pygame.SRCALPHA)
     base_gun_orange.fill((255, 150, 100))
 
+# The recoloured sprites are keyed on this file too, so changing grayscale_tint rebuilds them
+tint_source = os.path.abspath(__file__)
+
 # Team colors: Blue, Orange, Red, Yellow
 team_colors = [
     (100, 150, 255),  # Blue (Player 1 - Team 1)
@@ -95,47 +79,22 @@ for i, color in enumerate(team_colors):
     if i < 2:
         # Use blue/orange base for team 1
         base = base_gun_blue if i == 0 else base_gun_orange
-        colored = base
+        scaled = scale_surface(base, (PORTAL_GUN_WIDTH, PORTAL_GUN_HEIGHT))
     else:
         # For red/yellow (team 2), use grayscale conversion then tint
         # This avoids brown artifacts from color blending
-        base = base_gun_blue.copy()
-        # Convert to grayscale first
-        gray = pygame.Surface(base.get_size(), pygame.SRCALPHA)
-        for x in range(base.get_width()):
-            for y in range(base.get_height()):
-                pixel = base.get_at((x, y))
-                if pixel[3] == 0:
-                    continue
-                # Convert to grayscale
-                gray_val = int(0.299 * pixel[0] + 0.587 * pixel[1] + 0.114 * pixel[2])
-                gray.set_at((x, y), (gray_val, gray_val, gray_val, pixel[3]))
-        
-        # Now tint the grayscale with target color
-        tr, tg, tb = color
-        for x in range(gray.get_width()):
-            for y in range(gray.get_height()):
-                pixel = gray.get_at((x, y))
-                if pixel[3] == 0:
-                    continue
-                # Use grayscale value as intensity
-                intensity = pixel[0] / 255.0
-                # Apply target color with intensity
-                new_r = int(tr * intensity)
-                new_g = int(tg * intensity)
-                new_b = int(tb * intensity)
-                gray.set_at((x, y), (new_r, new_g, new_b, pixel[3]))
-        
-        colored = gray
-    # Scale to proper size
-    scaled = scale_surface(colored, (PORTAL_GUN_WIDTH, PORTAL_GUN_HEIGHT))
+        size = (PORTAL_GUN_WIDTH, PORTAL_GUN_HEIGHT)
+        scaled = cached_sprite(f'portal_gun_{i}', [gun_blue_path, tint_source],
+                               lambda: scale_surface(grayscale_tint(base_gun_blue, color), size), (color, size))
     pGunSprites.append(scaled)
 
 # Portal sprites - same color scheme
 try:
-    base_portal_blue = pygame.image.load(os.path.join(assets_dir, "8bitPortal_Sprite_Blue.png")).convert_alpha()
+    portal_blue_path = os.path.join(assets_dir, "8bitPortal_Sprite_Blue.png")
+    base_portal_blue = pygame.image.load(portal_blue_path).convert_alpha()
     base_portal_orange = pygame.image.load(os.path.join(assets_dir, "8bitPortal_Sprite_Orange.png")).convert_alpha()
 except:
+    portal_blue_path = None
     base_portal_blue = pygame.Surface((58, 114), pygame.SRCALPHA)
     pygame.draw.circle(base_portal_blue, (100, 150, 255), (29, 57), 25)
     base_portal_orange = pygame.Surface((58, 114), pygame.SRCALPHA)
@@ -146,40 +105,13 @@ for i, color in enumerate(team_colors):
     if i < 2:
         # Use blue/orange base sprites for team 1
         base = base_portal_blue if i == 0 else base_portal_orange
-        colored = base
+        scaled = scale_surface(base, (PORTAL_WIDTH, PORTAL_HEIGHT))
     else:
         # For red/yellow (team 2), use the blue portal sprite and do a clean color replacement
         # Use a simple approach: convert blue to grayscale, then tint with target color
-        base = base_portal_blue.copy()
-        # Create a grayscale version first
-        gray = pygame.Surface(base.get_size(), pygame.SRCALPHA)
-        for x in range(base.get_width()):
-            for y in range(base.get_height()):
-                pixel = base.get_at((x, y))
-                if pixel[3] == 0:
-                    continue
-                # Convert to grayscale
-                gray_val = int(0.299 * pixel[0] + 0.587 * pixel[1] + 0.114 * pixel[2])
-                gray.set_at((x, y), (gray_val, gray_val, gray_val, pixel[3]))
-        
-        # Now tint the grayscale with target color
-        tr, tg, tb = color
-        for x in range(gray.get_width()):
-            for y in range(gray.get_height()):
-                pixel = gray.get_at((x, y))
-                if pixel[3] == 0:
-                    continue
-                # Use grayscale value as intensity
-                intensity = pixel[0] / 255.0
-                # Apply target color with intensity
-                new_r = int(tr * intensity)
-                new_g = int(tg * intensity)
-                new_b = int(tb * intensity)
-                gray.set_at((x, y), (new_r, new_g, new_b, pixel[3]))
-        
-        colored = gray
-    # Scale to proper size
-    scaled = scale_surface(colored, (PORTAL_WIDTH, PORTAL_HEIGHT))
+        size = (PORTAL_WIDTH, PORTAL_HEIGHT)
+        scaled = cached_sprite(f'portal_{i}', [portal_blue_path, tint_source],
+                               lambda: scale_surface(grayscale_tint(base_portal_blue, color), size), (color, size))
     portalSprites.append(scaled)
 
 # Bullet sprites
@@ -210,6 +142,20 @@ for i, color in enumerate(team_colors):
     scaled = scale_surface(colored, (BULLET_WIDTH, BULLET_HEIGHT))
     bulletSprites.append(scaled)
 
+# Rotated sprites keyed by source surface (one per player colour) and angle
+_rotation_cache = {}
+
+def rotated_sprite(surface, angle):
+    """Rotate surface counter-clockwise by angle, rounded to ROTATION_STEP degrees
+    Each rotation is only resampled the first time it is needed
+    """
+    angle = round(angle / ROTATION_STEP) * ROTATION_STEP % 360
+    key = (surface, angle)
+    image = _rotation_cache.get(key)
+    if image is None:
+        image = _rotation_cache[key] = pygame.transform.rotate(surface, angle)
+    return image
+
 #portal gun  
 class Pgun( pygame.sprite.GroupSingle ):
     def __init__( self, player_num ):
@@ -227,6 +173,8 @@ class Pgun( pygame.sprite.GroupSingle ):
         self.gun_barrel_offset = pygame.math.Vector2( 0, 0 ) #sets how far away the portal gun is away from the player
         self.portalPos = (0,0)
         self.portalRot = 0
+        # PortalRegistry of the level, told whenever this gun places or loses its portal
+        self.registry = None
       
 #locks aims the pgun based on keyboard direction (adapted for minigame system)
     def pgun_rotation( self, aim_direction=None ):
@@ -237,7 +185,7 @@ class Pgun( pygame.sprite.GroupSingle ):
         
         # Rotate the gun image (pygame rotates counter-clockwise, so negate)
         # Also adjust for sprite orientation (0 degrees = pointing right)
-        self.image = pygame.transform.rotate( self.base_pgun_image, -self.angle )
+        self.image = rotated_sprite( self.base_pgun_image, -self.angle )
         self.rect = self.image.get_rect( center = self.hitbox_rect.center )
 
 #sets a delay when you shoot
@@ -254,6 +202,9 @@ class Pgun( pygame.sprite.GroupSingle ):
                 self.rect.centerx + barrel_offset_x,
                 self.rect.centery + barrel_offset_y
             )
+            # Firing again takes this player's current portal out of the level
+            if self.registry is not None and isinstance(self.sprite, Portal):
+                self.registry.remove(self.sprite)
             self.sprite = Bullet( spawn_bullet_pos[0], spawn_bullet_pos[1], self.angle, self.playerNum )
          
 #moves hitbox
@@ -330,6 +281,8 @@ class Pgun( pygame.sprite.GroupSingle ):
                 # Remove from all_portals list
                 if portal in all_existing_portals:
                     all_existing_portals.remove(portal)
+                if self.registry is not None:
+                    self.registry.remove(portal)
                 # Kill the portal sprite
                 try:
                     portal.kill()
@@ -340,6 +293,8 @@ class Pgun( pygame.sprite.GroupSingle ):
         self.portalRot = angle
         # Create portal with player-specific color (0-3 for Player 1-4)
         self.sprite = Portal(pos[0], pos[1], angle, self.playerNum)
+        if self.registry is not None:
+            self.registry.add(self.sprite)
 
     def draw(self, screen):
         super().draw(screen)
@@ -356,7 +311,7 @@ class Bullet( pygame.sprite.Sprite ):
     def __init__( self, x, y, angle , playerNum):
         super().__init__()
         # bulletSprites are already scaled, just rotate
-        self.image = pygame.transform.rotate(bulletSprites[playerNum], -angle)
+        self.image = rotated_sprite(bulletSprites[playerNum], -angle)
         self.rect = self.image.get_rect()
         self.x = x
         self.y = y
@@ -372,28 +327,39 @@ class Bullet( pygame.sprite.Sprite ):
         self.bullet_offset = pygame.math.Vector2( 0, 0 )
 
     def bullet_movement( self, platforms ) -> bool:  
-        self.x += self.x_vel
-        self.y += self.y_vel
+        # Sweep the whole step, the bullet moves further per frame than platforms are thick
+        box = ( self.rect.x, self.rect.y, self.rect.width, self.rect.height )
+        dx = int( self.x + self.x_vel ) - self.rect.x
+        dy = int( self.y + self.y_vel ) - self.rect.y
+        time, normal, hit = sweep( box, dx, dy, platforms )
 
-        self.rect.x = int( self.x )
-        self.rect.y = int( self.y )
+        if hit:
+            # Stop flush against the surface so the portal lands where the bullet hit
+            self.rect.topleft = contact( box, dx, dy, time, normal, hit.rect )
+            self.x, self.y = self.rect.topleft
+        else:
+            self.x += self.x_vel
+            self.y += self.y_vel
+            self.rect.x = int( self.x )
+            self.rect.y = int( self.y )
 
         if pygame.time.get_ticks() - self.spawn_time > self.bullet_lifetime: #despawn bullet if it goes to far
             self.kill() 
         
-        # Check collision with platforms
-        for platform in platforms:
-            if not platform.active:
-                continue
-            if self.rect.colliderect( platform.rect ):
-                if platform.isPortable:
-                    # Portal can be created on this surface
-                    return platform
-                else:
-                    # Non-portable surface - bullet is destroyed
-                    self.kill()
-                    return None
-            
+        # Bullets fired from inside a platform are already overlapping it, so the sweep skips it
+        if hit is None:
+            for platform in platforms_near( platforms, self.rect ):
+                if platform.active and self.rect.colliderect( platform.rect ):
+                    hit = platform
+                    break
+
+        if hit:
+            if hit.isPortable:
+                # Portal can be created on this surface
+                return hit
+            else:
+                # Non-portable surface - bullet is destroyed
+                self.kill()
         return None
 
     def update( self, platform ) -> bool:
@@ -407,7 +373,7 @@ class Portal( pygame.sprite.Sprite ):
     def __init__( self, x, y, angle, playerNum ):
         super().__init__()
         # portalSprites are already scaled, just rotate
-        self.image = pygame.transform.rotate(portalSprites[playerNum], angle)
+        self.image = rotated_sprite(portalSprites[playerNum], angle)
         self.playerNum = playerNum
         self.rect = self.image.get_rect()
         self.rect.center = ( x, y )
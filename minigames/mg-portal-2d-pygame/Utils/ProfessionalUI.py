@@ -12,11 +12,14 @@ class ProfessionalUI:
         self.font = font
         self.small_font = pygame.font.SysFont("Consolas", UI_FONT_SMALL)
         self.title_font = pygame.font.SysFont("Consolas", UI_FONT_TITLE, bold=True)
+        # Static part of the HUD, rebuilt only when the screen width changes
+        self.hud_chrome = None
+        # Last rendered text per HUD slot, as (text, color, surface)
+        self.hud_text = {}
+        self.check_text = self.small_font.render("✓", True, (100, 255, 100))
     
-    def draw_hud(self, players, elapsed, game_duration, finished_players, team_scores=None):
-        """Draw professional HUD with team information"""
-        width = self.screen.get_width()
-        
+    def build_hud_chrome(self, width):
+        """Draw the parts of the HUD that never change: the bar, team labels and player names"""
         # Top bar with gradient background
         hud_surface = pygame.Surface((width, 80))
         hud_surface.fill((20, 20, 30))
@@ -24,20 +27,6 @@ class ProfessionalUI:
         for i in range(80):
             alpha = int(255 * (1 - i / 80))
             pygame.draw.line(hud_surface, (30, 30, 40), (0, i), (width, i))
-        self.screen.blit(hud_surface, (0, 0))
-        
-        # Timer
-        time_left = max(0, game_duration - elapsed)
-        timer_color = (255, 255, 255) if time_left > 30 else (255, 100, 100)
-        timer_text = self.font.render(f"Time: {int(time_left)}s", True, timer_color)
-        self.screen.blit(timer_text, (20, 15))
-        
-        # Team scores
-        if team_scores:
-            team1_score = team_scores.get(0, 0)
-            team2_score = team_scores.get(1, 0)
-            score_text = self.font.render(f"Team 1: {team1_score} | Team 2: {team2_score}", True, (255, 255, 255))
-            self.screen.blit(score_text, (20, 50))
         
         # Player status indicators (grouped by team)
         player_colors = [
@@ -47,48 +36,73 @@ class ProfessionalUI:
             (255, 255, 100),  # Yellow (Team 2)
         ]
         
-        team_names = ["Team 1", "Team 2"]
-        
         x_offset = width - 350
         # Team 1 players
         team1_y = 15
         team_text = self.small_font.render("Team 1:", True, (150, 200, 255))
-        self.screen.blit(team_text, (x_offset, team1_y))
+        hud_surface.blit(team_text, (x_offset, team1_y))
         for i in [0, 1]:  # Players 1 and 2
             color = player_colors[i]
             y_pos = team1_y + 20 + (i * 15)
             
             # Player indicator dot
-            pygame.draw.circle(self.screen, color, (x_offset, y_pos + 6), 4)
+            pygame.draw.circle(hud_surface, color, (x_offset, y_pos + 6), 4)
             
             # Player name
             name_text = self.small_font.render(f"P{i+1}", True, (255, 255, 255))
-            self.screen.blit(name_text, (x_offset + 15, y_pos))
-            
-            # Finished indicator
-            if i in finished_players:
-                check_text = self.small_font.render("✓", True, (100, 255, 100))
-                self.screen.blit(check_text, (x_offset + 50, y_pos))
+            hud_surface.blit(name_text, (x_offset + 15, y_pos))
         
         # Team 2 players
         team2_y = 15
         team_text = self.small_font.render("Team 2:", True, (255, 150, 150))
-        self.screen.blit(team_text, (x_offset + 100, team2_y))
+        hud_surface.blit(team_text, (x_offset + 100, team2_y))
         for i in [2, 3]:  # Players 3 and 4
             color = player_colors[i]
             y_pos = team2_y + 20 + ((i - 2) * 15)
             
             # Player indicator dot
-            pygame.draw.circle(self.screen, color, (x_offset + 100, y_pos + 6), 4)
+            pygame.draw.circle(hud_surface, color, (x_offset + 100, y_pos + 6), 4)
             
             # Player name
             name_text = self.small_font.render(f"P{i+1}", True, (255, 255, 255))
-            self.screen.blit(name_text, (x_offset + 115, y_pos))
-            
-            # Finished indicator
-            if i in finished_players:
-                check_text = self.small_font.render("✓", True, (100, 255, 100))
-                self.screen.blit(check_text, (x_offset + 150, y_pos))
+            hud_surface.blit(name_text, (x_offset + 115, y_pos))
+        
+        self.hud_chrome = hud_surface
+    
+    def render_hud_text(self, slot, text, color):
+        """Render text for a HUD slot, reusing the last surface until the text or color changes"""
+        cached = self.hud_text.get(slot)
+        if cached is None or cached[0] != text or cached[1] != color:
+            cached = self.hud_text[slot] = (text, color, self.font.render(text, True, color))
+        return cached[2]
+    
+    def draw_hud(self, players, elapsed, game_duration, finished_players, team_scores=None):
+        """Draw professional HUD with team information"""
+        width = self.screen.get_width()
+        if self.hud_chrome is None or self.hud_chrome.get_width() != width:
+            self.build_hud_chrome(width)
+        self.screen.blit(self.hud_chrome, (0, 0))
+        
+        # Timer, only re-rendered when the whole seconds change
+        time_left = max(0, game_duration - elapsed)
+        timer_color = (255, 255, 255) if time_left > 30 else (255, 100, 100)
+        timer_text = self.render_hud_text('timer', f"Time: {int(time_left)}s", timer_color)
+        self.screen.blit(timer_text, (20, 15))
+        
+        # Team scores
+        if team_scores:
+            team1_score = team_scores.get(0, 0)
+            team2_score = team_scores.get(1, 0)
+            score_text = self.render_hud_text('score', f"Team 1: {team1_score} | Team 2: {team2_score}", (255, 255, 255))
+            self.screen.blit(score_text, (20, 50))
+        
+        # Finished indicators
+        x_offset = width - 350
+        for i in finished_players:
+            if i < 2:
+                self.screen.blit(self.check_text, (x_offset + 50, 15 + 20 + (i * 15)))
+            else:
+                self.screen.blit(self.check_text, (x_offset + 150, 15 + 20 + ((i - 2) * 15)))
     
     def draw_instructions(self, show=True):
         """Draw control instructions"""
@@ -0,0 +1,281 @@
+"""
+Ghost runs
+While a level is played the Recorder samples every player GHOST_RATE times a second into
+fixed size ring buffers backed by arrays: position and a flags byte for facing, pose and
+whether they have a portal out, 5 bytes a player a sample. Portals placed are events in a
+smaller ring of their own. The fastest finished runs of each level are kept in
+Replays/<level>.ghost, and Ghosts draws any number of them next to the live players, a
+lookup by sample index and one blit per ghost, all in a single blits call
+"""
+import os
+import struct
+import sys
+import zlib
+from array import array
+from Utils.CharacterSprites import get_player_sprites
+from Utils.Portal_gun import Portal, portalSprites, rotated_sprite
+from Utils.Game_settings import GHOST_RATE, GHOST_SECONDS, GHOST_EVENTS, GHOST_COUNT, GHOST_ALPHA
+
+base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+replays_dir = os.path.join(base_dir, 'Replays')
+
+MAGIC = b'PGST'
+VERSION = 1
+HEADER = struct.Struct('<4sHHB')  # magic, version, sample rate, tracks, then the level name
+NAME = struct.Struct('<B')  # length of the utf-8 level name that follows
+TRACK = struct.Struct('<BfIIII')  # player number, finish time, first sample, samples, first event, events
+
+# Sample flags
+LEFT = 1
+RUNNING = 2
+PORTAL = 4
+
+def clamp_short(value):
+    return max(-32768, min(32767, int(round(value))))
+
+def ordered(values, first, count):
+    """The count ring entries from entry number first on, oldest first"""
+    if count == 0:
+        return values[:0]
+    start = first % len(values)
+    return (values[start:] + values[:start])[:count]
+
+def little_endian(values):
+    """Arrays are in machine order, files are little endian"""
+    if sys.byteorder == 'big':
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values
+
+class Track:
+    """One player's run"""
+    def __init__(self, player_num, capacity=GHOST_RATE * GHOST_SECONDS, event_capacity=GHOST_EVENTS):
+        self.player_num = player_num  # 1-4
+        self.x = array('h', bytes(2 * capacity))
+        self.y = array('h', bytes(2 * capacity))
+        self.flags = array('B', bytes(capacity))
+        # Samples ever written, only the last capacity of them are still in the ring
+        self.count = 0
+        self.event_sample = array('I', bytes(4 * event_capacity))
+        self.event_x = array('h', bytes(2 * event_capacity))
+        self.event_y = array('h', bytes(2 * event_capacity))
+        self.event_angle = array('h', bytes(2 * event_capacity))
+        self.events = 0
+        self.finish_time = None
+
+    def first(self):
+        return max(0, self.count - len(self.flags))
+
+    def first_event(self):
+        return max(0, self.events - len(self.event_sample))
+
+    def append(self, x, y, flags):
+        i = self.count % len(self.flags)
+        self.x[i] = clamp_short(x)
+        self.y[i] = clamp_short(y)
+        self.flags[i] = flags
+        self.count += 1
+
+    def add_portal(self, x, y, angle):
+        """A portal placed at the next sample"""
+        i = self.events % len(self.event_sample)
+        self.event_sample[i] = self.count
+        self.event_x[i] = clamp_short(x)
+        self.event_y[i] = clamp_short(y)
+        self.event_angle[i] = clamp_short(angle)
+        self.events += 1
+
+    def sample(self, index):
+        """(x, y, flags) of a sample, None if it isn't in the recording"""
+        if index < self.first() or index >= self.count:
+            return None
+        i = index % len(self.flags)
+        return self.x[i], self.y[i], self.flags[i]
+
+    def event(self, number):
+        """(sample, x, y, angle) of a portal event"""
+        i = number % len(self.event_sample)
+        return self.event_sample[i], self.event_x[i], self.event_y[i], self.event_angle[i]
+
+class Recorder:
+    """Records every player of a level as it is played"""
+    def __init__(self, level, players, rate=GHOST_RATE):
+        self.level = level
+        self.rate = rate
+        self.players = players
+        self.tracks = [Track(player.player_num) for player in players]
+        # The portal each player had out when last sampled
+        self.portals = [None] * len(players)
+
+    def record(self, elapsed):
+        """Sample every player still running up to elapsed seconds into the level"""
+        target = int(elapsed * self.rate) + 1
+        for i, (track, player) in enumerate(zip(self.tracks, self.players)):
+            if track.finish_time is not None or track.count >= target:
+                continue
+            portal = player.pGun.sprite if isinstance(player.pGun.sprite, Portal) else None
+            if portal is not None and portal is not self.portals[i]:
+                track.add_portal(portal.x, portal.y, portal.angle)
+            self.portals[i] = portal
+            flags = (LEFT if player.leftSide else 0) | (PORTAL if portal is not None else 0)
+            if player.image is player.rightRunningImage or player.image is player.leftRunningImage:
+                flags |= RUNNING
+            # A slow frame fills the samples it skipped with where the player is now
+            while track.count < target:
+                track.append(player.x, player.y, flags)
+
+    def finish(self, index, elapsed):
+        """Player index finished the level, their run stops here"""
+        self.tracks[index].finish_time = elapsed
+
+    def finished_tracks(self):
+        return [track for track in self.tracks if track.finish_time is not None]
+
+def ghost_path(level):
+    return os.path.join(replays_dir, level + '.ghost')
+
+def encode(level, rate, tracks):
+    name = level.encode('utf-8')[:255]
+    data = [HEADER.pack(MAGIC, VERSION, rate, len(tracks)), NAME.pack(len(name)), name]
+    payload = []
+    for track in tracks:
+        first, kept = track.first(), track.count - track.first()
+        first_event, events = track.first_event(), track.events - track.first_event()
+        finish = -1.0 if track.finish_time is None else track.finish_time
+        data.append(TRACK.pack(track.player_num, finish, first, kept, first_event, events))
+        for values in (track.x, track.y, track.flags):
+            payload.append(little_endian(ordered(values, first, kept)).tobytes())
+        for values in (track.event_sample, track.event_x, track.event_y, track.event_angle):
+            payload.append(little_endian(ordered(values, first_event, events)).tobytes())
+    # Positions change little from sample to sample, they compress well
+    data.append(zlib.compress(b''.join(payload), 9))
+    return b''.join(data)
+
+def read_ring(values, payload, offset, first, count):
+    """Fill a ring of count entries from the file, oldest first, so entry first lands where it belongs"""
+    size = values.itemsize * count
+    entries = array(values.typecode)
+    entries.frombytes(payload[offset:offset + size])
+    entries = little_endian(entries)
+    if count:
+        start = first % count
+        values[start:] = entries[:count - start]
+        values[:start] = entries[count - start:]
+    return offset + size
+
+def decode(buffer):
+    """(level, rate, tracks) from a ghost file"""
+    magic, version, rate, count = HEADER.unpack_from(buffer, 0)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("not a ghost file")
+    offset = HEADER.size
+    length, = NAME.unpack_from(buffer, offset)
+    offset += NAME.size
+    level = buffer[offset:offset + length].decode('utf-8')
+    offset += length
+    headers = [TRACK.unpack_from(buffer, offset + i * TRACK.size) for i in range(count)]
+    payload = zlib.decompress(buffer[offset + count * TRACK.size:])
+
+    tracks = []
+    position = 0
+    for player_num, finish, first, kept, first_event, events in headers:
+        track = Track(player_num, max(kept, 1), max(events, 1))
+        for values in (track.x, track.y, track.flags):
+            position = read_ring(values, payload, position, first, kept)
+        for values in (track.event_sample, track.event_x, track.event_y, track.event_angle):
+            position = read_ring(values, payload, position, first_event, events)
+        track.count = first + kept
+        track.events = first_event + events
+        track.finish_time = None if finish < 0 else finish
+        tracks.append(track)
+    return level, rate, tracks
+
+def load_ghosts(level):
+    """Saved runs of a level as (rate, tracks), no tracks if there are none"""
+    try:
+        with open(ghost_path(level), 'rb') as f:
+            _, rate, tracks = decode(f.read())
+        return rate, tracks
+    except FileNotFoundError:
+        return GHOST_RATE, []
+    except (OSError, ValueError, struct.error, zlib.error, UnicodeDecodeError) as e:
+        print(f"Warning: Could not load ghosts for {level}: {e}")
+        return GHOST_RATE, []
+
+def save_ghosts(level, rate, tracks):
+    path = ghost_path(level)
+    try:
+        os.makedirs(replays_dir, exist_ok=True)
+        # Write to a temp file first so a half written ghost is never read back
+        with open(path + '.tmp', 'wb') as f:
+            f.write(encode(level, rate, tracks))
+        os.replace(path + '.tmp', path)
+    except OSError as e:
+        print(f"Warning: Could not save ghosts for {level}: {e}")
+
+def save_best_runs(recorder, keep=GHOST_COUNT):
+    """Add the recorder's finished runs to the level's saved ghosts, keeping the fastest"""
+    runs = recorder.finished_tracks()
+    if not runs:
+        return
+    rate, saved = load_ghosts(recorder.level)
+    if saved and rate != recorder.rate:
+        saved = []
+    best = sorted(saved + runs, key=lambda track: track.finish_time)[:keep]
+    if any(track in best for track in runs):
+        save_ghosts(recorder.level, recorder.rate, best)
+
+class Ghosts:
+    """Draws saved runs, each as its player's sprite faded out"""
+    def __init__(self, tracks, rate=GHOST_RATE, alpha=GHOST_ALPHA):
+        self.tracks = tracks
+        self.rate = rate
+        self.alpha = alpha
+        self.sprites = get_player_sprites()
+        # Faded sprites, made the first time a ghost needs them
+        self.images = {}
+        # Next portal event of each ghost, playback only moves forward
+        self.next_event = [track.first_event() for track in tracks]
+        self.last_index = -1
+
+    def __len__(self):
+        return len(self.tracks)
+
+    def faded(self, key, surface):
+        image = self.images.get(key)
+        if image is None:
+            image = self.images[key] = surface.copy()
+            image.set_alpha(self.alpha)
+        return image
+
+    def body(self, player_num, flags):
+        side = 'left' if flags & LEFT else 'right'
+        pose = 'running' if flags & RUNNING else 'standing'
+        return self.faded((player_num, flags & (LEFT | RUNNING)),
+                          self.sprites[f'player{player_num}_{side}_{pose}'])
+
+    def portal(self, player_num, angle):
+        return self.faded(('portal', player_num, angle), rotated_sprite(portalSprites[player_num - 1], angle))
+
+    def draw(self, screen, elapsed):
+        index = int(elapsed * self.rate)
+        if index < self.last_index:
+            # Level restarted, play the ghosts from the beginning
+            self.next_event = [track.first_event() for track in self.tracks]
+        self.last_index = index
+
+        items = []
+        for i, track in enumerate(self.tracks):
+            sample = track.sample(index)
+            if sample is None:
+                continue
+            x, y, flags = sample
+            while self.next_event[i] < track.events and track.event(self.next_event[i])[0] <= index:
+                self.next_event[i] += 1
+            if flags & PORTAL and self.next_event[i] > track.first_event():
+                _, portal_x, portal_y, angle = track.event(self.next_event[i] - 1)
+                image = self.portal(track.player_num, angle)
+                items.append((image, image.get_rect(center=(portal_x, portal_y))))
+            items.append((self.body(track.player_num, flags), (x, y)))
+        if items:
+            screen.blits(items, doreturn=False)
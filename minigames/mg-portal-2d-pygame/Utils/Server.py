@@ -1,58 +1,138 @@
-import socket
-from _thread import *
+"""
+Game server, run with: python -m Utils.Server [host] [port]
+One asyncio UDP socket serves every player. Ids are handed out as players join, up to
+MAX_PLAYERS. Clients send their own state whenever they like and the server sends each of
+them a snapshot of the other players NET_TICK_RATE times a second, see NetProtocol.py
+"""
+import asyncio
+import struct
 import sys
+from Utils.Game_settings import NET_PORT, NET_TICK_RATE, MAX_PLAYERS
+from Utils.NetProtocol import (TYPE, JOIN, STATE, LEAVE, PLAYER_ID, make_state, read_string,
+                               encode_welcome, decode_state, encode_snapshot)
 
-s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+# Snapshots kept for clients to acknowledge, older acks get a full snapshot
+HISTORY = 64
+# Seconds without a packet before a player is dropped
+TIMEOUT = 5.0
 
-server = 'localhost'
-port = 5555
+class Client:
+    def __init__(self, player_id, addr, name, now):
+        self.id = player_id
+        self.addr = addr
+        self.state = make_state(name=name)
+        self.sequence = 0
+        # Newest snapshot tick the client has received
+        self.ack = 0
+        self.last_seen = now
 
-server_ip = socket.gethostbyname(server)
+class GameServer(asyncio.DatagramProtocol):
+    def __init__(self, tick_rate=NET_TICK_RATE, max_players=MAX_PLAYERS):
+        self.tick_rate = tick_rate
+        self.max_players = max_players
+        self.transport = None
+        self.clients = {}  # address -> Client
+        self.tick = 0
+        # Tick -> {player id: state} sent that tick, snapshot deltas are made against these
+        self.snapshots = {}
 
-try:
-    s.bind((server, port))
+    def connection_made(self, transport):
+        self.transport = transport
 
-except socket.error as e:
-    print(str(e))
+    def datagram_received(self, data, addr):
+        now = asyncio.get_running_loop().time()
+        try:
+            kind, = TYPE.unpack_from(data, 0)
+            if kind == JOIN:
+                self.join(addr, read_string(data, TYPE.size)[0], now)
+            elif kind == STATE:
+                client = self.clients.get(addr)
+                player_id, sequence, ack, state = decode_state(data)
+                # Packets can arrive out of order, only newer states count
+                if client and client.id == player_id and sequence > client.sequence:
+                    client.sequence = sequence
+                    client.state = state
+                    client.ack = max(client.ack, ack)
+                    client.last_seen = now
+            elif kind == LEAVE:
+                client = self.clients.get(addr)
+                if client and client.id == PLAYER_ID.unpack_from(data, TYPE.size)[0]:
+                    self.drop(client)
+        except (struct.error, UnicodeDecodeError) as e:
+            print(f"Warning: Bad packet from {addr}: {e}")
 
-s.listen(2)
-print("Waiting for a connection")
+    def join(self, addr, name, now):
+        client = self.clients.get(addr)
+        if client is None:
+            used = {client.id for client in self.clients.values()}
+            free = [player_id for player_id in range(self.max_players) if player_id not in used]
+            if not free:
+                print(f"Server full, turned away {addr}")
+                return
+            client = Client(free[0], addr, name, now)
+            self.clients[addr] = client
+            print(f"Player {client.id} ({name}) joined from {addr}")
+        # Sent again if the client asks again, the first welcome may have been lost
+        self.transport.sendto(encode_welcome(client.id, self.tick_rate), addr)
 
-currentId = "0"
-pos = ["0:50,270:False:User:-500,5000:-1:0:None,None:0:-1", "1:100,270:False:User:-500,5000:-1:0:None,None:0:-1"]
-def threaded_client(conn):
-    global currentId, pos
-    conn.send(str.encode(currentId))
-    currentId = "1"
-    reply = ''
-    while True:
-        try:
-            data = conn.recv(2048)
-            reply = data.decode('utf-8')
-            if not data:
-                conn.send(str.encode("Goodbye"))
-                break
-            else:
-                #print("Recieved: " + reply)
-                arr = reply.split(":")
-                id = int(arr[0])
-                pos[id] = reply
+    def drop(self, client):
+        del self.clients[client.addr]
+        print(f"Player {client.id} left")
 
-                if id == 0: nid = 1
-                if id == 1: nid = 0
+    def send_snapshots(self):
+        now = asyncio.get_running_loop().time()
+        for client in [client for client in self.clients.values() if now - client.last_seen > TIMEOUT]:
+            self.drop(client)
 
-                reply = pos[nid][:]
-                #print("Sending: " + reply)
+        self.tick += 1
+        world = {client.id: client.state for client in self.clients.values()}
+        self.snapshots[self.tick] = world
+        self.snapshots.pop(self.tick - HISTORY, None)
+
+        for client in self.clients.values():
+            # Everyone but the client itself, it already knows where it is
+            players = {player_id: state for player_id, state in world.items() if player_id != client.id}
+            base = self.snapshots.get(client.ack)
+            if base is None:
+                packet = encode_snapshot(self.tick, players)
+            else:
+                base = {player_id: state for player_id, state in base.items() if player_id != client.id}
+                packet = encode_snapshot(self.tick, players, client.ack, base)
+            self.transport.sendto(packet, client.addr)
 
-            conn.sendall(str.encode(reply))
-        except:
-            break
+    async def run(self):
+        """Send snapshots on a fixed tick, late ticks don't shift the ones after them"""
+        loop = asyncio.get_running_loop()
+        interval = 1 / self.tick_rate
+        next_tick = loop.time()
+        while True:
+            self.send_snapshots()
+            next_tick += interval
+            delay = next_tick - loop.time()
+            if delay < 0:
+                # Fell more than a tick behind, skip ahead instead of bursting
+                next_tick = loop.time()
+                delay = 0
+            await asyncio.sleep(delay)
 
-    print("Connection Closed")
-    conn.close()
+async def serve(host='localhost', port=NET_PORT, tick_rate=NET_TICK_RATE):
+    """Start a server on the running loop, returns (server, task running its ticks)"""
+    loop = asyncio.get_running_loop()
+    _, server = await loop.create_datagram_endpoint(lambda: GameServer(tick_rate), local_addr=(host, port))
+    return server, asyncio.ensure_future(server.run())
 
-while True:
-    conn, addr = s.accept()
-    print("Connected to: ", addr)
+async def main(host, port):
+    server, ticks = await serve(host, port)
+    print(f"Server running on {host}:{port}")
+    try:
+        await ticks
+    finally:
+        server.transport.close()
 
-    start_new_thread(threaded_client, (conn,))
\ No newline at end of file
+if __name__ == '__main__':
+    host = sys.argv[1] if len(sys.argv) > 1 else 'localhost'
+    port = int(sys.argv[2]) if len(sys.argv) > 2 else NET_PORT
+    try:
+        asyncio.run(main(host, port))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,122 @@
+"""
+Sprite atlases
+A group of sprites (the player characters, the avatars, the level props) is packed into one
+sheet with an index of where each frame sits. The sheet and index are cached together in
+Assets/cache/<name>.atlas, keyed like SpriteCache, so later runs load a single image instead
+of drawing or loading every sprite. Frames are subsurfaces of the sheet, and any number of
+them can be drawn with one screen.blits() call
+"""
+import os
+import struct
+import pygame
+from Utils.SpriteCache import cache_dir, source_key
+
+MAGIC = b'PATL'
+VERSION = 1
+HEADER = struct.Struct('<4sH20sHHH')  # magic, version, key, width, height, frames
+FRAME = struct.Struct('<HHHHB')  # x, y, width, height, name length, then the name
+
+# Widest a sheet is packed to, wider sprites get a sheet as wide as they are
+MAX_WIDTH = 1024
+# Gap between frames so scaled or rotated frames don't pick up their neighbours
+PADDING = 1
+
+class SpriteAtlas:
+    def __init__(self, sheet, rects):
+        self.sheet = sheet
+        self.rects = rects  # name -> Rect on the sheet
+        self.frames = {name: sheet.subsurface(rect) for name, rect in rects.items()}
+
+    def __getitem__(self, name):
+        return self.frames[name]
+
+    def __contains__(self, name):
+        return name in self.frames
+
+    def get(self, name, default=None):
+        return self.frames.get(name, default)
+
+    def blits(self, screen, items):
+        """Draw (frame name, position) pairs in a single blits call"""
+        screen.blits([(self.sheet, position, self.rects[name]) for name, position in items], doreturn=False)
+
+def pack(sizes, max_width=MAX_WIDTH):
+    """Place sizes ({name: (width, height)}) on shelves, tallest first
+    Returns (sheet width, sheet height, {name: Rect})
+    """
+    width = max([max_width] + [w + PADDING for w, _ in sizes.values()])
+    rects = {}
+    x = y = shelf = 0
+    for name, (w, h) in sorted(sizes.items(), key=lambda item: (-item[1][1], item[0])):
+        if x + w > width:
+            x = 0
+            y += shelf
+            shelf = 0
+        rects[name] = pygame.Rect(x, y, w, h)
+        x += w + PADDING
+        shelf = max(shelf, h + PADDING)
+    return width, max(1, y + shelf), rects
+
+def build_atlas(sprites):
+    """Pack a dict of surfaces into a SpriteAtlas"""
+    width, height, rects = pack({name: surface.get_size() for name, surface in sprites.items()})
+    sheet = pygame.Surface((width, height), pygame.SRCALPHA)
+    sheet.blits([(sprites[name], rect) for name, rect in rects.items()], doreturn=False)
+    return SpriteAtlas(sheet, rects)
+
+def load_atlas(name, key):
+    path = os.path.join(cache_dir, name + '.atlas')
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+        magic, version, stored_key, width, height, count = HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != VERSION or stored_key != key:
+            return None
+        offset = HEADER.size
+        rects = {}
+        for _ in range(count):
+            x, y, w, h, length = FRAME.unpack_from(data, offset)
+            offset += FRAME.size
+            rects[data[offset:offset + length].decode('utf-8')] = pygame.Rect(x, y, w, h)
+            offset += length
+    except (OSError, struct.error, UnicodeDecodeError):
+        return None
+    if len(data) != offset + width * height * 4:
+        return None
+    sheet = pygame.image.frombytes(data[offset:], (width, height), 'RGBA').convert_alpha()
+    return SpriteAtlas(sheet, rects)
+
+def save_atlas(name, key, atlas):
+    path = os.path.join(cache_dir, name + '.atlas')
+    width, height = atlas.sheet.get_size()
+    data = [HEADER.pack(MAGIC, VERSION, key, width, height, len(atlas.rects))]
+    for frame, rect in atlas.rects.items():
+        encoded = frame.encode('utf-8')
+        data.append(FRAME.pack(rect.x, rect.y, rect.width, rect.height, len(encoded)) + encoded)
+    data.append(pygame.image.tobytes(atlas.sheet, 'RGBA'))
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        # Write to a temp file first so a half written atlas is never read back
+        with open(path + '.tmp', 'wb') as f:
+            f.write(b''.join(data))
+        os.replace(path + '.tmp', path)
+    except OSError as e:
+        print(f"Warning: Could not cache atlas {name}: {e}")
+
+def cached_atlas(name, sources, build, extra=None):
+    """Return the cached atlas called name, or pack the sprites build() returns and cache that
+    Args:
+        name: File name of the atlas in the cache
+        sources: Files the sprites are loaded or drawn from
+        build: Function returning a dict of frame name -> surface
+        extra: Anything else the sprites depend on (colours, sizes)
+    """
+    try:
+        key = source_key(sources, extra)
+    except OSError:
+        return build_atlas(build())
+    atlas = load_atlas(name, key)
+    if atlas is None:
+        atlas = build_atlas(build())
+        save_atlas(name, key, atlas)
+    return atlas
@@ -0,0 +1,70 @@
+"""
+Disk cache for sprites generated at startup (team recolours etc.)
+Each sprite is stored as raw RGBA in Assets/cache/<name>.sprite with a key made from
+the files it was generated from, so editing a source image rebuilds it
+"""
+import hashlib
+import os
+import struct
+import pygame
+
+base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+cache_dir = os.path.join(base_dir, 'Assets', 'cache')
+
+MAGIC = b'PSPR'
+VERSION = 1
+HEADER = struct.Struct('<4sH20sHH')  # magic, version, key, width, height
+
+def source_key(sources, extra=None):
+    """Hash of the source files (path, size, modified time) and anything else the sprite depends on"""
+    digest = hashlib.sha1(repr(extra).encode('utf-8'))
+    for path in sources:
+        stat = os.stat(path)
+        digest.update(f'{os.path.basename(path)}:{stat.st_size}:{stat.st_mtime_ns}'.encode('utf-8'))
+    return digest.digest()
+
+def load_sprite(name, key):
+    path = os.path.join(cache_dir, name + '.sprite')
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+        magic, version, stored_key, width, height = HEADER.unpack_from(data, 0)
+    except (OSError, struct.error):
+        return None
+    if magic != MAGIC or version != VERSION or stored_key != key or len(data) != HEADER.size + width * height * 4:
+        return None
+    return pygame.image.frombytes(data[HEADER.size:], (width, height), 'RGBA').convert_alpha()
+
+def save_sprite(name, key, surface):
+    path = os.path.join(cache_dir, name + '.sprite')
+    width, height = surface.get_size()
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        # Write to a temp file first so a half written sprite is never read back
+        with open(path + '.tmp', 'wb') as f:
+            f.write(HEADER.pack(MAGIC, VERSION, key, width, height))
+            f.write(pygame.image.tobytes(surface, 'RGBA'))
+        os.replace(path + '.tmp', path)
+    except OSError as e:
+        print(f"Warning: Could not cache sprite {name}: {e}")
+
+def cached_sprite(name, sources, build, extra=None):
+    """Return the cached sprite called name, or call build() to make it and cache the result
+    Args:
+        name: File name of the sprite in the cache
+        sources: Files the sprite is generated from
+        build: Function returning the sprite surface
+        extra: Anything else the result depends on (colours, sizes)
+    """
+    if not all(sources):
+        # Built from a fallback surface, nothing on disk to key the cache on
+        return build()
+    try:
+        key = source_key(sources, extra)
+    except OSError:
+        return build()
+    surface = load_sprite(name, key)
+    if surface is None:
+        surface = build()
+        save_sprite(name, key, surface)
+    return surface
@@ -3,7 +3,7 @@ Two-Portal Level Design System
 Levels designed specifically around using exactly 2 portals strategically
 """
 import pygame
-from Utils.Platform import Platform
+from Utils.Platform import Platform, PlatformGrid
 from Utils.ButtonObject import ButtonObject
 from Utils.ExitDoor import ExitDoor
 from Utils.GameScale import PLATFORM_THICKNESS
@@ -49,7 +49,7 @@ class TwoPortalLevels:
         platforms.append(Platform(950, height - 300, wall_thickness, 180, True, 0))  # Right wall portal spot
         
         return {
-            'platforms': platforms,
+            'platforms': PlatformGrid(platforms),
             'button': None,
             'door': door,
             'start_positions': [
@@ -104,7 +104,7 @@ class TwoPortalLevels:
         button = ButtonObject(670, height - 220, 0)
         
         return {
-            'platforms': platforms,
+            'platforms': PlatformGrid(platforms),
             'button': button,
             'door': door,
             'start_positions': [
@@ -157,7 +157,7 @@ class TwoPortalLevels:
         door = ExitDoor(1050, height - 170)
         
         return {
-            'platforms': platforms,
+            'platforms': PlatformGrid(platforms),
             'button': None,
             'door': door,
             'start_positions': [
@@ -233,7 +233,7 @@ class TwoPortalLevels:
         platforms.append(Platform(width - 550, height - 520, wall_thickness, 200, True, 0))
         
         return {
-            'platforms': platforms,
+            'platforms': PlatformGrid(platforms),
             'button': button,
             'door': door,
             'start_positions': [
@@ -310,7 +310,7 @@ class TwoPortalLevels:
         platforms.append(Platform(300, height - 350, 100, platform_height, True, 0))  # Small platform
         
         return {
-            'platforms': platforms,
+            'platforms': PlatformGrid(platforms),
             'button': button,
             'door': door,
             'start_positions': [
@@ -21,16 +21,17 @@ except ImportError:
 
 # Import game components
 from Utils import GlobalVariables
-from Utils.Player_Adapted import Player
-from Utils.Platform import Platform
+from Utils.Player_Adapted import Player, physics_steps
+from Utils.Platform import Platform, bake_level_background
 from Utils.ExitDoor import ExitDoor
 from Utils.ButtonObject import ButtonObject
-from Utils.Portal_gun import Portal
-from Utils.ProfessionalLevel import LevelDesign
+from Utils.PortalRegistry import PortalRegistry
+from Utils.LevelLoader import load_level
 from Utils.TwoPortalLevels import TwoPortalLevels
 from Utils.ProfessionalUI import ProfessionalUI
 from Utils.GameScreens import GameScreens
 from Utils.LevelAssets import get_background_texture, tile_texture
+from Utils.Game_settings import GHOSTS_ENABLED
 
 # Standard 4-player control mapping
 CONTROLS = {
@@ -104,6 +105,36 @@ def get_player_input(player_num, keys):
     
     return input_state
 
+def create_cube_storm(level_data, platforms, seed):
+    """Batch simulated cubes for cube storm levels, None for every other level"""
+    if not level_data.get('cube_storm'):
+        return None
+    try:
+        from Utils.BatchPhysics import CubeBatch
+        count, area = level_data['cube_storm']
+        return CubeBatch(count, pygame.Rect(area), platforms, seed=seed)
+    except Exception as e:
+        print(f"Could not create cube storm: {e}")
+        return None
+
+def create_recorder(level, players):
+    try:
+        from Utils.Replay import Recorder
+        return Recorder(level, players)
+    except Exception as e:
+        print(f"Could not record run: {e}")
+        return None
+
+def load_level_ghosts(level):
+    """Ghosts of the level's saved runs, None if there are none"""
+    try:
+        from Utils.Replay import Ghosts, load_ghosts
+        rate, tracks = load_ghosts(level)
+        return Ghosts(tracks, rate) if tracks else None
+    except Exception as e:
+        print(f"Could not load ghosts: {e}")
+        return None
+
 def main():
     parser = argparse.ArgumentParser()
     parser.add_argument("--players", type=int, default=4)
@@ -118,19 +149,20 @@ def main():
     clock = pygame.time.Clock()
     font = GlobalVariables.font(36)
     
-    # Level definitions - will be loaded after level selection
-    level_functions = [
-        ('The Gap', LevelDesign.create_level_1),
-        ('Button and Door', LevelDesign.create_level_2),
-        ('Multi-Level', LevelDesign.create_level_3),
-        ('The Maze', LevelDesign.create_level_4),
-        ('The Challenge', LevelDesign.create_level_5),
+    # Level files in Levels/data, only the selected one is loaded
+    level_files = [
+        ('The Gap', 'the_gap'),
+        ('Button and Door', 'button_and_door'),
+        ('Multi-Level', 'multi_level'),
+        ('The Maze', 'the_maze'),
+        ('The Challenge', 'the_challenge'),
+        ('Cube Storm', 'cube_storm'),
     ]
-    level_names = [level[0] for level in level_functions]
+    level_names = [level[0] for level in level_files]
     
     # Initialize with default level (will be changed by level select)
     selected_level_index = 0
-    level_data = level_functions[selected_level_index][1]()
+    level_data = load_level(level_files[selected_level_index][1])
     platforms = level_data['platforms']
     button = level_data['button']
     door = level_data['door']
@@ -142,6 +174,11 @@ def main():
     for i in range(4):
         players.append(Player(start_positions[i][0], start_positions[i][1], player_num=i+1))
     
+    # Portals placed in the level, the guns add and remove theirs as they fire
+    portals = PortalRegistry()
+    for player in players:
+        player.pGun.registry = portals
+    
     # Create portal cube
     cube = None
     try:
@@ -154,6 +191,7 @@ def main():
     except Exception as e:
         print(f"Could not create cube: {e}")
         cube = None
+    storm = create_cube_storm(level_data, platforms, args.seed)
     
     # Initialize professional UI and screens
     ui = ProfessionalUI(screen, font)
@@ -166,6 +204,13 @@ def main():
     if background_texture:
         # Create tiled background surface
         background_surface = tile_texture(background_texture, GlobalVariables.Width, GlobalVariables.Height)
+
+    # Static platforms are drawn into the background once per level
+    level_background, dynamic_platforms = bake_level_background(GlobalVariables.Width, GlobalVariables.Height, platforms, background_surface, background_color)
+    
+    # Recording of the level being played and the best earlier runs drawn as ghosts
+    recorder = None
+    ghosts = None
     
     # Game states: 'instructions', 'ready', 'level_select', 'playing', 'finished'
     game_state = 'instructions'
@@ -223,17 +268,18 @@ def main():
                 elif game_state == 'level_select':
                     # Level selection controls
                     if event.key == pygame.K_UP:
-                        selected_level_index = (selected_level_index - 1) % len(level_functions)
+                        selected_level_index = (selected_level_index - 1) % len(level_files)
                     elif event.key == pygame.K_DOWN:
-                        selected_level_index = (selected_level_index + 1) % len(level_functions)
+                        selected_level_index = (selected_level_index + 1) % len(level_files)
                     elif event.key == pygame.K_SPACE:
                         # Confirm level selection and load level
-                        level_data = level_functions[selected_level_index][1]()
+                        level_data = load_level(level_files[selected_level_index][1])
                         platforms = level_data['platforms']
                         button = level_data['button']
                         door = level_data['door']
                         background_color = level_data['background_color']
                         start_positions = level_data['start_positions']
+                        level_background, dynamic_platforms = bake_level_background(GlobalVariables.Width, GlobalVariables.Height, platforms, background_surface, background_color)
                         
                         # Reposition players for new level and reset state
                         for i, player in enumerate(players):
@@ -254,6 +300,7 @@ def main():
                                 except:
                                     pass
                                 player.pGun.sprite = None
+                        portals.clear()
                         
                         # Recreate cube for new level
                         try:
@@ -267,6 +314,7 @@ def main():
                             cube.y = cube_y
                         except Exception as e:
                             cube = None
+                        storm = create_cube_storm(level_data, platforms, args.seed)
                         
                         # Reset game state
                         finished_players = set()
@@ -275,6 +323,10 @@ def main():
                         finish_times = [None, None, None, None]
                         game_finished = False
                         
+                        # Record this run, and replay the fastest earlier ones
+                        recorder = create_recorder(level_data['name'], players)
+                        ghosts = load_level_ghosts(level_data['name']) if GHOSTS_ENABLED else None
+                        
                         # Start the game
                         game_state = 'playing'
                         start_time = time.time()
@@ -326,57 +378,43 @@ def main():
                 button.checkActive(cube_list, players)  # Check if players or cube are on button
             
             # Update all players
-            all_portals = []
-            # First pass: collect all existing portals
-            for player in players:
-                if player.pGun.sprite and isinstance(player.pGun.sprite, Portal):
-                    all_portals.append(player.pGun.sprite)
-            
-            # Update all players with portal/player references
             for player in players:
                 input_state = get_player_input(player.player_num, keys)
                 
-                # Move player (this updates leftSide based on movement)
-                player.move(input_state, platforms, dt)
-                player.jump(dt)
-                
-                # Handle portal shooting and cube interaction (updates aim direction)
-                player.keyboardInput(input_state, cube, platforms)
-                
-                # Update cube position if player is holding it
-                if player.cube and player.controllingCube:
-                    player_rect = player.rect()
-                    player.cube.rect.centerx = player_rect.centerx
-                    player.cube.rect.centery = player_rect.top - 20
-                    player.cube.x = player.cube.rect.x
-                    player.cube.y = player.cube.rect.y
-                
-                # Store references for portal replacement logic
-                player._all_portals = all_portals
-                player._all_players = players
-                
-                # Update player (this updates gun rotation based on aim direction)
-                player.update(platforms, dt)
-                
-                # Re-collect portals after update (new portals may have been created)
-                if player.pGun.sprite and isinstance(player.pGun.sprite, Portal):
-                    if player.pGun.sprite not in all_portals:
-                        all_portals.append(player.pGun.sprite)
+                # Slow frames are split into several steps so a big dt can't skip a landing
+                for i, step in enumerate(physics_steps(dt)):
+                    # Move player (this updates leftSide based on movement)
+                    player.move(input_state, platforms, step)
+                    player.jump(step, platforms)
+                    
+                    # Handle portal shooting and cube interaction (updates aim direction)
+                    if i == 0:
+                        player.keyboardInput(input_state, cube, platforms)
+                    
+                    # Update cube position if player is holding it
+                    if player.cube and player.controllingCube:
+                        player_rect = player.rect()
+                        player.cube.rect.centerx = player_rect.centerx
+                        player.cube.rect.centery = player_rect.top - 20
+                        player.cube.x = player.cube.rect.x
+                        player.cube.y = player.cube.rect.y
+                    
+                    # Update player (this updates gun rotation based on aim direction)
+                    player.update(platforms, step)
+            
+            if recorder:
+                recorder.record(elapsed)
             
             # Handle portal teleportation
-            # Portal-style: Any portal links to any other portal (need at least 2)
-            if len(all_portals) >= 2:
-                # Teleport players through portals (any portal to any other)
+            # Each portal links to the other portal of its team (need at least 2)
+            if len(portals) >= 2:
+                # Teleport players through portals
                 for player in players:
-                    portals_list = [p for p in all_portals if p]
-                    if len(portals_list) >= 2:
-                        player.portalWarp(portals_list)
+                    player.portalWarp(portals)
                 
                 # Teleport cube through portals
                 if cube:
-                    portals_list = [p for p in all_portals if p]
-                    if len(portals_list) >= 2:
-                        cube.portalWarp(portals_list)
+                    cube.portalWarp(portals)
             
             # Check if players reached the goal
             if door.opened:
@@ -385,6 +423,8 @@ def main():
                         if door.try_exit(player, keys):
                             finish_times[i] = elapsed
                             finished_players.add(i)
+                            if recorder:
+                                recorder.finish(i, elapsed)
                             
                             # Determine which team this player belongs to
                             team_num = 0 if i < 2 else 1
@@ -399,14 +439,9 @@ def main():
                                 game_finished = True
                                 team_scores[team_num] += 100  # Bonus for team win
             
-            # Draw game background
-            if background_surface:
-                screen.blit(background_surface, (0, 0))
-            else:
-                screen.fill(background_color)
-            
-            # Draw platforms (with professional styling)
-            for platform in platforms:
+            # Draw game background, static platforms are already baked into it
+            screen.blit(level_background, (0, 0))
+            for platform in dynamic_platforms:
                 platform.draw(screen)
             
             # Draw portal cube
@@ -443,6 +478,11 @@ def main():
                 # Draw cube
                 screen.blit(cube.image, cube.rect)
             
+            # Cube storm, all of its cubes move and draw as one batch
+            if storm:
+                storm.update(dt, GlobalVariables.Width, GlobalVariables.Height, [player.rect() for player in players])
+                storm.draw(screen)
+            
             # Draw button
             if button is not None:
                 button.draw(screen)
@@ -455,9 +495,14 @@ def main():
                 if player.pGun.sprite:
                     player.pGun.draw(screen)
             
-            # Draw players
+            # Ghosts of the best earlier runs, behind the live players
+            if ghosts:
+                ghosts.draw(screen, elapsed)
+            
+            # Draw players, their sprites are frames of one atlas and go out in a single call
+            screen.blits([(player.image, (player.x, player.y)) for player in players], doreturn=False)
             for player in players:
-                player.draw(screen)
+                player.draw(screen, body=False)
             
             # Draw professional UI with team scores
             ui.draw_hud(players, elapsed, game_duration, finished_players, team_scores)
@@ -482,6 +527,13 @@ def main():
                 running = False
 
     pygame.quit()
+    
+    if recorder:
+        try:
+            from Utils.Replay import save_best_runs
+            save_best_runs(recorder)
+        except Exception as e:
+            print(f"Could not save ghosts: {e}")
 
     # Calculate final scores based on teams
     final_scores = [0, 0, 0, 0]